@@ -0,0 +1,50 @@
+import sys
+from time import perf_counter
+
+sys.path.insert(0, '.')
+
+import lpp.vector as vector
+from lpp.interpreter import Interpreter
+from lpp.stack_evaluator import evaluate_iterative
+
+
+VECTOR_ELEMENTS = 1_000_000
+SCALAR_ELEMENTS = 20_000
+
+VECTOR_SOURCE = f'let a = arange({VECTOR_ELEMENTS}); sum(a * 2 + 1);'
+
+SCALAR_SOURCE = f'''
+    let go = def(i, acc) {{
+      if (i == {SCALAR_ELEMENTS}) {{
+        acc
+      }} else {{
+        go(i + 1, acc + i * 2 + 1)
+      }}
+    }};
+    go(0, 0);
+'''
+
+
+def main() -> None:
+  print(f'backend: {"numpy" if vector.HAS_NUMPY else "array(d)"}')
+
+  start = perf_counter()
+  result = Interpreter().run(VECTOR_SOURCE)
+  vectorized = perf_counter() - start
+  assert result is not None
+  print(f'vectorized: {VECTOR_ELEMENTS} elements in {vectorized * 1000:.1f} ms '
+        f'({vectorized / VECTOR_ELEMENTS * 1e9:.0f} ns/element) = {result.inspect()}')
+
+  start = perf_counter()
+  result = evaluate_iterative(Interpreter.parse(SCALAR_SOURCE))
+  scalar = perf_counter() - start
+  assert result is not None
+  print(f'scalar:     {SCALAR_ELEMENTS} elements in {scalar * 1000:.1f} ms '
+        f'({scalar / SCALAR_ELEMENTS * 1e9:.0f} ns/element) = {result.inspect()}')
+
+  print(f'per-element speedup: '
+        f'{(scalar / SCALAR_ELEMENTS) / (vectorized / VECTOR_ELEMENTS):.0f}x')
+
+
+if __name__ == '__main__':
+  main()
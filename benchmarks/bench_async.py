@@ -0,0 +1,68 @@
+import sys
+import asyncio
+from time import perf_counter
+from typing import Awaitable, Callable, List
+
+sys.path.insert(0, '.')
+
+from lpp.evaluator import evaluate
+from lpp.interpreter import Interpreter
+from lpp.batch import percentile
+from lpp.async_evaluator import evaluate_async, run_in_executor
+
+
+SOURCE = '''
+    let fib = def(n) {
+      if (n < 2) { return n; }
+      return fib(n - 1) + fib(n - 2);
+    };
+    fib(18);
+'''
+
+TICK = 0.001
+
+
+async def _blocking() -> None:
+  evaluate(Interpreter.parse(SOURCE))
+
+
+async def _cooperative() -> None:
+  await evaluate_async(Interpreter.parse(SOURCE), yield_every=500)
+
+
+async def _offloaded() -> None:
+  await run_in_executor(SOURCE)
+
+
+async def _measure(job: Callable[[], Awaitable[None]]) -> List[float]:
+  lateness: List[float] = []
+  running = True
+
+  async def ticker() -> None:
+    while running:
+      start = perf_counter()
+      await asyncio.sleep(TICK)
+      lateness.append(perf_counter() - start - TICK)
+
+  task = asyncio.create_task(ticker())
+  await asyncio.sleep(TICK)
+  await job()
+  running = False
+  await task
+  return sorted(lateness)
+
+
+def main() -> None:
+  print(f'{"mode":<14}{"ticks":>8}{"p50 ms":>10}{"p99 ms":>10}{"max ms":>10}')
+  for name, job in (('blocking', _blocking),
+                    ('cooperative', _cooperative),
+                    ('offloaded', _offloaded)):
+    lateness = asyncio.run(_measure(job))
+    print(f'{name:<14}{len(lateness):>8}'
+          f'{percentile(lateness, 0.5) * 1000:>10.2f}'
+          f'{percentile(lateness, 0.99) * 1000:>10.2f}'
+          f'{lateness[-1] * 1000:>10.2f}')
+
+
+if __name__ == '__main__':
+  main()
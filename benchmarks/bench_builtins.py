@@ -0,0 +1,50 @@
+import sys
+from time import perf_counter
+
+sys.path.insert(0, '.')
+
+from lpp.ast.call import Call
+from lpp.ast.walk import walk
+from lpp.evaluator import evaluate
+from lpp.interpreter import Interpreter
+from lpp.object.environment import Environment
+
+
+CALLS = 1_000_000
+
+SOURCE = '''
+    let total = 0;
+    for (i in range({n})) {{ let total = total + abs(i) + min(i, 3) + len(range(i)); }};
+    total;
+'''
+
+
+def _run(resolved: bool, nesting: int) -> float:
+  program = Interpreter.parse(SOURCE.format(n=CALLS // 3))
+  if not resolved:
+    for node in walk(program):
+      if type(node) == Call:
+        node.builtin = None
+
+  env = Environment()
+  for _ in range(nesting):
+    env = Environment(env)
+
+  start = perf_counter()
+  result = evaluate(program, env)
+  seconds = perf_counter() - start
+  assert result is not None and type(result).__name__ == 'Integer'
+  return seconds
+
+
+def main() -> None:
+  for nesting in (0, 8):
+    for resolved in (False, True):
+      seconds = _run(resolved, nesting)
+      label = 'resolved' if resolved else 'looked up'
+      print(f'{label:<10} scope depth {nesting}: {CALLS} builtin calls in '
+            f'{seconds * 1000:7.1f} ms ({seconds / CALLS * 1e9:4.0f} ns/call)')
+
+
+if __name__ == '__main__':
+  main()
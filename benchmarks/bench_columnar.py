@@ -0,0 +1,58 @@
+import sys
+import random
+from time import perf_counter
+
+sys.path.insert(0, '.')
+
+import lpp.vector as vector
+from lpp.columnar import compile_expression
+
+
+BATCH_ROWS = 1_000_000
+ROW_WISE_ROWS = 20_000
+
+SOURCE = '''
+    let margin = price - cost;
+    if (discounted and margin > 0) {
+      margin * 0.9 / quantity
+    } else {
+      margin / quantity
+    }
+'''
+
+
+def _columns(rows: int) -> dict:
+  generator = random.Random(7)
+  return {
+      'price': [generator.uniform(1, 100) for _ in range(rows)],
+      'cost': [generator.uniform(1, 100) for _ in range(rows)],
+      'quantity': [generator.randrange(0, 50) for _ in range(rows)],
+      'discounted': [generator.random() < 0.3 for _ in range(rows)],
+  }
+
+
+def main() -> None:
+  print(f'backend: {"numpy" if vector.HAS_NUMPY else "array(d)"}')
+  expression = compile_expression(SOURCE)
+  columns = {name: vector.as_column(values)
+             for name, values in _columns(BATCH_ROWS).items()}
+
+  start = perf_counter()
+  result = expression.evaluate_batch(columns)
+  batch = perf_counter() - start
+  assert result.vectorized
+  print(f'batch:     {BATCH_ROWS} rows in {batch * 1000:.1f} ms '
+        f'({BATCH_ROWS / batch / 1e6:.2f} M rows/s, {len(result.errors)} row errors)')
+
+  row_wise_columns = {name: column[:ROW_WISE_ROWS] for name, column in columns.items()}
+  start = perf_counter()
+  result = expression._evaluate_rows(row_wise_columns, row_wise_columns, ROW_WISE_ROWS)
+  row_wise = perf_counter() - start
+  print(f'row-wise:  {ROW_WISE_ROWS} rows in {row_wise * 1000:.1f} ms '
+        f'({ROW_WISE_ROWS / row_wise / 1e6:.3f} M rows/s, {len(result.errors)} row errors)')
+
+  print(f'speedup: {(row_wise / ROW_WISE_ROWS) / (batch / BATCH_ROWS):.0f}x')
+
+
+if __name__ == '__main__':
+  main()
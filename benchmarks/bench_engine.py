@@ -0,0 +1,56 @@
+import sys
+from time import perf_counter
+
+sys.path.insert(0, '.')
+
+from lpp import Engine
+from lpp.interpreter import Interpreter
+from lpp.evaluator import evaluate
+
+
+RUNS = 20_000
+
+RULE = '''
+    let fee = def(amount) { if (amount > limit) { amount * rate } else { 0 } };
+    fee(amount) + max(0, bonus)
+'''
+
+
+def _timed(label: str, run) -> float:
+  start = perf_counter()
+  run()
+  seconds = perf_counter() - start
+  print(f'{label:<28} {RUNS:>7} runs in {seconds * 1000:8.1f} ms '
+        f'({seconds / RUNS * 1e6:.1f} us/run)')
+  return seconds
+
+
+def main() -> None:
+  bindings = [{'amount': index, 'limit': 100, 'rate': 0.5, 'bonus': index % 3}
+              for index in range(RUNS)]
+
+  def parse_each_time() -> None:
+    for values in bindings:
+      source = 'let amount = {amount}; let limit = {limit}; let rate = {rate}; ' \
+          'let bonus = {bonus};'.format(**values)
+      evaluate(Interpreter.parse(source + RULE))
+
+  engine = Engine()
+  rule = engine.compile(RULE)
+
+  def compiled_once() -> None:
+    for values in bindings:
+      rule.run(values)
+
+  def cached_lookup() -> None:
+    for values in bindings:
+      engine.run(RULE, values)
+
+  baseline = _timed('parse + evaluate per run', parse_each_time)
+  compiled = _timed('compiled program', compiled_once)
+  _timed('engine.run (cache lookup)', cached_lookup)
+  print(f'speedup {baseline / compiled:.1f}x, {engine.stats()}')
+
+
+if __name__ == '__main__':
+  main()
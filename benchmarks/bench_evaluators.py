@@ -0,0 +1,77 @@
+import sys
+import tracemalloc
+from time import perf_counter
+from typing import Callable, List, Optional, Tuple
+
+sys.path.insert(0, '.')
+
+from lpp.lexer import Lexer
+from lpp.parser import Parser
+from lpp.ast.program import Program
+from lpp.evaluator import evaluate
+from lpp.object.object_base import Object
+from lpp.stack_evaluator import evaluate_iterative
+
+
+Evaluator = Callable[[Program], Optional[Object]]
+
+CASES: List[Tuple[str, str]] = [
+    ('fib(18)', '''
+        let fib = def(n) {
+          if (n < 2) { return n; }
+          return fib(n - 1) + fib(n - 2);
+        };
+        fib(18);
+    '''),
+    ('sum of 300 terms', ' + '.join(['1'] * 300)),
+    ('count(60)', '''
+        let count = def(n) { if (n == 0) { 0 } else { 1 + count(n - 1) } };
+        count(60);
+    '''),
+]
+
+DEEP_CASES: List[Tuple[str, str]] = [
+    ('sum of 100000 terms', ' + '.join(['1'] * 100000)),
+    ('count(50000)', '''
+        let count = def(n) { if (n == 0) { 0 } else { 1 + count(n - 1) } };
+        count(50000);
+    '''),
+]
+
+
+def _parse(source: str) -> Program:
+  return Parser(Lexer(source)).parse_program()
+
+
+def _measure(evaluator: Evaluator, source: str, repeat: int = 5) -> Tuple[float, int]:
+  best = float('inf')
+  for _ in range(repeat):
+    program = _parse(source)
+    start = perf_counter()
+    evaluator(program)
+    best = min(best, perf_counter() - start)
+
+  program = _parse(source)
+  tracemalloc.start()
+  evaluator(program)
+  _, peak = tracemalloc.get_traced_memory()
+  tracemalloc.stop()
+
+  return best, peak
+
+
+def main() -> None:
+  print(f'{"case":<22}{"evaluator":<12}{"best ms":>10}{"peak KiB":>12}')
+  for name, source in CASES:
+    for label, evaluator in (('recursive', evaluate),
+                             ('iterative', evaluate_iterative)):
+      seconds, peak = _measure(evaluator, source)
+      print(f'{name:<22}{label:<12}{seconds * 1000:>10.2f}{peak / 1024:>12.1f}')
+
+  for name, source in DEEP_CASES:
+    seconds, peak = _measure(evaluate_iterative, source, repeat=1)
+    print(f'{name:<22}{"iterative":<12}{seconds * 1000:>10.2f}{peak / 1024:>12.1f}')
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,42 @@
+import sys
+from time import perf_counter
+from typing import List
+
+sys.path.insert(0, '.')
+
+from lpp.ffi import expose
+from lpp.columnar import compile_expression
+
+
+ROWS = 200_000
+
+
+@expose(pure=True)
+def weight(score: float, flagged: bool) -> float:
+  return score * 2 if flagged else score
+
+
+@expose(pure=True, batch=True)
+def weights(scores: List[float], flagged: List[bool]) -> List[float]:
+  return [score * 2 if flag else score for score, flag in zip(scores, flagged)]
+
+
+def main() -> None:
+  columns = {
+      'x': [float(row % 97) for row in range(ROWS)],
+      'flag': [row % 3 == 0 for row in range(ROWS)],
+  }
+
+  for name in ('weight', 'weights'):
+    expression = compile_expression(f'{name}(x, flag) + 1')
+    start = perf_counter()
+    result = expression.evaluate_batch(columns)
+    seconds = perf_counter() - start
+    assert not result.errors
+    mode = 'batched' if result.vectorized else 'row-wise'
+    print(f'{name:<8} {mode:<9} {ROWS} rows in {seconds * 1000:8.1f} ms '
+          f'({seconds / ROWS * 1e9:5.0f} ns/row)')
+
+
+if __name__ == '__main__':
+  main()
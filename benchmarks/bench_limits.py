@@ -0,0 +1,53 @@
+import sys
+from time import perf_counter
+from typing import List, Optional, Tuple
+
+sys.path.insert(0, '.')
+
+from lpp.limits import Limits
+from lpp.interpreter import Interpreter
+
+
+CASES: List[Tuple[str, str]] = [
+    ('fib(20)', '''
+        let fib = def(n) {
+          if (n < 2) { return n; }
+          return fib(n - 1) + fib(n - 2);
+        };
+        fib(20);
+    '''),
+    ('sum of 400 terms', ' + '.join(['1'] * 400)),
+]
+
+CONFIGURATIONS: List[Tuple[str, Optional[Limits]]] = [
+    ('no limits', None),
+    ('defaults', Limits()),
+    ('with deadline', Limits(timeout=60.0)),
+]
+
+
+def _measure(source: str, limits: Optional[Limits], repeat: int = 5) -> float:
+  best = float('inf')
+  for _ in range(repeat):
+    interpreter = Interpreter(limits=limits)
+    program = Interpreter.parse(source)
+    start = perf_counter()
+    interpreter.evaluate(program)
+    best = min(best, perf_counter() - start)
+
+  return best
+
+
+def main() -> None:
+  print(f'{"case":<20}{"limits":<16}{"best ms":>10}{"overhead":>10}')
+  for name, source in CASES:
+    baseline = 0.0
+    for label, limits in CONFIGURATIONS:
+      seconds = _measure(source, limits)
+      baseline = baseline or seconds
+      overhead = (seconds / baseline - 1) * 100
+      print(f'{name:<20}{label:<16}{seconds * 1000:>10.2f}{overhead:>9.1f}%')
+
+
+if __name__ == '__main__':
+  main()
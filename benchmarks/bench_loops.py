@@ -0,0 +1,47 @@
+import sys
+import resource
+from time import perf_counter
+
+sys.path.insert(0, '.')
+
+from lpp.evaluator import evaluate
+from lpp.interpreter import Interpreter
+
+
+ITERATIONS = 10_000_000
+
+PROGRAMS = [
+    ('for over range', '''
+        let total = 0;
+        for (i in range({n})) {{ let total = total + i; }};
+        total;
+    '''),
+    ('while with ++', '''
+        let total = 0;
+        let i = 0;
+        while (i < {n}) {{ let total = total + i; i++; }};
+        total;
+    '''),
+]
+
+
+def main() -> None:
+  iterations = int(sys.argv[1]) if len(sys.argv) > 1 else ITERATIONS
+  expected = str(iterations * (iterations - 1) // 2)
+
+  for label, source in PROGRAMS:
+    program = Interpreter.parse(source.format(n=iterations))
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = perf_counter()
+    result = evaluate(program)
+    seconds = perf_counter() - start
+    growth = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - before
+
+    assert result is not None and result.inspect() == expected
+    print(f'{label:<16} {iterations:>9} iterations in {seconds:7.2f} s '
+          f'({seconds / iterations * 1e9:4.0f} ns/iteration), '
+          f'peak RSS growth {growth} KiB')
+
+
+if __name__ == '__main__':
+  main()
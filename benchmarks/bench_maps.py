@@ -0,0 +1,71 @@
+import sys
+from time import perf_counter
+
+sys.path.insert(0, '.')
+
+from lpp.interpreter import Interpreter
+from lpp.builtins import lookup_builtin
+from lpp.object.map import Map
+from lpp.stack_evaluator import evaluate_iterative
+
+import lpp.object.string as object_string
+import lpp.object.numbers as object_numbers
+
+
+HOST_OPERATIONS = 1_000_000
+SCRIPT_OPERATIONS = 100_000
+
+SCRIPT = '''
+    let m = {{}};
+    let range = def(i, n, step) {{
+      if (i == n) {{ 0 }} else {{ step(i); range(i + 1, n, step) }}
+    }};
+    let blocks = def(n, step) {{
+      range(0, n / 1000, def(block) {{ range(block * 1000, block * 1000 + 1000, step) }})
+    }};
+    blocks({n}, def(i) {{ set(m, i, i * 2) }});
+    let total = {{0: 0}};
+    blocks({n}, def(i) {{ set(total, 0, get(total, 0) + get(m, i * 1.0)) }});
+    get(total, 0);
+'''
+
+
+def _timed(label: str, operations: int, run) -> None:
+  start = perf_counter()
+  run()
+  seconds = perf_counter() - start
+  print(f'{label:<28} {operations:>9} ops in {seconds * 1000:8.1f} ms '
+        f'({seconds / operations * 1e9:.0f} ns/op)')
+
+
+def main() -> None:
+  set_builtin = lookup_builtin('set')
+  get_builtin = lookup_builtin('get')
+  assert set_builtin is not None and get_builtin is not None
+
+  mapping = Map({})
+  keys = [object_numbers.Integer(index) for index in range(HOST_OPERATIONS)]
+  float_keys = [object_numbers.Float(index + 0.5) for index in range(HOST_OPERATIONS)]
+  string_keys = [object_string.String(f'key-{index}') for index in range(HOST_OPERATIONS)]
+
+  _timed('integer inserts (builtin)', HOST_OPERATIONS,
+         lambda: [set_builtin.function(mapping, key, key) for key in keys])
+  _timed('integer lookups (builtin)', HOST_OPERATIONS,
+         lambda: [get_builtin.function(mapping, key) for key in keys])
+  _timed('float inserts (builtin)', HOST_OPERATIONS,
+         lambda: [set_builtin.function(mapping, key, key) for key in float_keys])
+  _timed('string inserts (builtin)', HOST_OPERATIONS,
+         lambda: [set_builtin.function(mapping, key, key) for key in string_keys])
+  _timed('string lookups (builtin)', HOST_OPERATIONS,
+         lambda: [get_builtin.function(mapping, key) for key in string_keys])
+
+  program = Interpreter.parse(SCRIPT.format(n=SCRIPT_OPERATIONS))
+  result = []
+  _timed('script inserts + lookups', 2 * SCRIPT_OPERATIONS,
+         lambda: result.append(evaluate_iterative(program)))
+  expected = SCRIPT_OPERATIONS * (SCRIPT_OPERATIONS - 1)
+  assert result[0] is not None and result[0].inspect() == str(expected)
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,55 @@
+import os
+import sys
+from time import perf_counter
+from tempfile import TemporaryDirectory
+
+sys.path.insert(0, '.')
+
+import lpp.modules as modules
+from lpp.interpreter import Interpreter
+
+
+RULES = 400
+SCRIPTS = 200
+
+RULE = 'let rule_{i} = def(x) {{ if (x > {i}) {{ x * {i} - 1 }} else {{ x + {i} }} }};\n'
+
+
+def _load(directory: str, label: str) -> None:
+  start = perf_counter()
+  for script in range(SCRIPTS):
+    interpreter = Interpreter(search_path=[directory])
+    result = interpreter.run(f'import rules; rule_{script % RULES}({script})')
+    assert result is not None and result.type().name == 'INTEGER'
+  seconds = perf_counter() - start
+  print(f'{label:<34} {SCRIPTS} scripts in {seconds * 1000:8.1f} ms '
+        f'({seconds / SCRIPTS * 1000:6.2f} ms/script)')
+
+
+def main() -> None:
+  with TemporaryDirectory() as directory:
+    source = ''.join(RULE.format(i=index) for index in range(RULES))
+    with open(os.path.join(directory, 'rules.lpp'), 'w') as rules:
+      rules.write(source)
+
+    start = perf_counter()
+    for _ in range(5):
+      Interpreter.parse(source)
+    print(f'{"parse rule library":<34} {(perf_counter() - start) / 5 * 1000:8.1f} ms')
+
+    start = perf_counter()
+    modules.ModuleLoader([directory]).program('rules')
+    print(f'{"first import (parse + write cache)":<34} '
+          f'{(perf_counter() - start) * 1000:8.1f} ms')
+
+    modules.clear_program_cache()
+    start = perf_counter()
+    modules.ModuleLoader([directory]).program('rules')
+    print(f'{"cold import from disk cache":<34} '
+          f'{(perf_counter() - start) * 1000:8.1f} ms')
+
+    _load(directory, 'import per script (warm worker)')
+
+
+if __name__ == '__main__':
+  main()
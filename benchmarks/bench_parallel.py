@@ -0,0 +1,38 @@
+import sys
+from time import perf_counter
+
+sys.path.insert(0, '.')
+
+from lpp.interpreter import Interpreter
+from lpp.parallel import evaluate_parallel
+
+
+SOURCE = '''
+    let fib = def(n) {
+      if (n < 2) { return n; }
+      return fib(n - 1) + fib(n - 2);
+    };
+''' + '\n'.join(f'let r{i} = fib(19);' for i in range(8)) + '''
+    r0 + r1 + r2 + r3 + r4 + r5 + r6 + r7;
+'''
+
+
+def main() -> None:
+  jobs = int(sys.argv[1]) if len(sys.argv) > 1 else None
+
+  start = perf_counter()
+  expected = Interpreter(limits=None).run(SOURCE)
+  sequential = perf_counter() - start
+
+  result = evaluate_parallel(SOURCE, jobs=jobs)
+  assert result.value is not None and expected is not None
+  assert result.value.inspect() == expected.inspect()
+
+  print(f'sequential: {sequential:.3f}s')
+  print(f'parallel:   {result.report.wall_seconds:.3f}s '
+        f'({sequential / result.report.wall_seconds:.2f}x)')
+  print(result.report.format())
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,43 @@
+import gc
+import sys
+from time import perf_counter
+
+sys.path.insert(0, '.')
+
+from lpp.repl import ReplSession
+from lpp.interpreter import Interpreter
+
+
+SIZES = [0, 1_000, 5_000, 20_000]
+SAMPLES = 300
+
+DEFINITION = 'let f{i} = def(x) {{ if (x > {i}) {{ max(x, {i}) }} else {{ f{previous}(x + 1) }} }};'
+
+
+def _per_line_us(run, size: int) -> float:
+  gc.collect()
+  start = perf_counter()
+  for i in range(SAMPLES):
+    run(f'let probe{size}_{i} = len([f{size}(1000000)]) + {i};')
+  return (perf_counter() - start) / SAMPLES * 1e6
+
+
+def main() -> None:
+  session = ReplSession()
+  interpreter = Interpreter()
+  defined = 0
+  print(f'{"definitions":>12} {"ReplSession":>14} {"Interpreter":>14}   (us per line)')
+  for size in SIZES:
+    for run in (session.run, interpreter.run):
+      if defined == 0:
+        run('let f0 = def(x) { x };')
+      for i in range(max(defined, 1), size + 1):
+        run(DEFINITION.format(i=i, previous=i - 1))
+    defined = size + 1
+
+    print(f'{size:>12} {_per_line_us(session.run, size):>14.1f} '
+          f'{_per_line_us(interpreter.run, size):>14.1f}')
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,84 @@
+import sys
+import json
+import subprocess
+from threading import Thread
+from time import perf_counter
+from typing import Dict, List
+
+sys.path.insert(0, '.')
+
+
+REQUESTS = 2000
+PROCESSES = 20
+
+SOURCES = [
+    'let f = def(x) { if (x > 10) { x * 2 } else { x + 1 } }; f(n)',
+    'sum(arange(0, n) * 2)',
+    'let total = sum(range(0, n)); total / 2',
+]
+
+
+ONE_SHOT = '''
+import sys
+sys.path.insert(0, '.')
+from lpp.engine import Engine
+print(Engine().run({source!r}, {{'n': {n}}}).inspect())
+'''
+
+
+def _percentile(samples: List[float], fraction: float) -> float:
+  ordered = sorted(samples)
+  return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def _pipelined() -> None:
+  server = subprocess.Popen([sys.executable, 'main.py', 'serve', '--workers', '4'],
+                            stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                            text=True, bufsize=1)
+  sent: Dict[int, float] = {}
+  latencies: List[float] = []
+
+  def send() -> None:
+    assert server.stdin is not None
+    for i in range(REQUESTS):
+      sent[i] = perf_counter()
+      server.stdin.write(json.dumps({'id': i, 'source': SOURCES[i % len(SOURCES)],
+                                     'bindings': {'n': i % 50}}) + '\n')
+    server.stdin.close()
+
+  start = perf_counter()
+  sender = Thread(target=send)
+  sender.start()
+  assert server.stdout is not None
+  for line in server.stdout:
+    response = json.loads(line)
+    assert response['ok'], response
+    latencies.append(perf_counter() - sent[response['id']])
+  seconds = perf_counter() - start
+  sender.join()
+  server.wait()
+
+  assert len(latencies) == REQUESTS
+  print(f'pipelined server     {REQUESTS / seconds:8.0f} requests/s')
+  print(f'  latency p50        {_percentile(latencies, 0.5) * 1000:8.2f} ms')
+  print(f'  latency p99        {_percentile(latencies, 0.99) * 1000:8.2f} ms')
+
+
+def _process_per_request() -> None:
+  start = perf_counter()
+  for i in range(PROCESSES):
+    code = ONE_SHOT.format(source=SOURCES[i % len(SOURCES)], n=i % 50)
+    subprocess.run([sys.executable, '-c', code], check=True,
+                   stdout=subprocess.DEVNULL)
+  seconds = perf_counter() - start
+  print(f'process per request  {PROCESSES / seconds:8.0f} requests/s '
+        f'({seconds / PROCESSES * 1000:.1f} ms each)')
+
+
+def main() -> None:
+  _pipelined()
+  _process_per_request()
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,79 @@
+import os
+import sys
+import subprocess
+from time import perf_counter
+from tempfile import TemporaryDirectory
+
+sys.path.insert(0, '.')
+
+from lpp.snapshot import ForkServer, load_snapshot, save_snapshot, warm_interpreter
+
+
+FUNCTIONS = 300
+REQUESTS = 200
+
+PRELUDE_FUNCTION = '''
+    let helper_{i} = def(x) {{
+      let scaled = x * {i} + {i};
+      if (scaled > 1000) {{ scaled - 1000 }} else {{ scaled }}
+    }};
+    let table_{i} = {{'id': {i}, 'name': 'helper_{i}', 'weights': arange(0, 64)}};
+    helper_{i}(1);
+'''
+
+COLD = '''
+import sys
+sys.path.insert(0, {root!r})
+from lpp.snapshot import warm_interpreter
+warm_interpreter([{prelude!r}]).run('helper_7(3)')
+'''
+
+WARM = '''
+import sys
+sys.path.insert(0, {root!r})
+from lpp.snapshot import load_snapshot
+load_snapshot({snapshot!r}).run('helper_7(3)')
+'''
+
+
+def _process_seconds(code: str) -> float:
+  start = perf_counter()
+  subprocess.run([sys.executable, '-c', code], check=True)
+  return perf_counter() - start
+
+
+def main() -> None:
+  root = os.path.abspath('.')
+  with TemporaryDirectory() as directory:
+    prelude = os.path.join(directory, 'prelude.lpp')
+    snapshot = os.path.join(directory, 'prelude.lpps')
+    with open(prelude, 'w', encoding='utf-8') as source:
+      source.write(''.join(PRELUDE_FUNCTION.format(i=i) for i in range(FUNCTIONS)))
+
+    start = perf_counter()
+    interpreter = warm_interpreter([prelude])
+    evaluate_seconds = perf_counter() - start
+    save_snapshot(interpreter, snapshot)
+
+    start = perf_counter()
+    load_snapshot(snapshot)
+    load_seconds = perf_counter() - start
+    print(f'prelude evaluation   {evaluate_seconds * 1000:8.1f} ms')
+    print(f'snapshot load        {load_seconds * 1000:8.1f} ms '
+          f'({os.path.getsize(snapshot) // 1024} KiB)')
+
+    cold = _process_seconds(COLD.format(root=root, prelude=prelude))
+    warm = _process_seconds(WARM.format(root=root, snapshot=snapshot))
+    print(f'cold process start   {cold * 1000:8.1f} ms')
+    print(f'snapshot process     {warm * 1000:8.1f} ms')
+
+    with ForkServer(interpreter, workers=2) as server:
+      start = perf_counter()
+      results = server.map([f'helper_{i % FUNCTIONS}({i})' for i in range(REQUESTS)])
+      seconds = perf_counter() - start
+    assert all(result.ok for result in results)
+    print(f'fork server          {seconds / REQUESTS * 1e6:8.1f} us/request')
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,90 @@
+import sys
+import subprocess
+from statistics import median
+from compileall import compile_dir, compile_file
+from argparse import ArgumentParser
+from typing import Dict, List, NamedTuple, Set, Tuple
+
+
+RUNS = 7
+
+
+class Scenario(NamedTuple):
+  name: str
+  code: str
+  budget_ms: float
+
+
+SCENARIOS = [
+    Scenario('import main', 'import main', 40.0),
+    Scenario('import lpp', 'import lpp', 30.0),
+    Scenario('one-shot evaluation',
+             "from lpp.interpreter import Interpreter; Interpreter().run('1 + 1')",
+             90.0),
+]
+
+
+def _import_times(code: str) -> List[Tuple[str, int, int, int]]:
+  completed = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                             capture_output=True, text=True, check=True)
+  entries = []
+  for line in completed.stderr.splitlines():
+    if not line.startswith('import time:') or 'cumulative' in line:
+      continue
+    self_us, cumulative_us, name = line[len('import time:'):].split('|')
+    module = name.strip()
+    depth = (len(name.rstrip()) - len(module) - 1) // 2
+    entries.append((module, depth, int(self_us), int(cumulative_us)))
+  return entries
+
+
+def _interpreter_modules() -> Set[str]:
+  return {module for module, _, _, _ in _import_times('pass')}
+
+
+def _measure(scenario: Scenario, baseline: Set[str],
+             runs: int) -> Tuple[float, List[Tuple[str, int]]]:
+  totals = []
+  self_times: Dict[str, List[int]] = {}
+  for _ in range(runs):
+    total = 0
+    for module, depth, self_us, cumulative_us in _import_times(scenario.code):
+      if module in baseline:
+        continue
+      self_times.setdefault(module, []).append(self_us)
+      if depth == 0:
+        total += cumulative_us
+    totals.append(total / 1000)
+
+  heaviest = sorted(((module, int(median(times))) for module, times in self_times.items()),
+                    key=lambda entry: entry[1], reverse=True)
+  return median(totals), heaviest[:5]
+
+
+def main() -> int:
+  parser = ArgumentParser(description='import-time startup budget')
+  parser.add_argument('--runs', type=int, default=RUNS)
+  parser.add_argument('--budget-scale', type=float, default=1.0,
+                      help='multiply every budget, for slow machines')
+  args = parser.parse_args()
+
+  compile_dir('lpp', quiet=1)
+  compile_file('main.py', quiet=1)
+  baseline = _interpreter_modules()
+
+  failures = 0
+  for scenario in SCENARIOS:
+    budget = scenario.budget_ms * args.budget_scale
+    total, heaviest = _measure(scenario, baseline, args.runs)
+    status = 'ok' if total <= budget else 'OVER BUDGET'
+    print(f'{scenario.name:<22} {total:7.1f} ms  (budget {budget:5.1f} ms)  {status}')
+    if total > budget:
+      failures += 1
+      for module, self_us in heaviest:
+        print(f'    {module:<32} {self_us / 1000:6.1f} ms self')
+
+  return 1 if failures else 0
+
+
+if __name__ == '__main__':
+  sys.exit(main())
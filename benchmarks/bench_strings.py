@@ -0,0 +1,38 @@
+import sys
+from time import perf_counter
+
+sys.path.insert(0, '.')
+
+from lpp.interpreter import Interpreter
+from lpp.stack_evaluator import evaluate_iterative
+
+
+SOURCE = '''
+    let loop = def(s, n, step) {
+      if (n == 0) { s } else { loop(step(s), n - 1, step) }
+    };
+    let times = def(n, step) { def(s) { loop(s, n, step) } };
+    let append = def(s) { s + '{piece}' };
+    len(times({outer}, times({middle}, times(100, append)))(''));
+'''
+
+PIECE = 'abcdefghij'
+SIZES = [(25, 10), (50, 10), (100, 10)]
+
+
+def main() -> None:
+  for outer, middle in SIZES:
+    characters = outer * middle * 100 * len(PIECE)
+    program = Interpreter.parse(SOURCE.replace('{outer}', str(outer))
+                                      .replace('{middle}', str(middle))
+                                      .replace('{piece}', PIECE))
+    start = perf_counter()
+    result = evaluate_iterative(program)
+    seconds = perf_counter() - start
+    assert result is not None and result.inspect() == str(characters)
+    print(f'{characters:>9} characters in {characters // len(PIECE)} appends: '
+          f'{seconds * 1000:8.1f} ms ({seconds / characters * 1e9:.0f} ns/character)')
+
+
+if __name__ == '__main__':
+  main()
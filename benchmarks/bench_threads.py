@@ -0,0 +1,51 @@
+import os
+import sys
+from time import perf_counter
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, '.')
+
+from lpp.ast.program import Program
+from lpp.interpreter import Interpreter, free_threaded
+
+
+SOURCE = '''
+    let fib = def(n) {
+      if (n < 2) { return n; }
+      return fib(n - 1) + fib(n - 2);
+    };
+    fib(15);
+'''
+
+TASKS = 64
+
+
+def _task(program: Program) -> None:
+  Interpreter().evaluate(program)
+
+
+def _throughput(program: Program, threads: int) -> float:
+  start = perf_counter()
+  with ThreadPoolExecutor(max_workers=threads) as executor:
+    list(executor.map(_task, [program] * TASKS))
+  return TASKS / (perf_counter() - start)
+
+
+def main() -> None:
+  max_threads = int(sys.argv[1]) if len(sys.argv) > 1 else (os.cpu_count() or 1)
+  program = Interpreter.parse(SOURCE)
+  _task(program)
+
+  print(f'free-threaded build: {free_threaded()}')
+  print(f'{"threads":>8}{"runs/s":>12}{"speedup":>10}')
+  baseline = 0.0
+  threads = 1
+  while threads <= max_threads:
+    runs = _throughput(program, threads)
+    baseline = baseline or runs
+    print(f'{threads:>8}{runs:>12.1f}{runs / baseline:>10.2f}')
+    threads *= 2
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,28 @@
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+  from lpp.engine import CompiledProgram, Engine, EngineStats
+
+
+_LAZY_EXPORTS: Dict[str, str] = {
+    'CompiledProgram': 'lpp.engine',
+    'Engine': 'lpp.engine',
+    'EngineStats': 'lpp.engine',
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+  module = _LAZY_EXPORTS.get(name)
+  if module is None:
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+  value = getattr(import_module(module), name)
+  globals()[name] = value
+  return value
+
+
+def __dir__() -> List[str]:
+  return sorted(set(globals()) | set(_LAZY_EXPORTS))
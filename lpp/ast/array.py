@@ -0,0 +1,18 @@
+from typing import List
+
+from lpp.token import Token
+from lpp.ast.node_base import Expression
+
+
+class ArrayLiteral(Expression):
+
+  def __init__(self,
+               token: Token,
+               elements: List[Expression] = []) -> None:
+    super().__init__(token)
+    self.elements = elements
+
+  def __str__(self) -> str:
+    element_list: List[str] = [str(element) for element in self.elements]
+    elements = ', '.join(element_list)
+    return f'[{elements}]'
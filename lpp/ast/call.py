@@ -1,4 +1,4 @@
-from typing import List
+from typing import Any, List, Optional
 
 from lpp.token import Token
 from lpp.ast.node_base import Expression
@@ -13,6 +13,7 @@ class Call(Expression):
     super().__init__(token)
     self.function = function
     self.arguments = arguments
+    self.builtin: Optional[Any] = None
 
   def __str__(self) -> str:
     arg_list: List[str] = [str(argument) for argument in self.arguments]
@@ -0,0 +1,29 @@
+from typing import Any, Callable, Dict, Optional
+
+from lpp.token import Token
+from lpp.ast.block import Block
+from lpp.ast.indentifier import Identifier
+from lpp.ast.node_base import Expression, Statement
+
+
+class ForStatement(Statement):
+
+  def __init__(self,
+               token: Token,
+               variable: Optional[Identifier] = None,
+               iterable: Optional[Expression] = None,
+               body: Optional[Block] = None) -> None:
+    super().__init__(token)
+    self.variable = variable
+    self.iterable = iterable
+    self.body = body
+    self.back_edges = 0
+    self.compiled: Optional[Callable[[Any], Any]] = None
+
+  def __getstate__(self) -> Dict[str, Any]:
+    state = self.__dict__.copy()
+    state['compiled'] = None
+    return state
+
+  def __str__(self) -> str:
+    return f'for ({str(self.variable)} in {str(self.iterable)}) {str(self.body)}'
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from lpp.token import Token
 from lpp.ast.block import Block
@@ -14,6 +14,16 @@ class Function(Expression):
     super().__init__(token)
     self.parameters = parameters
     self.body = body
+    self.calls = 0
+    self.tier_requested = False
+    self.compiled: Optional[Callable[[Any], Any]] = None
+    self.purity: Optional[Any] = None
+
+  def __getstate__(self) -> Dict[str, Any]:
+    state = self.__dict__.copy()
+    state['compiled'] = None
+    state['tier_requested'] = False
+    return state
 
   def __str__(self) -> str:
     param_list: List[str] = [str(parameter) for parameter in self.parameters]
@@ -0,0 +1,12 @@
+from lpp.token import Token
+from lpp.ast.node_base import Statement
+
+
+class ImportStatement(Statement):
+
+  def __init__(self, token: Token, module: str = '') -> None:
+    super().__init__(token)
+    self.module = module
+
+  def __str__(self) -> str:
+    return f"{super().token_literal()} '{self.module}';"
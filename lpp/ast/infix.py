@@ -1,6 +1,7 @@
 from typing import Optional
 
 from lpp.token import Token
+from lpp.inline_cache import InlineCache
 from lpp.ast.node_base import Expression
 
 
@@ -14,6 +15,7 @@ class Infix(Expression):
     self.left = left
     self.operator = operator
     self.right = right
+    self.cache = InlineCache()
 
   def __str__(self) -> str:
     return f'({str(self.left)} {self.operator} {str(self.right)})'
@@ -0,0 +1,16 @@
+from typing import Optional
+
+from lpp.token import Token
+from lpp.ast.infix import Infix
+from lpp.ast.node_base import Expression
+
+
+class Logical(Infix):
+
+  def __init__(self, token: Token,
+               left: Expression,
+               operator: str,
+               right: Optional[Expression] = None) -> None:
+    super().__init__(token, left, operator, right)
+    self.evaluations = 0
+    self.short_circuits = 0
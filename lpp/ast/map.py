@@ -0,0 +1,20 @@
+from typing import List
+
+from lpp.token import Token
+from lpp.ast.node_base import Expression
+
+
+class MapLiteral(Expression):
+
+  def __init__(self,
+               token: Token,
+               keys: List[Expression],
+               values: List[Expression]) -> None:
+    super().__init__(token)
+    self.keys = keys
+    self.values = values
+
+  def __str__(self) -> str:
+    pairs = ', '.join(f'{str(key)}: {str(value)}'
+                      for key, value in zip(self.keys, self.values))
+    return f'{{{pairs}}}'
@@ -27,6 +27,8 @@ class Expression(ASTNode):
 
   def __init__(self, token: Token) -> None:
     self.token = token
+    self.executions = 0
+    self.deopts = 0
 
   def token_literal(self) -> str:
     return self.token.literal
@@ -2,6 +2,7 @@ from typing import Optional
 
 from lpp.token import Token
 from lpp.utils.type import TokenType
+from lpp.inline_cache import InlineCache
 from lpp.ast.node_base import Expression
 
 
@@ -14,6 +15,7 @@ class Prefix(Expression):
     super().__init__(token)
     self.operator = operator
     self.right = right
+    self.cache = InlineCache()
 
   def __str__(self) -> str:
     space = '' if self.token.token_type != TokenType.NEGATION else ' '
@@ -0,0 +1,81 @@
+from typing import Callable, Dict, Tuple, Type
+
+from lpp.ast.walk import walk
+from lpp.ast.infix import Infix
+from lpp.ast.bool import Boolean
+from lpp.ast.if_expression import If
+from lpp.ast.node_base import ASTNode
+from lpp.ast.number import Float, Integer
+from lpp.object.object_base import Object
+
+
+class QuickInteger(Integer):
+  boxed: Object
+
+
+class QuickFloat(Float):
+  boxed: Object
+
+
+class QuickBoolean(Boolean):
+  boxed: Object
+
+
+class QuickInfix(Infix):
+  guard: Tuple[Type, Type, Callable[[Object, Object], Object]]
+
+
+class IntAddInt(Infix):
+  pass
+
+
+class IntSubInt(Infix):
+  pass
+
+
+class IntMulInt(Infix):
+  pass
+
+
+class IntLtInt(Infix):
+  pass
+
+
+class IntGtInt(Infix):
+  pass
+
+
+class BooleanIf(If):
+  pass
+
+
+GENERIC_NODES: Dict[Type, Type] = {
+    QuickInteger: Integer,
+    QuickFloat: Float,
+    QuickBoolean: Boolean,
+    QuickInfix: Infix,
+    IntAddInt: Infix,
+    IntSubInt: Infix,
+    IntMulInt: Infix,
+    IntLtInt: Infix,
+    IntGtInt: Infix,
+    BooleanIf: If,
+}
+
+
+def count_quickened(node: ASTNode) -> Dict[str, int]:
+  counts: Dict[str, int] = {}
+
+  for child in walk(node):
+    if type(child) in GENERIC_NODES:
+      name = type(child).__name__
+      counts[name] = counts.get(name, 0) + 1
+
+  return counts
+
+
+def dequicken(node: ASTNode) -> None:
+  for child in walk(node):
+    generic = GENERIC_NODES.get(type(child))
+    if generic is not None:
+      child.__class__ = generic
@@ -0,0 +1,15 @@
+from typing import Any, Optional
+
+from lpp.token import Token
+from lpp.ast.node_base import Expression
+
+
+class StringLiteral(Expression):
+
+  def __init__(self, token: Token, value: str) -> None:
+    super().__init__(token)
+    self.value = value
+    self.boxed: Optional[Any] = None
+
+  def __str__(self) -> str:
+    return self.token_literal()
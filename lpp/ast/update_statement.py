@@ -0,0 +1,19 @@
+from typing import Optional
+
+from lpp.token import Token
+from lpp.ast.indentifier import Identifier
+from lpp.ast.node_base import Statement
+
+
+class UpdateStatement(Statement):
+
+  def __init__(self,
+               token: Token,
+               name: Optional[Identifier] = None,
+               operator: str = '++') -> None:
+    super().__init__(token)
+    self.name = name
+    self.operator = operator
+
+  def __str__(self) -> str:
+    return f'{str(self.name)}{self.operator};'
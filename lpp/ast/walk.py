@@ -0,0 +1,20 @@
+from typing import Iterator, List
+
+from lpp.ast.node_base import ASTNode
+
+
+def children(node: ASTNode) -> Iterator[ASTNode]:
+  for value in vars(node).values():
+    if isinstance(value, ASTNode):
+      yield value
+    elif isinstance(value, list):
+      yield from (child for child in value if isinstance(child, ASTNode))
+
+
+def walk(node: ASTNode) -> Iterator[ASTNode]:
+  pending: List[ASTNode] = [node]
+
+  while pending:
+    current = pending.pop()
+    yield current
+    pending.extend(children(current))
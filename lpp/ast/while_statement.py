@@ -0,0 +1,26 @@
+from typing import Any, Callable, Dict, Optional
+
+from lpp.token import Token
+from lpp.ast.block import Block
+from lpp.ast.node_base import Expression, Statement
+
+
+class WhileStatement(Statement):
+
+  def __init__(self,
+               token: Token,
+               condition: Optional[Expression] = None,
+               body: Optional[Block] = None) -> None:
+    super().__init__(token)
+    self.condition = condition
+    self.body = body
+    self.back_edges = 0
+    self.compiled: Optional[Callable[[Any], Any]] = None
+
+  def __getstate__(self) -> Dict[str, Any]:
+    state = self.__dict__.copy()
+    state['compiled'] = None
+    return state
+
+  def __str__(self) -> str:
+    return f'while {str(self.condition)} {str(self.body)}'
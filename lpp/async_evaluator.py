@@ -0,0 +1,35 @@
+import asyncio
+from concurrent.futures import Executor
+from typing import Optional
+
+from lpp.ast.node_base import ASTNode
+from lpp.interpreter import Interpreter
+from lpp.object.object_base import Object
+from lpp.stack_evaluator import StackMachine
+from lpp.object.environment import Environment
+
+
+YIELD_EVERY = 1000
+
+
+async def evaluate_async(node: ASTNode,
+                         env: Optional[Environment] = None,
+                         yield_every: int = YIELD_EVERY) -> Optional[Object]:
+  if yield_every < 1:
+    raise ValueError('yield_every must be at least 1')
+
+  machine = StackMachine(node, env)
+  while not machine.run(max_steps=yield_every):
+    await asyncio.sleep(0)
+
+  return machine.result
+
+
+async def run_in_executor(source: str,
+                          executor: Optional[Executor] = None) -> Optional[Object]:
+  loop = asyncio.get_running_loop()
+  return await loop.run_in_executor(executor, _run_source, source)
+
+
+def _run_source(source: str) -> Optional[Object]:
+  return Interpreter().run(source)
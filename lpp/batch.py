@@ -0,0 +1,139 @@
+import os
+import math
+from time import perf_counter
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from lpp.object.error import Error
+from lpp.modules import default_search_path
+from lpp.interpreter import Interpreter, ParseError
+
+
+CHUNK_BYTES = 64 * 1024
+MAX_CHUNK_SCRIPTS = 64
+
+_INTERNAL_ERROR = 'Internal error: {}: {}'
+
+
+class ScriptResult(NamedTuple):
+  path: str
+  output: Optional[str]
+  error: Optional[str]
+  seconds: float
+
+  @property
+  def ok(self) -> bool:
+    return self.error is None
+
+
+class BatchReport(NamedTuple):
+  scripts: int
+  failures: int
+  wall_seconds: float
+  p50: float
+  p90: float
+  p99: float
+  slowest: float
+
+  @property
+  def throughput(self) -> float:
+    return self.scripts / self.wall_seconds if self.wall_seconds else 0.0
+
+  def format(self) -> str:
+    return (f'{self.scripts} scripts, {self.failures} failed '
+            f'in {self.wall_seconds:.2f}s ({self.throughput:.1f} scripts/s); '
+            f'latency ms p50={self.p50 * 1000:.2f} p90={self.p90 * 1000:.2f} '
+            f'p99={self.p99 * 1000:.2f} max={self.slowest * 1000:.2f}')
+
+
+def run_script(path: str) -> ScriptResult:
+  start = perf_counter()
+  try:
+    with open(path, encoding='utf-8') as script:
+      source = script.read()
+    search_path = [os.path.dirname(os.path.abspath(path))] + default_search_path()
+    evaluated = Interpreter(search_path=search_path).run(source)
+  except (OSError, UnicodeDecodeError) as error:
+    return ScriptResult(path, None, str(error), perf_counter() - start)
+  except ParseError as error:
+    return ScriptResult(path, None, str(error), perf_counter() - start)
+  except Exception as error:
+    return ScriptResult(path, None, _INTERNAL_ERROR.format(type(error).__name__, error),
+                        perf_counter() - start)
+
+  seconds = perf_counter() - start
+  if type(evaluated) == Error:
+    return ScriptResult(path, None, evaluated.inspect(), seconds)
+
+  output = evaluated.inspect() if evaluated is not None else None
+  return ScriptResult(path, output, None, seconds)
+
+
+def run_batch(paths: Sequence[str],
+              jobs: Optional[int] = None,
+              chunk_bytes: int = CHUNK_BYTES) -> Iterator[ScriptResult]:
+  if jobs == 1:
+    for path in paths:
+      yield run_script(path)
+    return
+
+  with ProcessPoolExecutor(max_workers=jobs,
+                           initializer=_warm_worker) as executor:
+    futures = [executor.submit(_run_chunk, chunk)
+               for chunk in chunk_paths(paths, chunk_bytes)]
+    for future in as_completed(futures):
+      yield from future.result()
+
+
+def chunk_paths(paths: Iterable[str],
+                chunk_bytes: int = CHUNK_BYTES) -> Iterator[List[str]]:
+  chunk: List[str] = []
+  size = 0
+
+  for path in paths:
+    try:
+      path_size = os.path.getsize(path)
+    except OSError:
+      path_size = 0
+
+    if chunk and (size + path_size > chunk_bytes
+                  or len(chunk) >= MAX_CHUNK_SCRIPTS):
+      yield chunk
+      chunk = []
+      size = 0
+
+    chunk.append(path)
+    size += path_size
+
+  if chunk:
+    yield chunk
+
+
+def summarize(results: Sequence[ScriptResult],
+              wall_seconds: float) -> BatchReport:
+  latencies = sorted(result.seconds for result in results)
+  failures = sum(1 for result in results if not result.ok)
+
+  return BatchReport(scripts=len(results),
+                     failures=failures,
+                     wall_seconds=wall_seconds,
+                     p50=percentile(latencies, 0.50),
+                     p90=percentile(latencies, 0.90),
+                     p99=percentile(latencies, 0.99),
+                     slowest=latencies[-1] if latencies else 0.0)
+
+
+def percentile(ordered: Sequence[float], fraction: float) -> float:
+  if not ordered:
+    return 0.0
+
+  index = min(len(ordered) - 1, max(0, math.ceil(fraction * len(ordered)) - 1))
+  return ordered[index]
+
+
+def _run_chunk(paths: List[str]) -> List[ScriptResult]:
+  return [run_script(path) for path in paths]
+
+
+def _warm_worker() -> None:
+  Interpreter().run('let warm = def(x) { x + 1 }; warm(1);')
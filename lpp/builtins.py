@@ -0,0 +1,385 @@
+import math
+from contextvars import ContextVar, Token
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, Union, cast
+
+from lpp.object.error import Error
+from lpp.limits import check_length
+from lpp.object.array import Array
+from lpp.object.range import Range
+from lpp.object.map import KEY_TYPES, Map
+from lpp.object.builtin import Builtin
+from lpp.object.object_base import Object
+
+import lpp.vector as vector
+import lpp.object.null as object_null
+import lpp.object.bool as object_bool
+import lpp.object.string as object_string
+import lpp.object.numbers as object_numbers
+
+
+_WRONG_ARGUMENTS = 'Wrong number of arguments: expected {}, got {}'
+_WRONG_ARGUMENT_TYPE = 'Argument to {} must be {}, got {}'
+_INVALID_ARGUMENT = 'Invalid argument to {}: {}'
+_UNUSABLE_KEY = 'Unusable as map key: {}'
+_UNBOXABLE = 'Cannot convert host value of type {} from {}'
+
+_NUMBER_TYPES = (object_numbers.Integer, object_numbers.Float)
+
+_SIZED_TYPES = (Array, object_string.String, Range)
+
+_HOST_ERRORS = (TypeError, ValueError, ArithmeticError)
+
+_output: 'ContextVar[Optional[Output]]' = ContextVar('lpp_output', default=None)
+
+Accepts = Tuple[Tuple[Type, ...], str]
+
+_NUMBERS: Accepts = (_NUMBER_TYPES, 'a number')
+_SIZED: Accepts = (_SIZED_TYPES, 'ARRAY, STRING or RANGE')
+_SEQUENCES: Accepts = ((Array, Range), 'ARRAY or RANGE')
+_AGGREGATES: Accepts = ((Array, Range) + _NUMBER_TYPES, 'ARRAY, RANGE or a number')
+_CONVERTIBLE: Accepts = (_NUMBER_TYPES + (object_string.String, object_bool.Boolean),
+                         'a number, STRING or BOOLEAN')
+
+
+def lookup_builtin(name: str) -> Optional[Builtin]:
+  return BUILTINS.get(name)
+
+
+def register_builtin(name: str,
+                     function: Callable[..., Any],
+                     pure: bool = True,
+                     native: bool = True) -> Builtin:
+  if native:
+    minimum, maximum = _arity(function)
+    function = _native(name, function, minimum, maximum)
+  builtin = Builtin(name, function, pure=pure)
+  BUILTINS[name] = builtin
+  return builtin
+
+
+def unregister_builtin(name: str) -> None:
+  del BUILTINS[name]
+
+
+def unbox(value: Object) -> Any:
+  unboxer = _UNBOXERS.get(type(value))
+  return unboxer(value) if unboxer is not None else value
+
+
+def box(value: Any, name: str = '') -> Object:
+  boxer = _BOXERS.get(type(value))
+  if boxer is not None:
+    return boxer(value)
+  if isinstance(value, Object):
+    return value
+  if vector.is_storage(value):
+    return Array(value)
+  if isinstance(value, (list, tuple)):
+    return _box_sequence(value, name)
+  return Error(_UNBOXABLE.format(type(value).__name__, name))
+
+
+def to_number_object(value: Union[int, float]) -> Object:
+  if type(value) == float and value.is_integer():
+    value = int(value)
+  return object_numbers.Integer(value) if type(value) == int \
+      else object_numbers.Float(value)
+
+
+def _native(name: str,
+            function: Callable[..., Any],
+            minimum: int,
+            maximum: float,
+            accepts: Optional[Accepts] = None) -> Callable[..., Object]:
+  def builtin(*args: Object) -> Object:
+    if not minimum <= len(args) <= maximum:
+      return cast(Error, _check_arguments(name, list(args), minimum, maximum))
+
+    values: List[Any] = []
+    for arg in args:
+      if accepts is not None and type(arg) not in accepts[0]:
+        return Error(_WRONG_ARGUMENT_TYPE.format(name, accepts[1],
+                                                 arg.type().name))
+      unboxer = _UNBOXERS.get(type(arg))
+      values.append(unboxer(arg) if unboxer is not None else arg)
+
+    try:
+      result = function(*values)
+    except _HOST_ERRORS as exception:
+      return Error(_INVALID_ARGUMENT.format(name, exception))
+
+    boxer = _BOXERS.get(type(result))
+    return boxer(result) if boxer is not None else box(result, name)
+  return builtin
+
+
+def _arity(function: Callable[..., Any]) -> Tuple[int, float]:
+  from inspect import Parameter, signature
+
+  minimum = 0
+  maximum: float = 0
+  for parameter in signature(function).parameters.values():
+    if parameter.kind == Parameter.VAR_POSITIONAL:
+      maximum = math.inf
+    elif parameter.kind in (Parameter.POSITIONAL_ONLY,
+                            Parameter.POSITIONAL_OR_KEYWORD):
+      maximum += 1
+      if parameter.default is Parameter.empty:
+        minimum += 1
+
+  return minimum, maximum
+
+
+def _box_sequence(values: Iterable[Any], name: str) -> Object:
+  elements = list(values)
+  if not all(type(element) in (int, float, bool) for element in elements):
+    return Error(_UNBOXABLE.format('list', name))
+  return Array(vector.from_values(elements))
+
+
+def _check_arguments(name: str, args: List[Object],
+                     minimum: int, maximum: float) -> Optional[Error]:
+  if minimum <= len(args) <= maximum:
+    return None
+
+  if minimum == maximum:
+    expected = str(minimum)
+  elif maximum == math.inf:
+    expected = f'at least {minimum}'
+  else:
+    expected = f'{minimum} to {maximum}'
+  return Error(_WRONG_ARGUMENTS.format(expected, len(args)))
+
+
+def _numbers(name: str, args: List[Object]) -> Union[List[float], Error]:
+  values: List[float] = []
+  for arg in args:
+    if type(arg) not in _NUMBER_TYPES:
+      return Error(_WRONG_ARGUMENT_TYPE.format(name, 'a number',
+                                               arg.type().name))
+    values.append(cast(object_numbers.Float, arg).value)
+
+  return values
+
+
+def _length(name: str, arg: Object) -> Union[int, Error]:
+  if type(arg) != object_numbers.Integer \
+      or cast(object_numbers.Integer, arg).value < 0:
+    return Error(_WRONG_ARGUMENT_TYPE.format(name, 'a non-negative INTEGER',
+                                             arg.type().name))
+  return cast(object_numbers.Integer, arg).value
+
+
+def _filled(name: str, create: Callable[[int], vector.Storage]) \
+        -> Callable[..., Object]:
+  def builtin(*args: Object) -> Object:
+    error = _check_arguments(name, list(args), 1, 1)
+    if error is not None:
+      return error
+
+    length = _length(name, args[0])
+    if isinstance(length, Error):
+      return length
+    return check_length(length) or Array(create(length))
+  return builtin
+
+
+def _arange(*args: Object) -> Object:
+  error = _check_arguments('arange', list(args), 1, 3)
+  if error is not None:
+    return error
+
+  values = _numbers('arange', list(args))
+  if isinstance(values, Error):
+    return values
+
+  if len(values) == 1:
+    values = [0, values[0]]
+  start, stop, step = values[0], values[1], values[2] if len(values) == 3 else 1
+  if step == 0:
+    return Error(_INVALID_ARGUMENT.format('arange', 'step must not be zero'))
+  try:
+    length = vector.arange_length(start, stop, step)
+  except _HOST_ERRORS as exception:
+    return Error(_INVALID_ARGUMENT.format('arange', exception))
+  return check_length(length) or Array(vector.arange(start, stop, step))
+
+
+def _range(*args: Object) -> Object:
+  error = _check_arguments('range', list(args), 1, 3)
+  if error is not None:
+    return error
+
+  bounds: List[int] = []
+  for arg in args:
+    if type(arg) != object_numbers.Integer:
+      return Error(_WRONG_ARGUMENT_TYPE.format('range', 'an INTEGER',
+                                               arg.type().name))
+    bounds.append(cast(object_numbers.Integer, arg).value)
+
+  if len(bounds) == 3 and bounds[2] == 0:
+    return Error(_INVALID_ARGUMENT.format('range', 'step must not be zero'))
+  return Range(range(*bounds))
+
+
+def _linspace(*args: Object) -> Object:
+  error = _check_arguments('linspace', list(args), 3, 3)
+  if error is not None:
+    return error
+
+  values = _numbers('linspace', list(args[:2]))
+  if isinstance(values, Error):
+    return values
+
+  count = _length('linspace', args[2])
+  if isinstance(count, Error):
+    return count
+  return check_length(count) or Array(vector.linspace(values[0], values[1], count))
+
+
+def _aggregate(name: str,
+               function: Callable[[Iterable[Any]], Any]) -> Callable[..., Any]:
+  def native(*values: Any) -> Any:
+    if len(values) > 1:
+      return function(values)
+    if vector.is_storage(values[0]):
+      return vector.reduce(name, values[0])
+    return function(values[0])
+  return native
+
+
+def _mean(values: Iterable[Any]) -> float:
+  items = list(values)
+  if not items:
+    raise ValueError('mean of an empty range')
+  return math.fsum(items) / len(items)
+
+
+def _str(*args: Object) -> Object:
+  error = _check_arguments('str', list(args), 1, 1)
+  if error is not None:
+    return error
+
+  return object_string.String(args[0].inspect())
+
+
+class Output:
+
+  def __init__(self) -> None:
+    self.lines: List[str] = []
+    self.length = 0
+
+  def write(self, line: str) -> Optional[Error]:
+    error = check_length(self.length + len(line) + 1)
+    if error is not None:
+      return error
+    self.lines.append(line)
+    self.length += len(line) + 1
+    return None
+
+  def text(self) -> str:
+    return ''.join(line + '\n' for line in self.lines)
+
+
+def capture_output(output: Optional[Output]) -> 'Token[Optional[Output]]':
+  return _output.set(output)
+
+
+def release_output(token: 'Token[Optional[Output]]') -> None:
+  _output.reset(token)
+
+
+def _print(*args: Object) -> Object:
+  line = ' '.join(arg.inspect() for arg in args)
+  output = _output.get()
+  if output is None:
+    print(line)
+    return object_null.NULL
+  return output.write(line) or object_null.NULL
+
+
+def _map_arguments(name: str, args: List[Object],
+                   minimum: int, maximum: int) -> Union[Map, Error]:
+  error = _check_arguments(name, args, minimum, maximum)
+  if error is not None:
+    return error
+
+  if type(args[0]) != Map:
+    return Error(_WRONG_ARGUMENT_TYPE.format(name, 'MAP', args[0].type().name))
+  if type(args[1]) not in KEY_TYPES:
+    return Error(_UNUSABLE_KEY.format(args[1].type().name))
+  return cast(Map, args[0])
+
+
+def _get(*args: Object) -> Object:
+  mapping = _map_arguments('get', list(args), 2, 3)
+  if isinstance(mapping, Error):
+    return mapping
+
+  default = args[2] if len(args) == 3 else object_null.NULL
+  return mapping.pairs.get(args[1], default)
+
+
+def _set(*args: Object) -> Object:
+  mapping = _map_arguments('set', list(args), 3, 3)
+  if isinstance(mapping, Error):
+    return mapping
+
+  mapping.pairs[args[1]] = args[2]
+  return mapping
+
+
+def _contains(*args: Object) -> Object:
+  mapping = _map_arguments('contains', list(args), 2, 2)
+  if isinstance(mapping, Error):
+    return mapping
+
+  return object_bool.TRUE if args[1] in mapping.pairs else object_bool.FALSE
+
+
+_UNBOXERS: Dict[Type, Callable[[Any], Any]] = {
+    object_numbers.Integer: lambda integer: integer.value,
+    object_numbers.Float: lambda number: number.value,
+    object_string.String: lambda string: string.value,
+    object_bool.Boolean: lambda boolean: boolean.value,
+    object_null.Null: lambda null: None,
+    Array: lambda array: array.values,
+    Range: lambda range_object: range_object.values,
+}
+
+_BOXERS: Dict[Type, Callable[[Any], Object]] = {
+    int: to_number_object,
+    float: to_number_object,
+    bool: lambda value: object_bool.TRUE if value else object_bool.FALSE,
+    str: object_string.String,
+    type(None): lambda value: object_null.NULL,
+    range: Range,
+}
+
+BUILTINS: Dict[str, Builtin] = {
+    'len': Builtin('len', _native('len', len, 1, 1, _SIZED)),
+    'abs': Builtin('abs', _native('abs', abs, 1, 1, _NUMBERS)),
+    'min': Builtin('min', _native('min', _aggregate('min', min), 1, math.inf,
+                                  _AGGREGATES)),
+    'max': Builtin('max', _native('max', _aggregate('max', max), 1, math.inf,
+                                  _AGGREGATES)),
+    'sum': Builtin('sum', _native('sum', _aggregate('sum', sum), 1, 1, _SEQUENCES)),
+    'mean': Builtin('mean', _native('mean', _aggregate('mean', _mean), 1, 1,
+                                    _SEQUENCES)),
+    'int': Builtin('int', _native('int', int, 1, 1, _CONVERTIBLE)),
+    'float': Builtin('float', _native('float', float, 1, 1, _CONVERTIBLE)),
+    'str': Builtin('str', _str),
+    'print': Builtin('print', _print, pure=False),
+    'zeros': Builtin('zeros', _filled('zeros', vector.zeros)),
+    'ones': Builtin('ones', _filled('ones', vector.ones)),
+    'arange': Builtin('arange', _arange),
+    'linspace': Builtin('linspace', _linspace),
+    'range': Builtin('range', _range),
+    'get': Builtin('get', _get, pure=False),
+    'set': Builtin('set', _set, pure=False),
+    'contains': Builtin('contains', _contains, pure=False),
+}
+
+for _name in ('sqrt', 'exp', 'log', 'sin', 'cos', 'tan', 'floor', 'ceil'):
+  BUILTINS[_name] = Builtin(_name, _native(_name, getattr(math, _name), 1, 1,
+                                           _NUMBERS))
@@ -0,0 +1,518 @@
+from typing import Any, Callable, Dict, List, Mapping, NamedTuple, Optional, Sequence, Type, cast
+
+import lpp.vector as vector
+from lpp.ast.call import Call
+from lpp.ast.block import Block
+from lpp.ast.infix import Infix
+from lpp.ast.bool import Boolean
+from lpp.ast.prefix import Prefix
+from lpp.ast.logical import Logical
+from lpp.object.error import Error
+from lpp.object.builtin import Builtin
+from lpp.ast.program import Program
+from lpp.ast.if_expression import If
+from lpp.ast.number import Float, Integer
+from lpp.ast.indentifier import Identifier
+from lpp.interpreter import Interpreter
+from lpp.ast.node_base import ASTNode
+from lpp.object.object_base import Object
+from lpp.ast.let_statement import LetStatement
+from lpp.object.environment import Environment
+from lpp.builtins import lookup_builtin, to_number_object
+from lpp.ast.expressions_statement import ExpressionStatement
+from lpp.evaluator import (
+    _UNKNOW_IDENTIFIER,
+    _new_error,
+    _evaluate_infix_expression,
+    _evaluate_prefix_expression,
+    evaluate,
+)
+
+import lpp.object.null as object_null
+import lpp.object.bool as object_bool
+import lpp.object.numbers as object_numbers
+
+
+Columns = Mapping[str, Sequence[Any]]
+
+
+class BatchResult(NamedTuple):
+  values: Any
+  errors: Dict[int, Error]
+  vectorized: bool
+
+  @property
+  def rows(self) -> int:
+    return len(self.values)
+
+  def value(self, row: int) -> Optional[Object]:
+    error = self.errors.get(row)
+    if error is not None:
+      return error
+    if type(self.values) == list:
+      return self.values[row]
+    if vector.is_boolean(self.values):
+      return object_bool.TRUE if self.values[row] else object_bool.FALSE
+    return to_number_object(float(self.values[row]))
+
+  def objects(self) -> List[Optional[Object]]:
+    return [self.value(row) for row in range(self.rows)]
+
+
+class CompiledExpression:
+
+  def __init__(self, source: str) -> None:
+    self.source = source
+    self.program = Interpreter.parse(source)
+    self._kernel: Optional[_ProgramKernel]
+    try:
+      self._kernel = _lower_program(self.program)
+    except _Unsupported:
+      self._kernel = None
+
+  @property
+  def vectorized(self) -> bool:
+    return self._kernel is not None
+
+  def evaluate_batch(self, columns: Columns,
+                     rows: Optional[int] = None) -> BatchResult:
+    storages = {name: vector.as_column(values) for name, values in columns.items()}
+    rows = _row_count(storages, rows)
+
+    if self._kernel is not None and not any(
+        vector.has_large_integers(storage) for storage in storages.values()
+        if not vector.is_boolean(storage)):
+      batch = _Batch(storages)
+      try:
+        lane = self._kernel(batch, vector.full(rows, True))
+      except _Unsupported:
+        pass
+      else:
+        return BatchResult(_materialize(lane, rows), batch.errors, True)
+
+    return self._evaluate_rows(columns, storages, rows)
+
+  def _evaluate_rows(self, columns: Columns, storages: Dict[str, vector.Storage],
+                     rows: int) -> BatchResult:
+    kinds = {name: _column_kind(storage) for name, storage in storages.items()}
+    values: List[Optional[Object]] = []
+    errors: Dict[int, Error] = {}
+
+    for row in range(rows):
+      env = Environment()
+      for name, column in columns.items():
+        env.set(name, _box(_Lane(kinds[name], _host_value(column[row]))))
+
+      result = evaluate(self.program, env)
+      if type(result) == Error:
+        errors[row] = cast(Error, result)
+      values.append(result)
+
+    return BatchResult(values, errors, False)
+
+
+def compile_expression(source: str) -> CompiledExpression:
+  return CompiledExpression(source)
+
+
+class _Unsupported(Exception):
+  pass
+
+
+class _Lane(NamedTuple):
+  kind: Type
+  data: Any
+
+
+class _Batch:
+
+  def __init__(self, columns: Dict[str, vector.Storage]) -> None:
+    self.bindings = {name: _Lane(_column_kind(column), column)
+                     for name, column in columns.items()}
+    self.errors: Dict[int, Error] = {}
+
+  def fail(self, active: vector.Storage, error: Error) -> None:
+    for row in vector.indices(active):
+      self.errors.setdefault(row, error)
+
+
+_Kernel = Callable[[_Batch, vector.Storage], _Lane]
+_ProgramKernel = Callable[[_Batch, vector.Storage], Optional[_Lane]]
+
+_NUMBER = object_numbers.Float
+_BOOLEAN = object_bool.Boolean
+_NULL = object_null.Null
+
+_NULL_LANE = _Lane(_NULL, None)
+
+
+def _row_count(columns: Dict[str, vector.Storage], rows: Optional[int]) -> int:
+  lengths = {len(column) for column in columns.values()}
+  if rows is not None:
+    lengths.add(rows)
+
+  if not lengths:
+    raise ValueError('evaluate_batch needs at least one column or a row count')
+  if len(lengths) > 1:
+    raise ValueError(f'columns have different lengths: {sorted(lengths)}')
+  return lengths.pop()
+
+
+def _column_kind(column: vector.Storage) -> Type:
+  return _BOOLEAN if vector.is_boolean(column) else _NUMBER
+
+
+def _materialize(lane: Optional[_Lane], rows: int) -> Any:
+  if lane is None:
+    return [None] * rows
+  if lane.kind is _NULL:
+    return [object_null.NULL] * rows
+  if vector.is_storage(lane.data):
+    return lane.data
+  return vector.full(rows, lane.data)
+
+
+def _host_value(value: Any) -> Any:
+  return value.item() if hasattr(value, 'item') else value
+
+
+def _element(operand: Any, row: int) -> Any:
+  return operand[row] if vector.is_storage(operand) else operand
+
+
+def _box(lane: _Lane) -> Object:
+  if lane.kind is _NUMBER:
+    value = lane.data
+    return to_number_object(value if type(value) is int else float(value))
+  if lane.kind is _BOOLEAN:
+    return object_bool.TRUE if lane.data else object_bool.FALSE
+  return object_null.NULL
+
+
+def _fold(batch: _Batch, active: vector.Storage,
+          result: Object, otherwise: _Lane) -> _Lane:
+  result_type = type(result)
+  if result_type == Error:
+    batch.fail(active, cast(Error, result))
+    return otherwise
+  if result_type in _NUMBER_TYPES:
+    value = cast(object_numbers.Float, result).value
+    if type(value) is int and not -vector.EXACT_LIMIT <= value <= vector.EXACT_LIMIT:
+      raise _Unsupported('integer beyond float precision')
+    return _Lane(_NUMBER, value)
+  if result_type is _BOOLEAN:
+    return _Lane(_BOOLEAN, result is object_bool.TRUE)
+  if result_type is _NULL:
+    return _NULL_LANE
+  raise _Unsupported(result.type().name)
+
+
+def _reject(batch: _Batch, active: vector.Storage,
+            result: Object, otherwise: _Lane) -> _Lane:
+  if type(result) != Error:
+    raise _Unsupported(result.type().name)
+
+  batch.fail(active, cast(Error, result))
+  return otherwise
+
+
+def _truth(lane: _Lane) -> Any:
+  if lane.kind is _BOOLEAN:
+    return lane.data
+  if lane.kind is _NUMBER:
+    if vector.is_storage(lane.data):
+      return vector.binary('!=', lane.data, 0)
+    return lane.data != 0
+  return False
+
+
+def _infix(batch: _Batch, active: vector.Storage,
+           operator: str, left: _Lane, right: _Lane) -> _Lane:
+  if not vector.is_storage(left.data) and not vector.is_storage(right.data):
+    return _fold(batch, active,
+                 _evaluate_infix_expression(operator, _box(left), _box(right)),
+                 left)
+
+  if left.kind is _NUMBER and right.kind is _NUMBER \
+      and operator in _NUMBER_OPERATORS:
+    return _numeric(batch, active, operator, left.data, right.data)
+  if left.kind is _BOOLEAN and right.kind is _BOOLEAN \
+      and operator in vector.LOGICAL_OPERATORS:
+    return _Lane(_BOOLEAN, vector.logical(operator, left.data, right.data))
+
+  return _reject(batch, active,
+                 _evaluate_infix_expression(operator, _SAMPLES[left.kind],
+                                            _SAMPLES[right.kind]),
+                 left)
+
+
+def _numeric(batch: _Batch, active: vector.Storage,
+             operator: str, left: Any, right: Any) -> _Lane:
+  if operator in vector.COMPARISON_OPERATORS:
+    return _Lane(_BOOLEAN, vector.binary(operator, left, right))
+
+  result = vector.binary(operator, left, right)
+  for row in vector.inexact_rows(result, active):
+    value = _evaluate_infix_expression(operator,
+                                       _box(_Lane(_NUMBER, _element(left, row))),
+                                       _box(_Lane(_NUMBER, _element(right, row))))
+    value_type = type(value)
+    if value_type == Error:
+      batch.errors.setdefault(row, cast(Error, value))
+    elif value_type == object_numbers.Float:
+      result[row] = cast(object_numbers.Float, value).value
+    elif value_type == object_numbers.Integer and \
+        abs(cast(object_numbers.Integer, value).value) <= vector.EXACT_LIMIT:
+      result[row] = cast(object_numbers.Integer, value).value
+    else:
+      raise _Unsupported('result beyond float precision')
+  return _Lane(_NUMBER, result)
+
+
+def _prefix(batch: _Batch, active: vector.Storage,
+            operator: str, operand: _Lane) -> _Lane:
+  if not vector.is_storage(operand.data):
+    return _fold(batch, active,
+                 _evaluate_prefix_expression(operator, _box(operand)),
+                 operand)
+
+  if operator == '-' and operand.kind is _NUMBER:
+    return _Lane(_NUMBER, vector.negate(operand.data))
+  if operator == 'not' and operand.kind is _BOOLEAN:
+    return _Lane(_BOOLEAN, vector.invert(operand.data))
+
+  return _fold(batch, active,
+               _evaluate_prefix_expression(operator, _SAMPLES[operand.kind]),
+               operand)
+
+
+def _branch(kernel: Optional[_Kernel], batch: _Batch,
+            active: vector.Storage) -> Optional[_Lane]:
+  if not vector.any_true(active):
+    return None
+  return kernel(batch, active) if kernel is not None else _NULL_LANE
+
+
+def _lower(node: Optional[ASTNode]) -> _Kernel:
+  lowering = _LOWERINGS.get(type(node))
+  if lowering is None:
+    raise _Unsupported(type(node).__name__)
+  return lowering(node)
+
+
+def _lower_program(program: Program) -> _ProgramKernel:
+  steps: List[Callable[[_Batch, vector.Storage], Optional[_Lane]]] = []
+  for statement in program.statements:
+    if type(statement) == LetStatement:
+      steps.append(_lower_let(cast(LetStatement, statement)))
+    else:
+      steps.append(_lower(statement))
+
+  def kernel(batch: _Batch, active: vector.Storage) -> Optional[_Lane]:
+    lane: Optional[_Lane] = None
+    for step in steps:
+      lane = step(batch, active)
+    return lane
+  return kernel
+
+
+def _lower_let(node: LetStatement) -> _ProgramKernel:
+  assert node.name is not None
+  name = node.name.value
+  value = _lower(node.value)
+
+  def kernel(batch: _Batch, active: vector.Storage) -> Optional[_Lane]:
+    batch.bindings[name] = value(batch, active)
+    return None
+  return kernel
+
+
+def _lower_expression_statement(node: ExpressionStatement) -> _Kernel:
+  return _lower(node.expression)
+
+
+def _lower_block(node: Block) -> _Kernel:
+  if not node.statements:
+    raise _Unsupported('empty block')
+  steps = [_lower(statement) for statement in node.statements]
+
+  def kernel(batch: _Batch, active: vector.Storage) -> _Lane:
+    for step in steps:
+      lane = step(batch, active)
+    return lane
+  return kernel
+
+
+def _lower_number(node: Integer) -> _Kernel:
+  lane = _Lane(_NUMBER, node.value)
+  return lambda batch, active: lane
+
+
+def _lower_boolean(node: Boolean) -> _Kernel:
+  lane = _Lane(_BOOLEAN, node.value)
+  return lambda batch, active: lane
+
+
+def _lower_identifier(node: Identifier) -> _Kernel:
+  name = node.value
+
+  def kernel(batch: _Batch, active: vector.Storage) -> _Lane:
+    lane = batch.bindings.get(name)
+    if lane is not None:
+      return lane
+    if lookup_builtin(name) is not None:
+      raise _Unsupported(name)
+
+    batch.fail(active, _new_error(_UNKNOW_IDENTIFIER, [name]))
+    return _NULL_LANE
+  return kernel
+
+
+def _lower_prefix(node: Prefix) -> _Kernel:
+  operator = node.operator
+  right = _lower(node.right)
+
+  def kernel(batch: _Batch, active: vector.Storage) -> _Lane:
+    return _prefix(batch, active, operator, right(batch, active))
+  return kernel
+
+
+def _lower_infix(node: Infix) -> _Kernel:
+  operator = node.operator
+  left = _lower(node.left)
+  right = _lower(node.right)
+
+  def kernel(batch: _Batch, active: vector.Storage) -> _Lane:
+    left_lane = left(batch, active)
+    return _infix(batch, active, operator, left_lane, right(batch, active))
+  return kernel
+
+
+def _lower_logical(node: Logical) -> _Kernel:
+  operator = node.operator
+  short_circuit = operator == 'or'
+  left = _lower(node.left)
+  right = _lower(node.right)
+
+  def kernel(batch: _Batch, active: vector.Storage) -> _Lane:
+    left_lane = left(batch, active)
+    if left_lane.kind is not _BOOLEAN:
+      return _infix(batch, active, operator, left_lane, right(batch, active))
+    if not vector.is_storage(left_lane.data):
+      if left_lane.data is short_circuit:
+        return left_lane
+      return _infix(batch, active, operator, left_lane, right(batch, active))
+
+    evaluated = left_lane.data if operator == 'and' \
+        else vector.invert(left_lane.data)
+    remaining = vector.logical('and', active, evaluated)
+    right_lane = _branch(right, batch, remaining)
+    if right_lane is None:
+      return left_lane
+    return _infix(batch, remaining, operator, left_lane, right_lane)
+  return kernel
+
+
+def _lower_if(node: If) -> _Kernel:
+  condition = _lower(node.condition)
+  consequence = _lower(node.consequence)
+  alternative = _lower(node.alternative) if node.alternative is not None else None
+
+  def kernel(batch: _Batch, active: vector.Storage) -> _Lane:
+    truth = _truth(condition(batch, active))
+    if not vector.is_storage(truth):
+      chosen = consequence if truth else alternative
+      return chosen(batch, active) if chosen is not None else _NULL_LANE
+
+    taken = _branch(consequence, batch, vector.logical('and', active, truth))
+    skipped = _branch(alternative, batch,
+                      vector.logical('and', active, vector.invert(truth)))
+    if taken is None:
+      return skipped if skipped is not None else _NULL_LANE
+    if skipped is None:
+      return taken
+    if taken.kind is not skipped.kind:
+      raise _Unsupported('branches of different types')
+    if taken.kind is _NULL:
+      return _NULL_LANE
+    return _Lane(taken.kind, vector.where(truth, taken.data, skipped.data))
+  return kernel
+
+
+def _lower_call(node: Call) -> _Kernel:
+  builtin = cast(Optional[Builtin], node.builtin)
+  if builtin is None or builtin.batch is None:
+    raise _Unsupported('call')
+
+  function = builtin.batch
+  arguments = [_lower(argument) for argument in node.arguments]
+
+  def kernel(batch: _Batch, active: vector.Storage) -> _Lane:
+    rows = vector.indices(active)
+    columns = [_column_values(argument(batch, active), rows)
+               for argument in arguments]
+    try:
+      results = function(*columns)
+    except (TypeError, ValueError, ArithmeticError):
+      raise _Unsupported(builtin.name)
+    return _gather(batch, len(active), rows, results)
+  return kernel
+
+
+def _column_values(lane: _Lane, rows: List[int]) -> List[Any]:
+  if lane.kind is _NULL:
+    raise _Unsupported('null argument')
+
+  convert = bool if lane.kind is _BOOLEAN else _plain_number
+  if not vector.is_storage(lane.data):
+    return [convert(lane.data)] * len(rows)
+  return [convert(lane.data[row]) for row in rows]
+
+
+def _plain_number(value: Any) -> Any:
+  return value if type(value) is int else float(value)
+
+
+def _gather(batch: _Batch, length: int,
+            rows: List[int], results: List[Object]) -> _Lane:
+  kinds = {type(result) for result in results if type(result) != Error}
+  if kinds <= {_BOOLEAN}:
+    kind, storage = _BOOLEAN, vector.full(length, False)
+  elif kinds <= set(_NUMBER_TYPES):
+    kind, storage = _NUMBER, vector.full(length, 0.0)
+  else:
+    raise _Unsupported('batch result')
+
+  for row, result in zip(rows, results):
+    if type(result) == Error:
+      batch.errors.setdefault(row, cast(Error, result))
+    elif kind is _BOOLEAN:
+      storage[row] = result is object_bool.TRUE
+    else:
+      storage[row] = cast(object_numbers.Float, result).value
+  return _Lane(kind, storage)
+
+
+_NUMBER_TYPES = (object_numbers.Integer, object_numbers.Float)
+
+_NUMBER_OPERATORS = vector.ARITHMETIC_OPERATORS + vector.COMPARISON_OPERATORS
+
+_SAMPLES: Dict[Type, Object] = {
+    _NUMBER: object_numbers.Integer(1),
+    _BOOLEAN: object_bool.TRUE,
+    _NULL: object_null.NULL,
+}
+
+_LOWERINGS: Dict[Type, Callable[[Any], _Kernel]] = {
+    ExpressionStatement: _lower_expression_statement,
+    Block: _lower_block,
+    Integer: _lower_number,
+    Float: _lower_number,
+    Boolean: _lower_boolean,
+    Identifier: _lower_identifier,
+    Prefix: _lower_prefix,
+    Infix: _lower_infix,
+    Logical: _lower_logical,
+    If: _lower_if,
+    Call: _lower_call,
+}
@@ -0,0 +1,325 @@
+from typing import Any, Callable, Dict, Iterator, List, Optional, Type, Union, cast
+
+from lpp.ast.call import Call
+from lpp.ast.block import Block
+from lpp.ast.infix import Infix
+from lpp.ast.bool import Boolean
+from lpp.ast.prefix import Prefix
+from lpp.ast.logical import Logical
+from lpp.object.error import Error
+from lpp.ast.if_expression import If
+from lpp.ast.function import Function
+from lpp.ast.node_base import ASTNode
+from lpp.ast.number import Float, Integer
+from lpp.ast.quickened import GENERIC_NODES
+from lpp.ast.string import StringLiteral
+from lpp.ast.indentifier import Identifier
+from lpp.object.object_base import Object
+from lpp.ast.let_statement import LetStatement
+from lpp.ast.for_statement import ForStatement
+from lpp.object.environment import Environment
+from lpp.ast.while_statement import WhileStatement
+from lpp.ast.return_statement import ReturnStatement
+from lpp.ast.update_statement import UpdateStatement
+from lpp.ast.expressions_statement import ExpressionStatement
+from lpp.evaluator import (
+    NULL,
+    _SHORT_CIRCUIT_VALUES,
+    _apply_function,
+    _bind,
+    _dispatch_infix_expression,
+    _dispatch_prefix_expression,
+    _evaluate_update_statement,
+    _exits_loop,
+    _is_truthy,
+    _iterate,
+    _lookup_identifier,
+    _tick,
+    _to_boolean_object,
+    evaluate,
+)
+
+import lpp.object.string as object_string
+import lpp.object.numbers as object_numbers
+import lpp.object.function as object_function
+import lpp.object.return_object as object_return
+
+
+Code = Callable[[Environment], Optional[Object]]
+
+
+def compile_function(definition: Function) -> Code:
+  assert definition.body is not None
+  return compile_node(definition.body)
+
+
+def compile_loop(node: Union[WhileStatement, ForStatement]) -> Code:
+  if type(node) == ForStatement:
+    assert node.body is not None
+    return compile_node(node.body)
+  return compile_node(node)
+
+
+def compile_node(node: ASTNode) -> Code:
+  node_type = type(node)
+  compiler = _COMPILERS.get(GENERIC_NODES.get(node_type, node_type))
+  if compiler is None:
+    return lambda env: evaluate(node, env)
+
+  return compiler(node)
+
+
+def _compile_expression_statement(node: ExpressionStatement) -> Code:
+  assert node.expression is not None
+  return compile_node(node.expression)
+
+
+def _compile_integer(node: Integer) -> Code:
+  assert node.value is not None
+  boxed = object_numbers.Integer(node.value)
+  return lambda env: boxed
+
+
+def _compile_float(node: Float) -> Code:
+  assert node.value is not None
+  boxed = object_numbers.Float(node.value)
+  return lambda env: boxed
+
+
+def _compile_boolean(node: Boolean) -> Code:
+  assert node.value is not None
+  boxed = _to_boolean_object(node.value)
+  return lambda env: boxed
+
+
+def _compile_string(node: StringLiteral) -> Code:
+  boxed = object_string.intern(node.value)
+  return lambda env: boxed
+
+
+def _compile_identifier(node: Identifier) -> Code:
+  name = node.value
+  return lambda env: _lookup_identifier(name, env)
+
+
+def _compile_prefix(node: Prefix) -> Code:
+  assert node.right is not None
+  right = compile_node(node.right)
+
+  def code(env: Environment) -> Optional[Object]:
+    return _dispatch_prefix_expression(node, cast(Object, right(env)))
+  return code
+
+
+def _compile_infix(node: Infix) -> Code:
+  assert node.left is not None and node.right is not None
+  left = compile_node(node.left)
+  right = compile_node(node.right)
+
+  entries = list(node.cache.entries.items())
+  if len(entries) == 1 and not node.cache.megamorphic:
+    (left_type, right_type), handler = entries[0]
+
+    def guarded(env: Environment) -> Optional[Object]:
+      left_value = cast(Object, left(env))
+      right_value = cast(Object, right(env))
+      if type(left_value) is left_type and type(right_value) is right_type:
+        return handler(left_value, right_value)
+      return _dispatch_infix_expression(node, left_value, right_value)
+    return guarded
+
+  def code(env: Environment) -> Optional[Object]:
+    return _dispatch_infix_expression(node,
+                                      cast(Object, left(env)),
+                                      cast(Object, right(env)))
+  return code
+
+
+def _compile_logical(node: Logical) -> Code:
+  assert node.left is not None and node.right is not None
+  left = compile_node(node.left)
+  right = compile_node(node.right)
+  short_circuit_value = _SHORT_CIRCUIT_VALUES[node.operator]
+
+  def code(env: Environment) -> Optional[Object]:
+    left_value = cast(Object, left(env))
+    node.evaluations += 1
+    if left_value is short_circuit_value:
+      node.short_circuits += 1
+      return left_value
+    return _dispatch_infix_expression(node, left_value, cast(Object, right(env)))
+  return code
+
+
+def _compile_block(node: Block) -> Code:
+  statements: List[Code] = [compile_node(statement)
+                            for statement in node.statements]
+
+  def code(env: Environment) -> Optional[Object]:
+    result: Optional[Object] = None
+    for statement in statements:
+      result = statement(env)
+      if type(result) == object_return.Return or type(result) == Error:
+        return result
+    return result
+  return code
+
+
+def _compile_if(node: If) -> Code:
+  assert node.condition is not None and node.consequence is not None
+  condition = compile_node(node.condition)
+  consequence = compile_node(node.consequence)
+  alternative: Optional[Code] = None
+  if node.alternative is not None:
+    alternative = compile_node(node.alternative)
+
+  def code(env: Environment) -> Optional[Object]:
+    if _is_truthy(cast(Object, condition(env))):
+      return consequence(env)
+    elif alternative is not None:
+      return alternative(env)
+    return NULL
+  return code
+
+
+def _compile_let(node: LetStatement) -> Code:
+  assert node.name is not None and node.value is not None
+  name = node.name.value
+  value = compile_node(node.value)
+
+  def code(env: Environment) -> Optional[Object]:
+    result = value(env)
+    if type(result) == Error:
+      return result
+    _bind(env, name, cast(Object, result))
+    return None
+  return code
+
+
+def _compile_return(node: ReturnStatement) -> Code:
+  assert node.return_value is not None
+  value = compile_node(node.return_value)
+  return lambda env: object_return.Return(cast(Object, value(env)))
+
+
+def _compile_while(node: WhileStatement) -> Code:
+  assert node.condition is not None and node.body is not None
+  condition = compile_node(node.condition)
+  body = compile_node(node.body)
+
+  def code(env: Environment) -> Optional[Object]:
+    while True:
+      result = condition(env)
+      if type(result) == Error:
+        return result
+      if not _is_truthy(cast(Object, result)):
+        return None
+      result = _tick(env) or body(env)
+      if _exits_loop(result):
+        return result
+  return code
+
+
+def _compile_for(node: ForStatement) -> Code:
+  assert node.variable is not None and node.iterable is not None \
+      and node.body is not None
+  name = node.variable.value
+  iterable = compile_node(node.iterable)
+  body = compile_node(node.body)
+
+  def code(env: Environment) -> Optional[Object]:
+    collection = cast(Object, iterable(env))
+    if type(collection) == Error:
+      return collection
+
+    values = _iterate(collection)
+    if type(values) == Error:
+      return cast(Error, values)
+
+    store = env.store
+    for value in cast(Iterator[Object], values):
+      store[name] = value
+      result = _tick(env) or body(env)
+      if _exits_loop(result):
+        return result
+    return None
+  return code
+
+
+def _compile_update(node: UpdateStatement) -> Code:
+  assert node.name is not None
+  name = node.name.value
+  delta = 1 if node.operator == '++' else -1
+
+  def code(env: Environment) -> Optional[Object]:
+    value = env.store.get(name)
+    if type(value) == object_numbers.Integer:
+      env.store[name] = object_numbers.Integer(
+          cast(object_numbers.Integer, value).value + delta)
+      return None
+    return _evaluate_update_statement(node, env)
+  return code
+
+
+def _compile_function(node: Function) -> Code:
+  return lambda env: object_function.Function(node, env)
+
+
+def _compile_call(node: Call) -> Code:
+  arguments: List[Code] = [compile_node(argument)
+                           for argument in node.arguments]
+  if node.builtin is not None:
+    return _compile_builtin_call(node.builtin.function, arguments)
+
+  function = compile_node(node.function)
+
+  def code(env: Environment) -> Optional[Object]:
+    callee = cast(Object, function(env))
+    if type(callee) == Error:
+      return callee
+
+    args: List[Object] = []
+    for argument in arguments:
+      value = cast(Object, argument(env))
+      if type(value) == Error:
+        return value
+      args.append(value)
+
+    return _apply_function(callee, args)
+  return code
+
+
+def _compile_builtin_call(builtin: Callable[..., Object],
+                          arguments: List[Code]) -> Code:
+  def code(env: Environment) -> Optional[Object]:
+    args: List[Object] = []
+    for argument in arguments:
+      value = cast(Object, argument(env))
+      if type(value) == Error:
+        return value
+      args.append(value)
+
+    return builtin(*args)
+  return code
+
+
+_COMPILERS: Dict[Type, Callable[[Any], Code]] = {
+    ExpressionStatement: _compile_expression_statement,
+    Integer: _compile_integer,
+    Float: _compile_float,
+    Boolean: _compile_boolean,
+    StringLiteral: _compile_string,
+    Identifier: _compile_identifier,
+    Prefix: _compile_prefix,
+    Infix: _compile_infix,
+    Logical: _compile_logical,
+    Block: _compile_block,
+    If: _compile_if,
+    LetStatement: _compile_let,
+    ReturnStatement: _compile_return,
+    WhileStatement: _compile_while,
+    ForStatement: _compile_for,
+    UpdateStatement: _compile_update,
+    Function: _compile_function,
+    Call: _compile_call,
+}
@@ -0,0 +1,167 @@
+from threading import Lock
+from collections import OrderedDict
+from typing import Any, FrozenSet, Iterable, List, Mapping, NamedTuple, Optional, Sequence, cast
+
+from lpp.ast.call import Call
+from lpp.ast.walk import walk
+from lpp.object.error import Error
+from lpp.ast.program import Program
+from lpp.modules import ModuleLoader
+from lpp.compiler import Code, compile_node
+from lpp.interpreter import Interpreter
+from lpp.resolver import resolve_builtins
+from lpp.settings import Settings, defaults
+from lpp.limits import Budget, Limits, activate, deactivate, nesting_error
+from lpp.builtins import box
+from lpp.object.object_base import Object
+from lpp.object.environment import Environment
+
+import lpp.object.return_object as object_return
+
+
+DEFAULT_CAPACITY = 256
+
+_SHADOWED_BUILTIN = 'binding {!r} shadows a builtin called by this program; ' \
+    'declare it when compiling'
+
+
+class EngineStats(NamedTuple):
+  size: int
+  capacity: int
+  hits: int
+  misses: int
+  evictions: int
+
+  @property
+  def hit_rate(self) -> float:
+    lookups = self.hits + self.misses
+    return self.hits / lookups if lookups else 0.0
+
+
+class CompiledProgram:
+
+  __slots__ = ('source', 'names', 'program', '_code', '_builtins', '_limits',
+               '_modules', '_settings')
+
+  def __init__(self, source: str,
+               names: FrozenSet[str],
+               limits: Optional[Limits],
+               modules: ModuleLoader,
+               settings: Settings) -> None:
+    program = Interpreter.parse(source)
+    resolve_builtins(program, names, exports=modules.exports)
+    object.__setattr__(self, 'source', source)
+    object.__setattr__(self, 'names', names)
+    object.__setattr__(self, 'program', program)
+    object.__setattr__(self, '_code',
+                       [compile_node(statement) for statement in program.statements])
+    object.__setattr__(self, '_builtins', _called_builtins(program))
+    object.__setattr__(self, '_limits', limits)
+    object.__setattr__(self, '_modules', modules)
+    object.__setattr__(self, '_settings', settings)
+
+  def __setattr__(self, name: str, value: Any) -> None:
+    raise AttributeError(f'{type(self).__name__} is immutable')
+
+  def run(self, bindings: Optional[Mapping[str, Any]] = None,
+          limits: Optional[Limits] = None) -> Optional[Object]:
+    env = Environment()
+    env.modules = self._modules
+    env.settings = self._settings
+    if bindings:
+      shadowed = self._builtins.intersection(bindings)
+      if shadowed:
+        raise ValueError(_SHADOWED_BUILTIN.format(min(shadowed)))
+      for name, value in bindings.items():
+        boxed = box(value, name)
+        if type(boxed) == Error:
+          raise ValueError(cast(Error, boxed).message)
+        env.store[name] = boxed
+
+    limits = limits if limits is not None else self._limits
+    token = activate(limits)
+    try:
+      if limits is None:
+        return _execute(self._code, env)
+
+      env.budget = Budget(limits)
+      env.budget.start()
+      try:
+        return _execute(self._code, env)
+      except RecursionError:
+        return nesting_error()
+    finally:
+      deactivate(token)
+
+
+class Engine:
+
+  def __init__(self,
+               capacity: int = DEFAULT_CAPACITY,
+               limits: Optional[Limits] = Limits(),
+               search_path: Optional[Sequence[str]] = None,
+               settings: Optional[Settings] = None) -> None:
+    if capacity < 1:
+      raise ValueError('Engine capacity must be at least 1')
+
+    self.capacity = capacity
+    self.limits = limits
+    self.modules = ModuleLoader(search_path)
+    self.settings = settings if settings is not None else defaults.copy()
+    self._programs: 'OrderedDict[Any, CompiledProgram]' = OrderedDict()
+    self._hits = 0
+    self._misses = 0
+    self._evictions = 0
+    self._lock = Lock()
+
+  def compile(self, source: str, names: Iterable[str] = ()) -> CompiledProgram:
+    declared = frozenset(names)
+    key = (source, declared)
+    with self._lock:
+      compiled = self._programs.get(key)
+      if compiled is not None:
+        self._programs.move_to_end(key)
+        self._hits += 1
+        return compiled
+      self._misses += 1
+
+    compiled = CompiledProgram(source, declared, self.limits, self.modules,
+                               self.settings)
+    with self._lock:
+      self._programs[key] = compiled
+      self._programs.move_to_end(key)
+      while len(self._programs) > self.capacity:
+        self._programs.popitem(last=False)
+        self._evictions += 1
+    return compiled
+
+  def run(self, source: str,
+          bindings: Optional[Mapping[str, Any]] = None,
+          limits: Optional[Limits] = None) -> Optional[Object]:
+    return self.compile(source, bindings or ()).run(bindings, limits)
+
+  def stats(self) -> EngineStats:
+    with self._lock:
+      return EngineStats(len(self._programs), self.capacity,
+                         self._hits, self._misses, self._evictions)
+
+  def clear(self) -> None:
+    with self._lock:
+      self._programs.clear()
+
+
+def _execute(code: List[Code], env: Environment) -> Optional[Object]:
+  result: Optional[Object] = None
+  for statement in code:
+    result = statement(env)
+    if type(result) == object_return.Return:
+      return cast(object_return.Return, result).value
+    if type(result) == Error:
+      return result
+
+  return result
+
+
+def _called_builtins(program: Program) -> FrozenSet[str]:
+  return frozenset(cast(Call, node).builtin.name for node in walk(program)
+                   if type(node) == Call and cast(Call, node).builtin is not None)
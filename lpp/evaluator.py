@@ -1,123 +1,536 @@
-from typing import Any, List, Optional, Type, cast
-
+from functools import partial
+from typing import Any, Callable, Dict, Iterator, List, Optional, Type, Union, cast
+from operator import add, eq, ge, gt, le, lt, ne, sub
+
+import lpp.limits as limits
+import lpp.vector as vector
+import lpp.tiering as tiering
+import lpp.settings as settings
+import lpp.memoization as memoization
+from lpp.ast.call import Call
+from lpp.ast.map import MapLiteral
+from lpp.ast.array import ArrayLiteral
 from lpp.ast.block import Block
 from lpp.ast.infix import Infix
 from lpp.ast.bool import Boolean
 from lpp.ast.prefix import Prefix
+from lpp.ast.logical import Logical
 from lpp.object.error import Error
+from lpp.object.array import Array
+from lpp.object.map import KEY_TYPES, Map
+from lpp.object.range import Range
+from lpp.object.builtin import Builtin
+from lpp.builtins import lookup_builtin, to_number_object
 from lpp.ast.program import Program
 from lpp.ast.if_expression import If
+from lpp.ast.function import Function
+from lpp.ast.string import StringLiteral
 from lpp.ast.number import Float, Integer
-from lpp.ast.node_base import ASTNode, Statement
+from lpp.ast.indentifier import Identifier
+from lpp.ast.let_statement import LetStatement
+from lpp.ast.for_statement import ForStatement
+from lpp.ast.import_statement import ImportStatement
+from lpp.object.environment import Environment
+from lpp.ast.node_base import ASTNode, Expression
+from lpp.ast.while_statement import WhileStatement
 from lpp.ast.return_statement import ReturnStatement
+from lpp.ast.update_statement import UpdateStatement
 from lpp.object.object_base import Object, ObjectType
 from lpp.ast.expressions_statement import ExpressionStatement
+from lpp.ast.quickened import (
+    GENERIC_NODES,
+    BooleanIf,
+    IntAddInt,
+    IntGtInt,
+    IntLtInt,
+    IntMulInt,
+    IntSubInt,
+    QuickBoolean,
+    QuickFloat,
+    QuickInfix,
+    QuickInteger,
+)
 
 import lpp.object.null as object_null
 import lpp.object.bool as object_bool
 import lpp.object.string as object_string
 import lpp.object.numbers as object_numbers
+import lpp.object.function as object_function
 import lpp.object.return_object as object_return
 
 
-TRUE = object_bool.Boolean(True)
-FALSE = object_bool.Boolean(False)
-NULL = object_null.Null()
+TRUE = object_bool.TRUE
+FALSE = object_bool.FALSE
+NULL = object_null.NULL
 
 
 _TYPE_MISMATCH = 'Type mismatch: {} {} {}'
 _UNKNOW_PREFIX_OPERATION = 'Unknown operator: {}{}'
 _UNKNOW_INFIX_OPERATION = 'Unknown operator: {} {} {}'
+_UNKNOW_IDENTIFIER = 'Identifier not found: {}'
+_NOT_A_FUNCTION = 'Not a function: {}'
+_WRONG_ARGUMENTS = 'Wrong number of arguments: expected {}, got {}'
+_ARRAY_ELEMENT = 'Array elements must be numbers, got {}'
+_SHAPE_MISMATCH = 'Shape mismatch: {}'
+_DIVISION_BY_ZERO = 'Division by zero'
+_NUMERIC_OVERFLOW = 'Numeric overflow: {} {} {}'
+_NO_REAL_POWER = 'Power has no real result: {} ^ {}'
+_UNUSABLE_KEY = 'Unusable as map key: {}'
+_NOT_ITERABLE = 'Cannot iterate over {}'
 
 
-def evaluate(node: ASTNode) -> Optional[Object]:
-  node_type: Type = type(node)
+InfixHandler = Callable[[Object, Object], Object]
+PrefixHandler = Callable[[Object], Object]
 
-  if node_type == Program:
-    node = cast(Program, node)
 
-    return _evaluate_program(node)
-  elif node_type == ExpressionStatement:
-    node = cast(ExpressionStatement, node)
+QUICKEN_THRESHOLD = 16
+MAX_DEOPTS = 4
 
-    assert node.expression is not None
-    return evaluate(node.expression)
+def set_adaptive(enabled: bool) -> None:
+  settings.defaults.adaptive = enabled
 
-  elif node_type == Integer:
-    node = cast(Integer, node)
 
-    assert node.value is not None
-    return object_numbers.Integer(node.value)
+def evaluate(node: ASTNode, env: Optional[Environment] = None) -> Optional[Object]:
+  if env is None:
+    env = Environment()
 
-  elif node_type == Float:
-    node = cast(Float, node)
+  evaluator = _EVALUATORS.get(type(node))
+  if evaluator is None:
+    return None
 
-    assert node.value is not None
-    return object_numbers.Float(node.value)
+  budget = env.budget
+  if budget is not None:
+    budget.fuel -= 1
+    if budget.fuel < 0:
+      error = budget.refuel()
+      if error is not None:
+        return error
 
-  elif node_type == Boolean:
-    node = cast(Boolean, node)
+  return evaluator(node, env)
 
-    assert node.value is not None
-    return _to_boolean_object(node.value)
 
-  elif node_type == Prefix:
-    node = cast(Prefix, node)
+def _evaluate_expression_statement(node: ExpressionStatement,
+                                   env: Environment) -> Optional[Object]:
+  assert node.expression is not None
+  return evaluate(node.expression, env)
 
-    assert node.right is not None
-    right = evaluate(node.right)
-    assert right is not None
-    return _evaluate_prefix_expression(node.operator, right)
 
-  elif node_type == Infix:
-    node = cast(Infix, node)
+def _evaluate_integer(node: Integer, env: Environment) -> Object:
+  assert node.value is not None
+  if env.settings.adaptive and _is_hot(node):
+    _quicken_literal(node, QuickInteger, object_numbers.Integer(node.value))
+  return object_numbers.Integer(node.value)
+
+
+def _evaluate_float(node: Float, env: Environment) -> Object:
+  assert node.value is not None
+  if env.settings.adaptive and _is_hot(node):
+    _quicken_literal(node, QuickFloat, object_numbers.Float(node.value))
+  return object_numbers.Float(node.value)
+
+
+def _evaluate_boolean(node: Boolean, env: Environment) -> Object:
+  assert node.value is not None
+  if env.settings.adaptive and _is_hot(node):
+    _quicken_literal(node, QuickBoolean, _to_boolean_object(node.value))
+  return _to_boolean_object(node.value)
 
-    assert node.right is not None and node.left is not None
-    left = evaluate(node.left)
-    right = evaluate(node.right)
-    assert right is not None and left is not None
-    return _evaluate_infix_expression(node.operator, left, right)
 
-  elif node_type == Block:
-    node = cast(Block, node)
+def _evaluate_string(node: StringLiteral, env: Environment) -> Object:
+  boxed = node.boxed
+  if boxed is None:
+    boxed = node.boxed = object_string.intern(node.value)
+  return cast(Object, boxed)
 
-    return _evaluate_block_statements(node)
-  elif node_type == If:
-    node = cast(If, node)
 
-    return _evaluate_if_expression(node)
+def _evaluate_identifier(node: Identifier, env: Environment) -> Object:
+  return _lookup_identifier(node.value, env)
 
-  elif node_type == ReturnStatement:
-    node = cast(ReturnStatement, node)
 
-    assert node.return_value is not None
-    value = evaluate(node.return_value)
-    
+def _lookup_identifier(name: str, env: Environment) -> Object:
+  value = env.get(name)
+  if value is None:
+    value = lookup_builtin(name)
+    if value is None:
+      return _new_error(_UNKNOW_IDENTIFIER, [name])
+
+  return value
+
+
+def _evaluate_array(node: ArrayLiteral, env: Environment) -> Object:
+  elements: List[Object] = []
+  for element in node.elements:
+    value = evaluate(element, env)
+
     assert value is not None
-    return object_return.Return(value)
+    if type(value) == Error:
+      return value
+    elements.append(value)
+
+  return _build_array(elements)
+
+
+def _build_array(elements: List[Object]) -> Object:
+  values: List[Any] = []
+  for element in elements:
+    if type(element) not in _NUMBER_TYPES:
+      return _new_error(_ARRAY_ELEMENT, [element.type().name])
+    values.append(cast(object_numbers.Float, element).value)
+
+  return Array(vector.from_values(values))
+
+
+def _evaluate_map(node: MapLiteral, env: Environment) -> Object:
+  entries: List[Object] = []
+  for key, value in zip(node.keys, node.values):
+    for expression in (key, value):
+      evaluated = evaluate(expression, env)
+
+      assert evaluated is not None
+      if type(evaluated) == Error:
+        return evaluated
+      entries.append(evaluated)
+
+  return _build_map(entries)
+
+
+def _build_map(entries: List[Object]) -> Object:
+  pairs: Dict[Object, Object] = {}
+  for index in range(0, len(entries), 2):
+    key = entries[index]
+    if type(key) not in KEY_TYPES:
+      return _new_error(_UNUSABLE_KEY, [key.type().name])
+    pairs[key] = entries[index + 1]
+
+  return Map(pairs)
 
+
+def _evaluate_prefix(node: Prefix, env: Environment) -> Object:
+  assert node.right is not None
+  right = evaluate(node.right, env)
+  assert right is not None
+  return _dispatch_prefix_expression(node, right)
+
+
+def _evaluate_infix(node: Infix, env: Environment) -> Object:
+  assert node.right is not None and node.left is not None
+  left = evaluate(node.left, env)
+  right = evaluate(node.right, env)
+  assert right is not None and left is not None
+  if env.settings.adaptive and _is_hot(node):
+    _quicken_infix(node, type(left), type(right))
+  return _dispatch_infix_expression(node, left, right)
+
+
+def _evaluate_logical(node: Logical, env: Environment) -> Object:
+  assert node.right is not None and node.left is not None
+  left = evaluate(node.left, env)
+  assert left is not None
+
+  node.evaluations += 1
+  if left is _SHORT_CIRCUIT_VALUES[node.operator]:
+    node.short_circuits += 1
+    return left
+
+  right = evaluate(node.right, env)
+  assert right is not None
+  return _dispatch_infix_expression(node, left, right)
+
+
+def _evaluate_let_statement(node: LetStatement,
+                            env: Environment) -> Optional[Object]:
+  assert node.name is not None and node.value is not None
+  value = evaluate(node.value, env)
+
+  assert value is not None
+  if type(value) == Error:
+    return value
+
+  _bind(env, node.name.value, value)
   return None
 
 
-def _evaluate_if_expression(if_expression: If) -> Optional[Object]:
+def _bind(env: Environment, name: str, value: Object) -> None:
+  previous = env.store.get(name)
+  if type(previous) == object_function.Function or \
+      (previous is None and lookup_builtin(name) is not None):
+    memoization.invalidate(env.settings)
+  env.store[name] = value
+
+
+def _evaluate_return_statement(node: ReturnStatement, env: Environment) -> Object:
+  assert node.return_value is not None
+  value = evaluate(node.return_value, env)
+
+  assert value is not None
+  return object_return.Return(value)
+
+
+def _evaluate_while_statement(node: WhileStatement,
+                              env: Environment) -> Optional[Object]:
+  assert node.condition is not None and node.body is not None
+  while node.compiled is None:
+    condition = evaluate(node.condition, env)
+    assert condition is not None
+    if type(condition) == Error:
+      return condition
+    if not _is_truthy(condition):
+      return None
+
+    result = evaluate(node.body, env)
+    if _exits_loop(result):
+      return result
+    node.back_edges += 1
+    if node.back_edges >= env.settings.tier_threshold:
+      tiering.compile_loop(node)
+
+  return node.compiled(env)
+
+
+def _evaluate_for_statement(node: ForStatement,
+                            env: Environment) -> Optional[Object]:
+  assert node.variable is not None and node.iterable is not None \
+      and node.body is not None
+  iterable = evaluate(node.iterable, env)
+  assert iterable is not None
+  if type(iterable) == Error:
+    return iterable
+
+  values = _iterate(iterable)
+  if type(values) == Error:
+    return cast(Error, values)
+
+  name = node.variable.value
+  for value in cast(Iterator[Object], values):
+    env.set(name, value)
+    body = node.compiled
+    if body is None:
+      result = evaluate(node.body, env)
+      node.back_edges += 1
+      if node.back_edges >= env.settings.tier_threshold:
+        tiering.compile_loop(node)
+    else:
+      result = _tick(env) or body(env)
+
+    if _exits_loop(result):
+      return result
+
+  return None
+
+
+def _evaluate_update_statement(node: UpdateStatement,
+                               env: Environment) -> Optional[Object]:
+  assert node.name is not None
+  name = node.name.value
+  scope: Optional[Environment] = env
+  while scope is not None:
+    value = scope.store.get(name)
+    if value is not None:
+      if type(value) not in _NUMBER_TYPES:
+        return _new_error(_UNKNOW_PREFIX_OPERATION,
+                          [value.type().name, node.operator])
+      delta = 1 if node.operator == '++' else -1
+      scope.store[name] = to_number_object(
+          cast(object_numbers.Integer, value).value + delta)
+      return None
+    scope = scope.outer
+
+  return _new_error(_UNKNOW_IDENTIFIER, [name])
+
+
+def _evaluate_import_statement(node: ImportStatement,
+                               env: Environment) -> Optional[Object]:
+  modules = env.modules
+  if modules is None:
+    from lpp.modules import loader_for
+    modules = loader_for(env)
+
+  namespace = modules.load(node.module, env.budget)
+  if type(namespace) == Error:
+    return cast(Error, namespace)
+
+  for name, value in cast(Environment, namespace).store.items():
+    _bind(env, name, value)
+  return None
+
+
+def _iterate(iterable: Object) -> Union[Iterator[Object], Error]:
+  iterator = _ITERATORS.get(type(iterable))
+  if iterator is None:
+    return _new_error(_NOT_ITERABLE, [iterable.type().name])
+  return iterator(iterable)
+
+
+def _array_elements(array: Array) -> Iterator[Object]:
+  if vector.is_boolean(array.values):
+    return map(_to_boolean_object, array.values)
+  return (to_number_object(float(value)) for value in array.values)
+
+
+def _exits_loop(result: Optional[Object]) -> bool:
+  return result is not None and (type(result) == object_return.Return
+                                 or type(result) == Error)
+
+
+def _tick(env: Environment) -> Optional[Error]:
+  budget = env.budget
+  if budget is None:
+    return None
+
+  budget.fuel -= 1
+  if budget.fuel < 0:
+    return budget.refuel()
+  return None
+
+
+def _evaluate_function(node: Function, env: Environment) -> Object:
+  return object_function.Function(node, env)
+
+
+def _evaluate_call(node: Call, env: Environment) -> Object:
+  builtin = node.builtin
+  if builtin is not None:
+    return _call_builtin(builtin, node, env)
+
+  function = evaluate(node.function, env)
+
+  assert function is not None
+  if type(function) == Error:
+    return function
+
+  args: List[Object] = []
+  for argument in node.arguments:
+    value = evaluate(argument, env)
+
+    assert value is not None
+    if type(value) == Error:
+      return value
+    args.append(value)
+
+  return _apply_function(function, args)
+
+
+def _call_builtin(builtin: Builtin, node: Call, env: Environment) -> Object:
+  args: List[Object] = []
+  for argument in node.arguments:
+    value = evaluate(argument, env)
+
+    assert value is not None
+    if type(value) == Error:
+      return value
+    args.append(value)
+
+  return builtin.function(*args)
+
+
+def _check_call(function: Object, args: List[Object]) -> Optional[Error]:
+  if type(function) == Builtin:
+    return None
+  if type(function) != object_function.Function:
+    return _new_error(_NOT_A_FUNCTION, [function.type().name])
+
+  parameters = cast(object_function.Function, function).definition.parameters
+  if len(args) != len(parameters):
+    return _new_error(_WRONG_ARGUMENTS, [len(parameters), len(args)])
+
+  return None
+
+
+def _function_environment(function: object_function.Function,
+                          args: List[Object]) -> Environment:
+  env = Environment(function.env)
+  for parameter, value in zip(function.definition.parameters, args):
+    env.store[parameter.value] = value
+
+  return env
+
+
+def _apply_function(function: Object, args: List[Object]) -> Object:
+  error = _check_call(function, args)
+  if error is not None:
+    return error
+  if type(function) == Builtin:
+    return cast(Builtin, function).function(*args)
+
+  function = cast(object_function.Function, function)
+  budget = function.env.budget
+  if budget is None:
+    return _invoke_function(function, args)
+
+  error = budget.enter_call()
+  if error is not None:
+    return error
+
+  try:
+    return _invoke_function(function, args)
+  except RecursionError:
+    return limits.call_depth_error(budget.depth)
+  finally:
+    budget.depth -= 1
+
+
+def _invoke_function(function: object_function.Function,
+                     args: List[Object]) -> Object:
+  definition = function.definition
+  options = function.env.settings
+
+  if function.memo_generation != options.memo_generation:
+    memoization.prepare(function)
+
+  memo = function.memo
+  key: Optional[memoization.MemoKey] = None
+  if memo is not None:
+    key = memoization.memo_key(args)
+    if key is not None:
+      cached = memo.get(key)
+      if cached is not None:
+        return cached
+
+  env = _function_environment(function, args)
+  code = definition.compiled
+  if code is None:
+    definition.calls += 1
+    if definition.calls >= options.tier_threshold and not definition.tier_requested:
+      tiering.request_tier_up(definition, options.tier_in_background)
+    result = _unwrap_return_value(evaluate(function.body, env))
+  else:
+    result = _unwrap_return_value(code(env))
+
+  if key is not None and memoization.cacheable(result):
+    cast(memoization.MemoCache, memo).put(key, result)
+  return result
+
+
+def _unwrap_return_value(result: Optional[Object]) -> Object:
+  if type(result) == object_return.Return:
+    return cast(object_return.Return, result).value
+
+  return result if result is not None else NULL
+
+
+def _evaluate_if_expression(if_expression: If,
+                            env: Environment) -> Optional[Object]:
   assert if_expression is not None
-  condition = evaluate(if_expression.condition)
+  condition = evaluate(if_expression.condition, env)
 
   assert condition is not None
+  if env.settings.adaptive and _is_hot(if_expression) and type(condition) is object_bool.Boolean:
+    if_expression.__class__ = BooleanIf
+
   if _is_truthy(condition):
     assert if_expression.consequence is not None
-    return evaluate(if_expression.consequence)
+    return evaluate(if_expression.consequence, env)
   elif if_expression.alternative is not None:
-    return evaluate(if_expression.alternative)
+    return evaluate(if_expression.alternative, env)
   else:
     return NULL
 
 
-def _evaluate_block_statements(block: Block) -> Optional[Object]:
+def _evaluate_block_statements(block: Block, env: Environment) -> Optional[Object]:
   result: Optional[Object] = None
 
   for statement in block.statements:
-    result = evaluate(statement)
+    result = evaluate(statement, env)
 
     if result is not None and (result.type() == ObjectType.RETURN \
                 or result.type() == ObjectType.ERROR):
@@ -125,10 +538,10 @@ def _evaluate_block_statements(block: Block) -> Optional[Object]:
 
   return result
 
-def _evaluate_program(program: Program) -> Optional[Object]:
+def _evaluate_program(program: Program, env: Environment) -> Optional[Object]:
   result: Optional[Object] = None
   for statement in program.statements:
-    result = evaluate(statement)
+    result = evaluate(statement, env)
 
     if type(result) == object_return.Return:
       result = cast(object_return.Return, result)
@@ -138,13 +551,89 @@ def _evaluate_program(program: Program) -> Optional[Object]:
   return result
 
 
-def _evaluate_statements(statements: List[Statement]) -> Optional[Object]:
-  result: Optional[Object] = None
+def _is_hot(node: Expression) -> bool:
+  node.executions += 1
+  return node.executions >= QUICKEN_THRESHOLD and node.deopts < MAX_DEOPTS
 
-  for statement in statements:
-    result = evaluate(statement)
 
-  return result
+def _quicken_literal(node: Expression, quick_type: Type, boxed: Object) -> None:
+  cast(QuickInteger, node).boxed = boxed
+  node.__class__ = quick_type
+
+
+def _quicken_infix(node: Infix, left_type: Type, right_type: Type) -> None:
+  if node.cache.megamorphic:
+    return
+
+  if left_type is object_numbers.Integer and right_type is object_numbers.Integer \
+      and node.operator in _INT_INT_NODES:
+    node.__class__ = _INT_INT_NODES[node.operator]
+    return
+
+  handler = _resolve_infix_handler(node.operator, left_type, right_type)
+  cast(QuickInfix, node).guard = (left_type, right_type, handler)
+  node.__class__ = QuickInfix
+
+
+def _deoptimize(node: Expression) -> None:
+  node.__class__ = GENERIC_NODES[type(node)]
+  node.executions = 0
+  node.deopts += 1
+
+
+def _evaluate_quick_literal(node: QuickInteger, env: Environment) -> Object:
+  return node.boxed
+
+
+def _evaluate_quick_infix(node: QuickInfix, env: Environment) -> Object:
+  left = evaluate(node.left, env)
+  right = evaluate(node.right, env)
+  assert right is not None and left is not None
+
+  guard_left, guard_right, handler = node.guard
+  if type(left) is guard_left and type(right) is guard_right:
+    return handler(left, right)
+
+  _deoptimize(node)
+  return _dispatch_infix_expression(node, left, right)
+
+
+def _int_int_evaluator(operation: Callable[[int, int], Any],
+                       box: Callable[[Any], Object]) \
+        -> Callable[[Infix, Environment], Object]:
+  def evaluator(node: Infix, env: Environment) -> Object:
+    left = evaluate(node.left, env)
+    right = evaluate(node.right, env)
+    assert right is not None and left is not None
+
+    if type(left) is object_numbers.Integer and type(right) is object_numbers.Integer:
+      return box(operation(cast(object_numbers.Integer, left).value,
+                           cast(object_numbers.Integer, right).value))
+
+    _deoptimize(node)
+    return _dispatch_infix_expression(node, left, right)
+  return evaluator
+
+
+def _evaluate_boolean_if(node: BooleanIf, env: Environment) -> Optional[Object]:
+  condition = evaluate(node.condition, env)
+
+  if condition is TRUE:
+    assert node.consequence is not None
+    return evaluate(node.consequence, env)
+  elif condition is FALSE:
+    if node.alternative is not None:
+      return evaluate(node.alternative, env)
+    return NULL
+
+  _deoptimize(node)
+  assert condition is not None
+  if _is_truthy(condition):
+    assert node.consequence is not None
+    return evaluate(node.consequence, env)
+  elif node.alternative is not None:
+    return evaluate(node.alternative, env)
+  return NULL
 
 
 def _is_truthy(obj: Object) -> bool:
@@ -163,8 +652,7 @@ def _is_truthy(obj: Object) -> bool:
     if obj.value == 0:
       return False
   if obj.type() == ObjectType.STRING:
-    obj = cast(object_string.String, obj)
-    if obj.value == '':
+    if len(cast(object_string.String, obj)) == 0:
       return False
   return True
 
@@ -184,27 +672,97 @@ def _evaluate_bang_operator_expression(right: Object) -> Object:
   return FALSE
 
 
-def _evaluate_infix_expression(operator: str,
+def _dispatch_infix_expression(node: Infix,
                                left: Object,
                                right: Object) -> Object:
-  if left.type() == ObjectType.INTEGER or left.type() == ObjectType.FLOAT:
-    if right.type() == ObjectType.INTEGER or right.type() == ObjectType.FLOAT:
-      return _evaluate_number_infix_expression(operator, left, right)
-  if left.type() == ObjectType.BOOLEAN and right.type() == ObjectType.BOOLEAN:
-    if operator == '==':
-      return _to_boolean_object(left is right)
-    if operator == '!=':
-      return _to_boolean_object(left is not right)
-    if operator == 'and':
-      return _to_boolean_object(left is TRUE and right is TRUE)
-    if operator == 'or':
-      return _to_boolean_object(left is TRUE or right is TRUE)
+  cache = node.cache
+  key = (type(left), type(right))
+  handler = cache.entries.get(key)
+
+  if handler is None:
+    cache.misses += 1
+    handler = _resolve_infix_handler(node.operator, key[0], key[1])
+    cache.record(key, handler)
+  else:
+    cache.hits += 1
+
+  return handler(left, right)
+
+
+def _dispatch_prefix_expression(node: Prefix, right: Object) -> Object:
+  cache = node.cache
+  key = type(right)
+  handler = cache.entries.get(key)
 
+  if handler is None:
+    cache.misses += 1
+    handler = _resolve_prefix_handler(node.operator, key)
+    cache.record(key, handler)
+  else:
+    cache.hits += 1
+
+  return handler(right)
+
+
+def _evaluate_infix_expression(operator: str,
+                               left: Object,
+                               right: Object) -> Object:
+  handler = _resolve_infix_handler(operator, type(left), type(right))
+  return handler(left, right)
+
+
+def _resolve_infix_handler(operator: str,
+                           left_type: Type,
+                           right_type: Type) -> InfixHandler:
+  handler: Optional[InfixHandler] = None
+
+  if left_type in _NUMBER_TYPES and right_type in _NUMBER_TYPES:
+    handler = _NUMBER_INFIX_HANDLERS.get(operator)
+    if handler is None:
+      return partial(_unknown_infix_operator, operator)
+  elif left_type is object_bool.Boolean and right_type is object_bool.Boolean:
+    handler = _BOOLEAN_INFIX_HANDLERS.get(operator)
+  elif left_type is object_string.String and right_type is object_string.String:
+    handler = _STRING_INFIX_HANDLERS.get(operator)
+  elif (left_type is Array and right_type in _ARRAY_OPERAND_TYPES) \
+      or (right_type is Array and left_type in _NUMBER_TYPES):
+    if operator in _ARRAY_OPERATORS:
+      return partial(_array_infix, operator)
+  elif left_type is Error:
+    return lambda left, right: left
+  elif right_type is Error:
+    return lambda left, right: right
+
+  if handler is not None:
+    return handler
+
+  return partial(_invalid_infix_operands, operator)
+
+
+def _invalid_infix_operands(operator: str, left: Object, right: Object) -> Error:
   if left.type() != right.type():
     return _new_error(_TYPE_MISMATCH, [left.type().name,
-                                              operator,
-                                              right.type().name])
+                                       operator,
+                                       right.type().name])
+
+  return _unknown_infix_operator(operator, left, right)
+
+
+def _array_infix(operator: str, left: Object, right: Object) -> Object:
+  try:
+    return Array(vector.binary(operator, _vector_operand(left),
+                               _vector_operand(right)))
+  except ValueError as exception:
+    return _new_error(_SHAPE_MISMATCH, [exception])
+
+
+def _vector_operand(operand: Object) -> vector.Operand:
+  if type(operand) == Array:
+    return cast(Array, operand).values
+  return cast(object_numbers.Float, operand).value
+
 
+def _unknown_infix_operator(operator: str, left: Object, right: Object) -> Error:
   return _new_error(_UNKNOW_INFIX_OPERATION, [left.type().name,
                                               operator,
                                               right.type().name])
@@ -217,65 +775,226 @@ def _evaluate_minus_operator_expression(right: Object) -> Object:
   if type(right) == object_numbers.Float:
     right = cast(object_numbers.Float, right)
     return object_numbers.Float(-right.value)
+  if type(right) == Array:
+    return Array(vector.negate(cast(Array, right).values))
   return _new_error(_UNKNOW_PREFIX_OPERATION, ['-', right.type().name])
 
 
-def _evaluate_number_infix_expression(operator: str,
-                                      left: Object,
-                                      right: Object) -> Object:
-  left_value = cast(object_numbers.Integer, left).value \
-      if left.type() == ObjectType.INTEGER \
-      else cast(object_numbers.Float, left).value
-
-  right_value = cast(object_numbers.Integer, right).value \
-      if right.type() == ObjectType.INTEGER \
-      else cast(object_numbers.Float, right).value
-
-  result = None
-
-  if operator == '+':
-    result = left_value + right_value
-  if operator == '-':
-    result = left_value - right_value
-  if operator == '/':
-    result = left_value / right_value
-  if operator == '*':
-    result = left_value * right_value
-  if operator == '^':
+def _number_arithmetic(operator: str,
+                       operation: Callable[[Any, Any], Any]) -> InfixHandler:
+  def handler(left: Object, right: Object) -> Object:
+    try:
+      return to_number_object(operation(cast(object_numbers.Integer, left).value,
+                                         cast(object_numbers.Integer, right).value))
+    except OverflowError:
+      return _overflow_error(operator, left, right)
+  return handler
+
+
+def _number_quotient(left: Object, right: Object) -> Object:
+  right_value = cast(object_numbers.Integer, right).value
+  if right_value == 0:
+    return _new_error(_DIVISION_BY_ZERO, [])
+
+  try:
+    return to_number_object(cast(object_numbers.Integer, left).value / right_value)
+  except OverflowError:
+    return _overflow_error('/', left, right)
+
+
+def _number_product(left: Object, right: Object) -> Object:
+  left_value = cast(object_numbers.Integer, left).value
+  right_value = cast(object_numbers.Integer, right).value
+  if type(left_value) is int and type(right_value) is int:
+    return _multiply_integers(left_value, right_value)
+
+  try:
+    return to_number_object(left_value * right_value)
+  except OverflowError:
+    return _overflow_error('*', left, right)
+
+
+def _number_power(left: Object, right: Object) -> Object:
+  left_value = cast(object_numbers.Integer, left).value
+  right_value = cast(object_numbers.Integer, right).value
+  if type(left_value) is int and type(right_value) is int and right_value > 0:
+    bits = _integer_bits()
+    if bits is not None and (left_value.bit_length() - 1) * right_value >= bits:
+      return limits.integer_size_error(bits)
+
+  try:
     result = left_value ** right_value
+  except ZeroDivisionError:
+    return _new_error(_DIVISION_BY_ZERO, [])
+  except OverflowError:
+    return _overflow_error('^', left, right)
 
-  if result:
-    if type(result) == float and result.is_integer():
-      result = int(result)
-    return object_numbers.Integer(result) if type(result) == int \
-        else object_numbers.Float(result)
-
-  if operator == '<':
-    return _to_boolean_object(left_value < right_value)
-  if operator == '<=':
-    return _to_boolean_object(left_value <= right_value)
-  if operator == '>':
-    return _to_boolean_object(left_value > right_value)
-  if operator == '>=':
-    return _to_boolean_object(left_value >= right_value)
-  if operator == '==':
-    return _to_boolean_object(left_value == right_value)
-  if operator == '!=':
-    return _to_boolean_object(left_value != right_value)
+  if type(result) is complex:
+    return _new_error(_NO_REAL_POWER, [left_value, right_value])
+  return to_number_object(result)
 
-  return _new_error(_UNKNOW_INFIX_OPERATION, [left.type().name,
-                                              operator,
-                                              right.type().name])
+
+def _multiply_integers(left: int, right: int) -> Object:
+  bits = _integer_bits()
+  if bits is not None and left.bit_length() + right.bit_length() > bits + 1:
+    return limits.integer_size_error(bits)
+
+  return object_numbers.Integer(left * right)
+
+
+def _overflow_error(operator: str, left: Object, right: Object) -> Error:
+  return _new_error(_NUMERIC_OVERFLOW, [left.type().name, operator, right.type().name])
+
+
+def _integer_bits() -> Optional[int]:
+  active = limits.active()
+  return active.max_integer_bits if active is not None else None
+
+
+def _number_comparison(operation: Callable[[Any, Any], bool]) -> InfixHandler:
+  def handler(left: Object, right: Object) -> Object:
+    return _to_boolean_object(operation(cast(object_numbers.Integer, left).value,
+                                        cast(object_numbers.Integer, right).value))
+  return handler
+
+
+def _string_concat(left: Object, right: Object) -> Object:
+  left_string = cast(object_string.String, left)
+  right_string = cast(object_string.String, right)
+  return limits.check_length(len(left_string) + len(right_string)) \
+      or object_string.concat(left_string, right_string)
+
+
+def _string_comparison(operation: Callable[[Any, Any], bool]) -> InfixHandler:
+  def handler(left: Object, right: Object) -> Object:
+    return _to_boolean_object(operation(cast(object_string.String, left).value,
+                                        cast(object_string.String, right).value))
+  return handler
+
+
+def _string_equality(equal: bool) -> InfixHandler:
+  def handler(left: Object, right: Object) -> Object:
+    left_string = cast(object_string.String, left)
+    right_string = cast(object_string.String, right)
+    if left_string is right_string:
+      return _to_boolean_object(equal)
+    if len(left_string) != len(right_string):
+      return _to_boolean_object(not equal)
+    return _to_boolean_object((left_string.value == right_string.value) == equal)
+  return handler
 
 
 def _evaluate_prefix_expression(operator: str, right: Object) -> Object:
-  if operator == 'not':
-    return _evaluate_bang_operator_expression(right)
+  return _resolve_prefix_handler(operator, type(right))(right)
+
+
+def _resolve_prefix_handler(operator: str, right_type: Type) -> PrefixHandler:
+  if right_type is Error:
+    return lambda right: right
+  elif operator == 'not':
+    return _evaluate_bang_operator_expression
   elif operator == '-':
-    return _evaluate_minus_operator_expression(right)
+    return _evaluate_minus_operator_expression
   else:
-    return _new_error(_UNKNOW_PREFIX_OPERATION, [operator, right.type().name])
+    return partial(_unknown_prefix_operator, operator)
+
+
+def _unknown_prefix_operator(operator: str, right: Object) -> Error:
+  return _new_error(_UNKNOW_PREFIX_OPERATION, [operator, right.type().name])
 
 
 def _new_error(message: str, args: List[Any]) -> Error:
-  return Error(message.format(*args))
\ No newline at end of file
+  return Error(message.format(*args))
+
+
+_NUMBER_TYPES = (object_numbers.Integer, object_numbers.Float)
+
+_ARRAY_OPERAND_TYPES = (Array, object_numbers.Integer, object_numbers.Float)
+
+_ARRAY_OPERATORS = vector.ARITHMETIC_OPERATORS + vector.COMPARISON_OPERATORS
+
+_NUMBER_INFIX_HANDLERS: Dict[str, InfixHandler] = {
+    '+': _number_arithmetic('+', add),
+    '-': _number_arithmetic('-', sub),
+    '/': _number_quotient,
+    '*': _number_product,
+    '^': _number_power,
+    '<': _number_comparison(lt),
+    '<=': _number_comparison(le),
+    '>': _number_comparison(gt),
+    '>=': _number_comparison(ge),
+    '==': _number_comparison(eq),
+    '!=': _number_comparison(ne),
+}
+
+_BOOLEAN_INFIX_HANDLERS: Dict[str, InfixHandler] = {
+    '==': lambda left, right: _to_boolean_object(left is right),
+    '!=': lambda left, right: _to_boolean_object(left is not right),
+    'and': lambda left, right: _to_boolean_object(left is TRUE and right is TRUE),
+    'or': lambda left, right: _to_boolean_object(left is TRUE or right is TRUE),
+}
+
+_STRING_INFIX_HANDLERS: Dict[str, InfixHandler] = {
+    '+': _string_concat,
+    '==': _string_equality(True),
+    '!=': _string_equality(False),
+    '<': _string_comparison(lt),
+    '<=': _string_comparison(le),
+    '>': _string_comparison(gt),
+    '>=': _string_comparison(ge),
+}
+
+_SHORT_CIRCUIT_VALUES: Dict[str, Object] = {
+    'and': FALSE,
+    'or': TRUE,
+}
+
+_ITERATORS: Dict[Type, Callable[[Any], Iterator[Object]]] = {
+    Range: lambda range_object: map(object_numbers.Integer, range_object.values),
+    Array: _array_elements,
+    object_string.String: lambda string: map(object_string.intern, string.value),
+    Map: lambda mapping: iter(list(mapping.pairs)),
+}
+
+_INT_INT_NODES: Dict[str, Type] = {
+    '+': IntAddInt,
+    '-': IntSubInt,
+    '*': IntMulInt,
+    '<': IntLtInt,
+    '>': IntGtInt,
+}
+
+_EVALUATORS: Dict[Type, Callable[[Any, Environment], Optional[Object]]] = {
+    Program: _evaluate_program,
+    ExpressionStatement: _evaluate_expression_statement,
+    Integer: _evaluate_integer,
+    Float: _evaluate_float,
+    Boolean: _evaluate_boolean,
+    StringLiteral: _evaluate_string,
+    ArrayLiteral: _evaluate_array,
+    MapLiteral: _evaluate_map,
+    Identifier: _evaluate_identifier,
+    Prefix: _evaluate_prefix,
+    Infix: _evaluate_infix,
+    Logical: _evaluate_logical,
+    Block: _evaluate_block_statements,
+    If: _evaluate_if_expression,
+    LetStatement: _evaluate_let_statement,
+    ReturnStatement: _evaluate_return_statement,
+    WhileStatement: _evaluate_while_statement,
+    ForStatement: _evaluate_for_statement,
+    UpdateStatement: _evaluate_update_statement,
+    ImportStatement: _evaluate_import_statement,
+    Function: _evaluate_function,
+    Call: _evaluate_call,
+    QuickInteger: _evaluate_quick_literal,
+    QuickFloat: _evaluate_quick_literal,
+    QuickBoolean: _evaluate_quick_literal,
+    QuickInfix: _evaluate_quick_infix,
+    IntAddInt: _int_int_evaluator(add, object_numbers.Integer),
+    IntSubInt: _int_int_evaluator(sub, object_numbers.Integer),
+    IntMulInt: _int_int_evaluator(_multiply_integers, lambda result: result),
+    IntLtInt: _int_int_evaluator(lt, _to_boolean_object),
+    IntGtInt: _int_int_evaluator(gt, _to_boolean_object),
+    BooleanIf: _evaluate_boolean_if,
+}
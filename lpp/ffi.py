@@ -0,0 +1,214 @@
+from itertools import chain, repeat
+from inspect import Parameter, signature
+from typing import (Any, Callable, Iterable, List, NamedTuple, Optional, Sequence,
+                    Tuple, Type, TypeVar, cast, get_args, get_origin, get_type_hints)
+
+import lpp.vector as vector
+from lpp.object.error import Error
+from lpp.object.array import Array
+from lpp.object.builtin import Builtin
+from lpp.object.object_base import Object
+from lpp.builtins import (
+    BUILTINS,
+    _HOST_ERRORS,
+    _INVALID_ARGUMENT,
+    _WRONG_ARGUMENT_TYPE,
+    _check_arguments,
+    box,
+    unbox,
+    unregister_builtin,
+)
+
+import lpp.object.bool as object_bool
+import lpp.object.string as object_string
+import lpp.object.numbers as object_numbers
+
+
+HostFunction = TypeVar('HostFunction', bound=Callable[..., Any])
+
+_BATCH_LENGTH = 'batch function returned {} results for {} rows'
+_NOT_A_SEQUENCE = 'batch parameter {} must be annotated as a sequence, got {}'
+
+_FFI_ERRORS = _HOST_ERRORS + (LookupError,)
+
+
+class Converter(NamedTuple):
+  accepts: Optional[Tuple[Type, ...]]
+  expected: str
+  convert: Callable[[Any], Any]
+  element: Callable[[Any], Any]
+
+
+def expose(function: Optional[HostFunction] = None,
+           name: Optional[str] = None,
+           pure: bool = False,
+           batch: bool = False) -> Any:
+  def register(host: HostFunction) -> HostFunction:
+    builtin = host_builtin(host, name or host.__name__, pure=pure, batch=batch)
+    BUILTINS[builtin.name] = builtin
+    return host
+
+  return register(function) if function is not None else register
+
+
+def unexpose(name: str) -> None:
+  unregister_builtin(name)
+
+
+def host_builtin(function: Callable[..., Any],
+                 name: str,
+                 pure: bool = False,
+                 batch: bool = False) -> Builtin:
+  hints = get_type_hints(function)
+  converters: List[Converter] = []
+  variadic: Optional[Converter] = None
+  minimum = 0
+
+  for parameter in signature(function).parameters.values():
+    hint = hints.get(parameter.name, Any)
+    if batch:
+      hint = _element_hint(parameter.name, hint)
+
+    if parameter.kind == Parameter.VAR_POSITIONAL:
+      variadic = _converter(hint)
+    elif parameter.kind in (Parameter.POSITIONAL_ONLY,
+                            Parameter.POSITIONAL_OR_KEYWORD):
+      converters.append(_converter(hint))
+      if parameter.default is Parameter.empty:
+        minimum += 1
+
+  maximum = float('inf') if variadic is not None else len(converters)
+  call = _scalar_call(function, name, converters, variadic, minimum, maximum, batch)
+  columns = _batch_call(function, name, converters, variadic, minimum, maximum) \
+      if batch else None
+  return Builtin(name, call, pure=pure, batch=columns)
+
+
+def _scalar_call(function: Callable[..., Any],
+                 name: str,
+                 converters: List[Converter],
+                 variadic: Optional[Converter],
+                 minimum: int,
+                 maximum: float,
+                 batch: bool) -> Callable[..., Object]:
+  def call(*args: Object) -> Object:
+    if not minimum <= len(args) <= maximum:
+      return cast(Error, _check_arguments(name, list(args), minimum, maximum))
+
+    values: List[Any] = []
+    for converter, arg in zip(_converters(converters, variadic), args):
+      if converter.accepts is not None and type(arg) not in converter.accepts:
+        return Error(_WRONG_ARGUMENT_TYPE.format(name, converter.expected,
+                                                 arg.type().name))
+      values.append(converter.convert(arg))
+
+    try:
+      if batch:
+        result = _batch_results(function(*[[value] for value in values]), 1)[0]
+      else:
+        result = function(*values)
+    except _FFI_ERRORS as exception:
+      return Error(_INVALID_ARGUMENT.format(name, exception))
+
+    return box(result, name)
+  return call
+
+
+def _batch_call(function: Callable[..., Any],
+                name: str,
+                converters: List[Converter],
+                variadic: Optional[Converter],
+                minimum: int,
+                maximum: float) -> Callable[..., List[Object]]:
+  def call(*columns: Sequence[Any]) -> List[Object]:
+    if not minimum <= len(columns) <= maximum:
+      raise TypeError(name)
+
+    rows = len(columns[0]) if columns else 0
+    values = [[converter.element(value) for value in column]
+              for converter, column in zip(_converters(converters, variadic),
+                                           columns)]
+    try:
+      results = _batch_results(function(*values), rows)
+    except _FFI_ERRORS as exception:
+      return [Error(_INVALID_ARGUMENT.format(name, exception))] * rows
+
+    return [box(result, name) for result in results]
+  return call
+
+
+def _converters(converters: List[Converter],
+                variadic: Optional[Converter]) -> Iterable[Converter]:
+  if variadic is None:
+    return converters
+  return chain(converters, repeat(variadic))
+
+
+def _batch_results(results: Any, rows: int) -> Sequence[Any]:
+  if not vector.is_storage(results):
+    results = list(results)
+  if len(results) != rows:
+    raise ValueError(_BATCH_LENGTH.format(len(results), rows))
+  return results
+
+
+def _element_hint(name: str, hint: Any) -> Any:
+  if hint is Any:
+    return Any
+  if get_origin(hint) not in _SEQUENCE_ORIGINS:
+    raise TypeError(_NOT_A_SEQUENCE.format(name, hint))
+
+  arguments = get_args(hint)
+  return arguments[0] if arguments else Any
+
+
+def _converter(hint: Any) -> Converter:
+  converter = _CONVERTERS.get(hint)
+  if converter is not None:
+    return converter
+  if hint in _SEQUENCE_ORIGINS or get_origin(hint) in _SEQUENCE_ORIGINS:
+    return _SEQUENCE
+  return _ANY
+
+
+def _integral(value: Any) -> int:
+  if type(value) is bool or float(value) != int(value):
+    raise TypeError(value)
+  return int(value)
+
+
+def _real(value: Any) -> float:
+  if type(value) is bool:
+    raise TypeError(value)
+  return float(value)
+
+
+def _boolean(value: Any) -> bool:
+  if type(value) is not bool:
+    raise TypeError(value)
+  return value
+
+
+def _unsupported(value: Any) -> Any:
+  raise TypeError(value)
+
+
+_NUMBER_TYPES = (object_numbers.Integer, object_numbers.Float)
+
+_SEQUENCE_ORIGINS = (list, tuple, Sequence, get_origin(Sequence[Any]))
+
+_ANY = Converter(None, 'any value', unbox, lambda value: value)
+
+_SEQUENCE = Converter((Array,), 'ARRAY',
+                      lambda array: vector.to_list(array.values), _unsupported)
+
+_CONVERTERS = {
+    int: Converter((object_numbers.Integer,), 'an INTEGER',
+                   lambda integer: integer.value, _integral),
+    float: Converter(_NUMBER_TYPES, 'a number',
+                     lambda number: float(number.value), _real),
+    bool: Converter((object_bool.Boolean,), 'a BOOLEAN',
+                    lambda boolean: boolean.value, _boolean),
+    str: Converter((object_string.String,), 'a STRING',
+                   lambda string: string.value, _unsupported),
+}
@@ -0,0 +1,74 @@
+from typing import Any, Callable, Dict, NamedTuple, Tuple
+
+from lpp.ast.walk import walk
+from lpp.ast.node_base import ASTNode
+
+
+POLYMORPHIC_LIMIT = 4
+
+
+class InlineCache:
+
+  def __init__(self) -> None:
+    self.entries: Dict[Any, Callable] = {}
+    self.hits = 0
+    self.misses = 0
+    self.megamorphic = False
+
+  def __reduce__(self) -> Tuple[type, Tuple[()]]:
+    return InlineCache, ()
+
+  def record(self, key: Any, handler: Callable) -> None:
+    if self.megamorphic:
+      return
+
+    if len(self.entries) >= POLYMORPHIC_LIMIT:
+      self.megamorphic = True
+      return
+
+    self.entries[key] = handler
+
+  def reset(self) -> None:
+    self.entries.clear()
+    self.hits = 0
+    self.misses = 0
+    self.megamorphic = False
+
+
+class CacheStats(NamedTuple):
+  nodes: int
+  hits: int
+  misses: int
+  polymorphic: int
+  megamorphic: int
+
+  @property
+  def hit_rate(self) -> float:
+    lookups = self.hits + self.misses
+    return self.hits / lookups if lookups else 0.0
+
+
+def collect_cache_stats(node: ASTNode) -> CacheStats:
+  nodes = hits = misses = polymorphic = megamorphic = 0
+
+  for child in walk(node):
+    cache = getattr(child, 'cache', None)
+    if not isinstance(cache, InlineCache):
+      continue
+
+    nodes += 1
+    hits += cache.hits
+    misses += cache.misses
+    if cache.megamorphic:
+      megamorphic += 1
+    elif len(cache.entries) > 1:
+      polymorphic += 1
+
+  return CacheStats(nodes, hits, misses, polymorphic, megamorphic)
+
+
+def reset_caches(node: ASTNode) -> None:
+  for child in walk(node):
+    cache = getattr(child, 'cache', None)
+    if isinstance(cache, InlineCache):
+      cache.reset()
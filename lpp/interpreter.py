@@ -0,0 +1,98 @@
+import sys
+import sysconfig
+from threading import RLock
+from typing import Any, Dict, List, Optional, Sequence, Set
+
+from lpp.lexer import Lexer
+from lpp.parser import Parser
+from lpp.evaluator import evaluate
+from lpp.resolver import resolve_builtins
+from lpp.settings import Settings, defaults
+from lpp.limits import Budget, Limits, activate, deactivate, nesting_error
+from lpp.ast.program import Program
+from lpp.modules import ModuleLoader, default_loader
+from lpp.ast.node_base import ASTNode
+from lpp.object.object_base import Object
+from lpp.object.environment import Environment
+
+
+def free_threaded() -> bool:
+  if not sysconfig.get_config_var('Py_GIL_DISABLED'):
+    return False
+
+  is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+  return is_gil_enabled is None or not is_gil_enabled()
+
+
+class ParseError(Exception):
+
+  def __init__(self, errors: List[str]) -> None:
+    super().__init__('\n'.join(errors))
+    self.errors = errors
+
+
+class Interpreter:
+
+  def __init__(self,
+               env: Optional[Environment] = None,
+               limits: Optional[Limits] = Limits(),
+               search_path: Optional[Sequence[str]] = None,
+               settings: Optional[Settings] = None) -> None:
+    self.globals = env if env is not None else Environment()
+    self.limits = limits
+    self.budget = Budget(limits) if limits is not None else None
+    self.modules = ModuleLoader(search_path)
+    self.settings = settings if settings is not None else defaults.copy()
+    self.globals.budget = self.budget
+    self.globals.modules = self.modules
+    self.globals.settings = self.settings
+    self.evaluations = 0
+    self._lock = RLock()
+
+  @staticmethod
+  def parse(source: str, env: Optional[Environment] = None) -> Program:
+    parser: Parser = Parser(Lexer(source))
+    program: Program = parser.parse_program()
+    if parser.errors:
+      raise ParseError(parser.errors)
+
+    modules = env.modules if env is not None and env.modules is not None \
+        else default_loader()
+    shadowed: Set[str] = set()
+    while env is not None:
+      shadowed.update(env.store)
+      env = env.outer
+    resolve_builtins(program, shadowed, exports=modules.exports)
+    return program
+
+  def evaluate(self, node: ASTNode,
+               env: Optional[Environment] = None) -> Optional[Object]:
+    scope = env if env is not None else self.globals
+    with self._lock:
+      self.evaluations += 1
+      token = activate(self.limits)
+      try:
+        if self.budget is None:
+          return evaluate(node, scope)
+
+        self.budget.start()
+        try:
+          return evaluate(node, scope)
+        except RecursionError:
+          return nesting_error()
+      finally:
+        deactivate(token)
+
+  def run(self, source: str,
+          env: Optional[Environment] = None) -> Optional[Object]:
+    scope = env if env is not None else self.globals
+    return self.evaluate(self.parse(source, scope), scope)
+
+  def __getstate__(self) -> Dict[str, Any]:
+    state = self.__dict__.copy()
+    del state['_lock']
+    return state
+
+  def __setstate__(self, state: Dict[str, Any]) -> None:
+    self.__dict__.update(state)
+    self._lock = RLock()
@@ -1,7 +1,13 @@
-from re import match
-from typing import Dict
-
-from lpp.utils.const import TOKENS
+from typing import Dict, List
+
+from lpp.utils.const import (
+    INITIAL_TOKEN_CHARACTERS,
+    LETTER_INITIALS,
+    LETTERS,
+    STRING_TERMINATORS,
+    TOKENS,
+    TWO_CHARACTER_TOKENS,
+)
 from lpp.utils.type import TokenType
 from lpp.token import Token, lookup_token_type
 
@@ -16,19 +22,19 @@ class Lexer:
     self._read_character()
 
   def _is_initial_token(self, character: str) -> bool:
-    return bool(match(r'^[=<>!+-]$', character))
+    return character in INITIAL_TOKEN_CHARACTERS
 
   def _is_letter(self, character: str) -> bool:
-    return bool(match(r'^[a-záéíóúA-ZÁÉÍÓÚ0-9\_]$', character))
+    return character in LETTERS
 
   def _is_letter_initial(self, character: str) -> bool:
-    return bool(match(r'^[a-zA-Z\_]$', character))
+    return character in LETTER_INITIALS
 
   def _is_number(self, character: str) -> bool:
-    return bool(match(r'^\d$', character))
+    return character.isdecimal()
 
   def _is_str(self, character: str) -> bool:
-    return bool(match(r'^\'$', character))
+    return character == "'"
 
   def _next_charaacter(self) -> str:
     if self._read_position >= len(self._source):
@@ -41,7 +47,7 @@ class Lexer:
     try:
       if self._is_initial_token(self._character):
         character_token = f'{self._character}{self._next_charaacter()}'
-        if len(character_token) == 2 and character_token in TOKENS:
+        if character_token in TWO_CHARACTER_TOKENS:
           self._read_character()
           self._character = character_token
       if self._character in TOKENS:
@@ -85,7 +91,7 @@ class Lexer:
 
     while self._is_number(self._character):
       self._read_character()
-      if match(r'^\.$', self._character):
+      if self._character == '.':
         if is_float:
           is_error = True
         self._read_character()
@@ -98,12 +104,35 @@ class Lexer:
     initial_position = self._position
     self._read_character()
     while not self._is_str(self._character):
-      if match(r'^$', self._character):
+      if self._character in STRING_TERMINATORS:
         raise Exception(self._source[initial_position: self._position])
       self._read_character()
     self._read_character()
     return self._source[initial_position: self._position]
 
   def _skip_whitespaces(self) -> None:
-    while match(r'^\s$', self._character):
+    while self._character.isspace():
       self._read_character()
+
+
+class TokenStream(Lexer):
+
+  def __init__(self, tokens: List[Token]) -> None:
+    self._tokens = tokens
+    self._index = 0
+
+  def next_token(self) -> Token:
+    if self._index >= len(self._tokens):
+      return self._tokens[-1]
+
+    token = self._tokens[self._index]
+    self._index += 1
+    return token
+
+
+def tokenize(source: str) -> List[Token]:
+  lexer = Lexer(source)
+  tokens = [lexer.next_token()]
+  while tokens[-1].token_type != TokenType.EOF:
+    tokens.append(lexer.next_token())
+  return tokens
@@ -0,0 +1,137 @@
+import sys
+from time import monotonic
+from contextvars import ContextVar, Token
+from typing import NamedTuple, Optional
+
+from lpp.object.error import Error, ErrorKind
+
+
+CHECK_INTERVAL = 1024
+FRAMES_PER_CALL = 32
+HOST_FRAMES = 1_000
+MAX_HOST_FRAMES = 1_000_000
+
+_STEP_LIMIT = 'Step limit exceeded: {} steps'
+_TIMEOUT = 'Time limit exceeded: {}s'
+_CALL_DEPTH = 'Call depth exceeded: {} calls'
+_INTEGER_SIZE = 'Integer too large: result exceeds {} bits'
+_LENGTH = 'Result too long: length {} exceeds {}'
+_NESTING = 'Nesting too deep for the host stack'
+
+
+class Limits(NamedTuple):
+  max_steps: Optional[int] = 10_000_000
+  timeout: Optional[float] = None
+  max_call_depth: Optional[int] = 1_000
+  max_integer_bits: Optional[int] = 1 << 16
+  max_length: Optional[int] = 10_000_000
+
+
+class Budget:
+
+  def __init__(self, limits: Limits) -> None:
+    self.limits = limits
+    self.depth = 0
+    self.fuel = 0
+    self._used = 0
+    self._granted = 0
+    self._deadline: Optional[float] = None
+    self._exhausted: Optional[Error] = None
+
+  @property
+  def steps(self) -> int:
+    return self._used + self._granted - max(self.fuel, 0)
+
+  def start(self) -> None:
+    timeout = self.limits.timeout
+    self.depth = 0
+    self.fuel = 0
+    self._used = 0
+    self._granted = 0
+    self._deadline = monotonic() + timeout if timeout is not None else None
+    self._exhausted = None
+    _reserve_frames(self.limits.max_call_depth)
+
+  def refuel(self) -> Optional[Error]:
+    if self._exhausted is not None:
+      self.fuel = 0
+      return self._exhausted
+
+    self._used += self._granted
+    max_steps = self.limits.max_steps
+    if max_steps is not None and self._used >= max_steps:
+      return self._exhaust(Error(_STEP_LIMIT.format(max_steps),
+                                 ErrorKind.STEP_LIMIT))
+    if self._deadline is not None and monotonic() >= self._deadline:
+      return self._exhaust(Error(_TIMEOUT.format(self.limits.timeout),
+                                 ErrorKind.TIMEOUT))
+
+    grant = CHECK_INTERVAL
+    if max_steps is not None:
+      grant = min(grant, max_steps - self._used)
+    self._granted = grant
+    self.fuel = grant - 1
+    return None
+
+  def enter_call(self) -> Optional[Error]:
+    self.fuel -= 1
+    if self.fuel < 0:
+      error = self.refuel()
+      if error is not None:
+        return error
+
+    max_call_depth = self.limits.max_call_depth
+    if max_call_depth is not None and self.depth >= max_call_depth:
+      return call_depth_error(max_call_depth)
+
+    self.depth += 1
+    return None
+
+  def _exhaust(self, error: Error) -> Error:
+    self._granted = 0
+    self.fuel = 0
+    self._exhausted = error
+    return error
+
+
+_active: 'ContextVar[Optional[Limits]]' = ContextVar('lpp_limits', default=Limits())
+
+
+def activate(limits: Optional[Limits]) -> 'Token[Optional[Limits]]':
+  return _active.set(limits)
+
+
+def deactivate(token: 'Token[Optional[Limits]]') -> None:
+  _active.reset(token)
+
+
+def active() -> Optional[Limits]:
+  return _active.get()
+
+
+def _reserve_frames(max_call_depth: Optional[int]) -> None:
+  if max_call_depth is None:
+    return
+
+  frames = min(max_call_depth * FRAMES_PER_CALL + HOST_FRAMES, MAX_HOST_FRAMES)
+  if sys.getrecursionlimit() < frames:
+    sys.setrecursionlimit(frames)
+
+
+def call_depth_error(depth: int) -> Error:
+  return Error(_CALL_DEPTH.format(depth), ErrorKind.CALL_DEPTH)
+
+
+def nesting_error() -> Error:
+  return Error(_NESTING, ErrorKind.CALL_DEPTH)
+
+
+def integer_size_error(bits: int) -> Error:
+  return Error(_INTEGER_SIZE.format(bits), ErrorKind.INTEGER_SIZE)
+
+
+def check_length(length: int) -> Optional[Error]:
+  limits = _active.get()
+  if limits is None or limits.max_length is None or length <= limits.max_length:
+    return None
+  return Error(_LENGTH.format(length, limits.max_length), ErrorKind.LENGTH)
@@ -0,0 +1,147 @@
+from threading import Lock
+from collections import OrderedDict
+from typing import Any, List, NamedTuple, Optional, Set, Tuple
+
+import lpp.settings as settings
+from lpp.settings import Settings
+from lpp.object.object_base import Object
+from lpp.purity import analyze_purity
+from lpp.builtins import lookup_builtin
+
+import lpp.object.null as object_null
+import lpp.object.array as object_array
+import lpp.object.range as object_range
+import lpp.object.bool as object_bool
+import lpp.object.string as object_string
+import lpp.object.numbers as object_numbers
+import lpp.object.function as object_function
+
+
+MemoKey = Tuple[Any, ...]
+
+
+class MemoStats(NamedTuple):
+  size: int
+  max_size: int
+  hits: int
+  misses: int
+  evictions: int
+
+
+class MemoCache:
+
+  def __init__(self, max_size: int) -> None:
+    self.max_size = max_size
+    self.hits = 0
+    self.misses = 0
+    self.evictions = 0
+    self._entries: 'OrderedDict[MemoKey, Object]' = OrderedDict()
+    self._lock = Lock()
+
+  def get(self, key: MemoKey) -> Optional[Object]:
+    with self._lock:
+      value = self._entries.get(key)
+      if value is None:
+        self.misses += 1
+        return None
+
+      self._entries.move_to_end(key)
+      self.hits += 1
+      return value
+
+  def put(self, key: MemoKey, value: Object) -> None:
+    with self._lock:
+      self._entries[key] = value
+      self._entries.move_to_end(key)
+      while len(self._entries) > self.max_size:
+        self._entries.popitem(last=False)
+        self.evictions += 1
+
+  def stats(self) -> MemoStats:
+    return MemoStats(len(self._entries), self.max_size,
+                     self.hits, self.misses, self.evictions)
+
+
+def configure(memoize_all: Optional[bool] = None,
+              size: Optional[int] = None) -> None:
+  defaults = settings.defaults
+  if memoize_all is not None:
+    defaults.memoize_all = memoize_all
+  if size is not None:
+    defaults.memo_size = size
+  defaults.memo_generation += 1
+
+
+def invalidate(options: Settings) -> None:
+  options.memo_generation += 1
+  options.memo_cleared = options.memo_generation
+
+
+def prepare(function: object_function.Function) -> Optional[MemoCache]:
+  options = function.env.settings
+  current = options.memo_generation
+  purity = analyze_purity(function.definition)
+  if not (options.memoize_all or purity.pragma) or not _is_pure(function, set()):
+    function.memo = None
+  elif function.memo is None or function.memo_generation < options.memo_cleared:
+    function.memo = MemoCache(options.memo_size)
+
+  function.memo_generation = current
+  return function.memo
+
+
+def memo_key(args: List[Object]) -> Optional[MemoKey]:
+  key: List[Any] = []
+  for arg in args:
+    arg_type = type(arg)
+    if arg_type not in _HASHABLE_TYPES:
+      return None
+    key.append((arg_type, getattr(arg, 'value', None)))
+
+  return tuple(key)
+
+
+def cacheable(result: Object) -> bool:
+  return type(result) in _IMMUTABLE_TYPES
+
+
+def stats(function: object_function.Function) -> Optional[MemoStats]:
+  return function.memo.stats() if function.memo is not None else None
+
+
+def _is_pure(function: object_function.Function,
+             seen: Set[object_function.Function]) -> bool:
+  purity = analyze_purity(function.definition)
+  if not purity.pure:
+    return False
+
+  seen.add(function)
+  for name in purity.callees:
+    callee = function.env.get(name)
+    builtin = lookup_builtin(name)
+    if callee is None and builtin is not None:
+      if not builtin.pure:
+        return False
+      continue
+    if type(callee) != object_function.Function:
+      return False
+    if callee in seen:
+      continue
+    if not _is_pure(callee, seen):
+      return False
+
+  return True
+
+
+_HASHABLE_TYPES = (
+    object_numbers.Integer,
+    object_numbers.Float,
+    object_bool.Boolean,
+    object_string.String,
+    object_null.Null,
+)
+
+_IMMUTABLE_TYPES = _HASHABLE_TYPES + (
+    object_array.Array,
+    object_range.Range,
+)
@@ -0,0 +1,337 @@
+import os
+from threading import RLock
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Union, cast
+
+from lpp.lexer import Lexer
+from lpp.parser import Parser
+from lpp.limits import Budget
+from lpp.object.error import Error
+from lpp.evaluator import evaluate
+from lpp.ast.program import Program
+from lpp.resolver import resolve_builtins
+from lpp.ast.let_statement import LetStatement
+from lpp.object.environment import Environment
+from lpp.ast.import_statement import ImportStatement
+
+
+SOURCE_SUFFIX = '.lpp'
+CACHE_DIRECTORY = '__lppcache__'
+CACHE_SUFFIX = '.lppc'
+CACHE_VERSION = 2
+CACHE_KEY_VARIABLE = 'LPP_CACHE_KEY'
+PATH_VARIABLE = 'LPP_PATH'
+
+_MODULE_NOT_FOUND = 'Module not found: {}'
+_INVALID_MODULE_NAME = 'Invalid module name: {}'
+_CIRCULAR_IMPORT = 'Circular import: {}'
+_MODULE_PARSE_ERROR = 'Cannot parse module {}: {}'
+
+CacheHeader = Tuple[int, int, int, str]
+
+
+class ModuleLoader:
+
+  def __init__(self,
+               search_path: Optional[Sequence[str]] = None,
+               write_cache: bool = True) -> None:
+    self.search_path = list(search_path) if search_path is not None \
+        else default_search_path()
+    self.write_cache = write_cache
+    self.parses = 0
+    self.cache_hits = 0
+    self.evaluations = 0
+    self._namespaces: Dict[str, Environment] = {}
+    self._programs: Dict[str, Tuple[CacheHeader, Program]] = {}
+    self._loading: Set[str] = set()
+    self._lock = RLock()
+
+  def find(self, name: str) -> Optional[str]:
+    if not _is_module_name(name):
+      return None
+
+    filename = name if name.endswith(SOURCE_SUFFIX) else name + SOURCE_SUFFIX
+    for directory in self.search_path:
+      root = os.path.abspath(directory)
+      path = os.path.abspath(os.path.join(root, filename))
+      if os.path.commonpath([root, path]) == root and os.path.isfile(path):
+        return path
+
+    return None
+
+  def exports(self, name: str) -> Set[str]:
+    names: Set[str] = set()
+    pending = [name]
+    seen: Set[str] = set()
+    while pending:
+      module = pending.pop()
+      if module in seen:
+        continue
+      seen.add(module)
+
+      program = self.program(module)
+      if type(program) == Error:
+        continue
+      for statement in cast(Program, program).statements:
+        if type(statement) == LetStatement:
+          let_statement = cast(LetStatement, statement)
+          if let_statement.name is not None:
+            names.add(let_statement.name.value)
+        elif type(statement) == ImportStatement:
+          pending.append(cast(ImportStatement, statement).module)
+
+    return names
+
+  def program(self, name: str) -> Union[Program, Error]:
+    import pickle
+
+    path = self.find(name)
+    if path is None:
+      return _missing(name)
+
+    with self._lock:
+      stat = os.stat(path)
+      current = (stat.st_mtime_ns, stat.st_size)
+      cached = self._programs.get(path)
+      if cached is not None and cached[0][1:3] == current:
+        return cached[1]
+
+      with _programs_lock:
+        shared = _programs.get(path)
+        if shared is not None and shared[0][1:3] == current:
+          header, program = shared[0], cast(Program, pickle.loads(shared[1]))
+        else:
+          loaded = self._read(path, stat)
+          if type(loaded) == Error:
+            return cast(Error, loaded)
+          header, program = cast(Tuple[CacheHeader, Program], loaded)
+          _programs[path] = (header, pickle.dumps(program, pickle.HIGHEST_PROTOCOL))
+
+      self._programs[path] = (header, program)
+      resolve_builtins(program, exports=self.exports)
+      return program
+
+  def load(self, name: str,
+           budget: Optional[Budget] = None) -> Union[Environment, Error]:
+    with self._lock:
+      path = self.find(name)
+      if path is None:
+        return _missing(name)
+
+      namespace = self._namespaces.get(path)
+      if namespace is not None:
+        return namespace
+      if path in self._loading:
+        return Error(_CIRCULAR_IMPORT.format(name))
+
+      program = self.program(name)
+      if type(program) == Error:
+        return cast(Error, program)
+
+      namespace = Environment()
+      namespace.budget = budget
+      namespace.modules = self
+      self._loading.add(path)
+      try:
+        self.evaluations += 1
+        result = evaluate(cast(Program, program), namespace)
+      finally:
+        self._loading.discard(path)
+
+      if type(result) == Error:
+        return cast(Error, result)
+      self._namespaces[path] = namespace
+      return namespace
+
+  def clear(self) -> None:
+    with self._lock:
+      self._namespaces.clear()
+
+  def __getstate__(self) -> Dict[str, Any]:
+    state = self.__dict__.copy()
+    del state['_lock']
+    state['_loading'] = set()
+    return state
+
+  def __setstate__(self, state: Dict[str, Any]) -> None:
+    self.__dict__.update(state)
+    self._lock = RLock()
+
+  def _read(self, path: str,
+            stat: os.stat_result) -> Union[Tuple[CacheHeader, Program], Error]:
+    from hashlib import sha256
+
+    cached = self._read_cache(path, stat)
+    if cached is not None:
+      self.cache_hits += 1
+      header, program = cached
+    else:
+      with open(path, 'rb') as source_file:
+        source = source_file.read()
+      header = (CACHE_VERSION, stat.st_mtime_ns, stat.st_size,
+                sha256(source).hexdigest())
+
+      parser = Parser(Lexer(source.decode('utf-8')))
+      program = parser.parse_program()
+      self.parses += 1
+      if parser.errors:
+        return Error(_MODULE_PARSE_ERROR.format(path, '; '.join(parser.errors)))
+      self._write_cache(path, header, program)
+
+    return header, program
+
+  def _read_cache(self, path: str,
+                  stat: os.stat_result) -> Optional[Tuple[CacheHeader, Program]]:
+    import hmac
+    import pickle
+    from hashlib import sha256
+
+    key = cache_key()
+    if key is None:
+      return None
+
+    try:
+      with open(cache_path(path), 'rb') as cache:
+        signature = cache.read(sha256().digest_size)
+        payload = cache.read()
+      if not hmac.compare_digest(signature, hmac.new(key, payload, sha256).digest()):
+        return None
+
+      header, program = cast(Tuple[CacheHeader, Program], pickle.loads(payload))
+      if header[0] != CACHE_VERSION:
+        return None
+
+      if header[1:3] != (stat.st_mtime_ns, stat.st_size):
+        with open(path, 'rb') as source_file:
+          digest = sha256(source_file.read()).hexdigest()
+        if digest != header[3]:
+          return None
+        header = (CACHE_VERSION, stat.st_mtime_ns, stat.st_size, digest)
+
+      return header, program
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError,
+            ImportError, IndexError, TypeError, ValueError):
+      return None
+
+  def _write_cache(self, path: str, header: CacheHeader, program: Program) -> None:
+    if not self.write_cache:
+      return
+
+    import hmac
+    import pickle
+    from hashlib import sha256
+
+    key = cache_key()
+    if key is None:
+      return
+
+    target = cache_path(path)
+    temporary = f'{target}.{os.getpid()}.tmp'
+    try:
+      payload = pickle.dumps((header, program), pickle.HIGHEST_PROTOCOL)
+      os.makedirs(os.path.dirname(target), exist_ok=True)
+      with open(temporary, 'wb') as cache:
+        cache.write(hmac.new(key, payload, sha256).digest())
+        cache.write(payload)
+      os.replace(temporary, target)
+    except (OSError, pickle.PicklingError, RecursionError):
+      try:
+        os.unlink(temporary)
+      except OSError:
+        pass
+
+
+def cache_path(path: str) -> str:
+  directory, filename = os.path.split(path)
+  return os.path.join(directory, CACHE_DIRECTORY, filename + CACHE_SUFFIX)
+
+
+def cache_key() -> Optional[bytes]:
+  path = os.environ.get(CACHE_KEY_VARIABLE) or _default_key_path()
+  with _keys_lock:
+    key = _keys.get(path)
+    if key is None:
+      key = _keys[path] = _load_key(path)
+    return key or None
+
+
+def _default_key_path() -> str:
+  base = os.environ.get('XDG_CACHE_HOME') or \
+      os.path.join(os.path.expanduser('~'), '.cache')
+  return os.path.join(base, 'lpp', 'cache.key')
+
+
+def _load_key(path: str) -> bytes:
+  try:
+    with open(path, 'rb') as key_file:
+      key = key_file.read()
+    if len(key) >= _KEY_SIZE:
+      return key
+  except OSError:
+    pass
+
+  temporary = f'{path}.{os.getpid()}.tmp'
+  try:
+    os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+    descriptor = os.open(temporary, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(descriptor, 'wb') as key_file:
+      key_file.write(os.urandom(_KEY_SIZE))
+    os.replace(temporary, path)
+    with open(path, 'rb') as key_file:
+      return key_file.read()
+  except OSError:
+    try:
+      os.unlink(temporary)
+    except OSError:
+      pass
+    return b''
+
+
+def _is_module_name(name: str) -> bool:
+  parts = name.replace('\\', '/').split('/')
+  return bool(name) and not os.path.isabs(name) and not os.path.splitdrive(name)[0] \
+      and '..' not in parts
+
+
+def _missing(name: str) -> Error:
+  template = _MODULE_NOT_FOUND if _is_module_name(name) else _INVALID_MODULE_NAME
+  return Error(template.format(name))
+
+
+def default_search_path() -> List[str]:
+  extra = os.environ.get(PATH_VARIABLE, '')
+  return [os.getcwd()] + [entry for entry in extra.split(os.pathsep) if entry]
+
+
+def clear_program_cache() -> None:
+  with _programs_lock:
+    _programs.clear()
+
+
+_programs: Dict[str, Tuple[CacheHeader, bytes]] = {}
+_programs_lock = RLock()
+
+_KEY_SIZE = 32
+_keys: Dict[str, bytes] = {}
+_keys_lock = RLock()
+
+_default: Optional[ModuleLoader] = None
+_default_lock = RLock()
+
+
+def default_loader() -> ModuleLoader:
+  global _default
+  with _default_lock:
+    if _default is None:
+      _default = ModuleLoader()
+    return _default
+
+
+def loader_for(env: Environment) -> ModuleLoader:
+  root = env
+  while root.outer is not None:
+    root = root.outer
+  with _default_lock:
+    if root.modules is None:
+      root.modules = ModuleLoader()
+  env.modules = root.modules
+  return cast(ModuleLoader, root.modules)
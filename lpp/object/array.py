@@ -0,0 +1,28 @@
+from typing import Any
+
+from lpp.object.object_base import Object, ObjectType
+
+import lpp.vector as vector
+
+
+class Array(Object):
+  def __init__(self, values: vector.Storage) -> None:
+    self.values = values
+
+  def __len__(self) -> int:
+    return len(self.values)
+
+  def type(self) -> ObjectType:
+    return ObjectType.ARRAY
+
+  def inspect(self) -> str:
+    elements = ', '.join(_format(value) for value in vector.to_list(self.values))
+    return f'[{elements}]'
+
+
+def _format(value: Any) -> str:
+  if type(value) is bool:
+    return 'true' if value else 'false'
+  if value.is_integer():
+    return str(int(value))
+  return str(value)
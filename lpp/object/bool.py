@@ -10,3 +10,10 @@ class Boolean(Object):
 
   def inspect(self) -> str:
     return 'true' if self.value else 'false'
+
+  def __reduce__(self) -> str:
+    return 'TRUE' if self.value else 'FALSE'
+
+
+TRUE = Boolean(True)
+FALSE = Boolean(False)
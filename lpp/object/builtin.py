@@ -0,0 +1,34 @@
+from typing import Any, Callable, Optional, Tuple
+
+from lpp.object.object_base import Object, ObjectType
+
+
+_UNKNOWN_BUILTIN = 'Unknown builtin: {}'
+
+
+class Builtin(Object):
+  def __init__(self, name: str, function: Callable[..., Object],
+               pure: bool = True,
+               batch: Optional[Callable[..., Any]] = None) -> None:
+    self.name = name
+    self.function = function
+    self.pure = pure
+    self.batch = batch
+
+  def type(self) -> ObjectType:
+    return ObjectType.BUILTIN
+
+  def inspect(self) -> str:
+    return f'builtin {self.name}'
+
+  def __reduce__(self) -> Tuple[Callable[[str], 'Builtin'], Tuple[str]]:
+    return restore_builtin, (self.name,)
+
+
+def restore_builtin(name: str) -> Builtin:
+  from lpp.builtins import lookup_builtin
+
+  builtin = lookup_builtin(name)
+  if builtin is None:
+    raise LookupError(_UNKNOWN_BUILTIN.format(name))
+  return builtin
@@ -0,0 +1,29 @@
+from typing import Any, Dict, Optional
+
+from lpp.limits import Budget
+from lpp.settings import Settings, defaults
+from lpp.object.object_base import Object
+
+
+class Environment:
+
+  def __init__(self, outer: Optional['Environment'] = None) -> None:
+    self.store: Dict[str, Object] = {}
+    self.outer = outer
+    self.budget: Optional[Budget] = outer.budget if outer is not None else None
+    self.modules: Optional[Any] = outer.modules if outer is not None else None
+    self.settings: Settings = outer.settings if outer is not None else defaults
+
+  def get(self, name: str) -> Optional[Object]:
+    environment: Optional[Environment] = self
+    while environment is not None:
+      value = environment.store.get(name)
+      if value is not None:
+        return value
+      environment = environment.outer
+
+    return None
+
+  def set(self, name: str, value: Object) -> Object:
+    self.store[name] = value
+    return value
@@ -1,9 +1,24 @@
+from enum import (
+    auto,
+    Enum
+)
+
 from lpp.object.object_base import Object, ObjectType
 
 
+class ErrorKind(Enum):
+  RUNTIME = auto()
+  STEP_LIMIT = auto()
+  TIMEOUT = auto()
+  INTEGER_SIZE = auto()
+  CALL_DEPTH = auto()
+  LENGTH = auto()
+
+
 class Error(Object):
-  def __init__(self, message: str) -> None:
+  def __init__(self, message: str, kind: ErrorKind = ErrorKind.RUNTIME) -> None:
     self.message = message
+    self.kind = kind
 
   def type(self) -> ObjectType:
     return ObjectType.ERROR
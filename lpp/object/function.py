@@ -0,0 +1,40 @@
+from typing import Any, Dict, List, Optional
+
+from lpp.ast.block import Block
+from lpp.ast.indentifier import Identifier
+from lpp.object.environment import Environment
+from lpp.object.object_base import Object, ObjectType
+
+import lpp.ast.function as ast_function
+
+
+class Function(Object):
+  def __init__(self,
+               definition: ast_function.Function,
+               env: Environment) -> None:
+    self.definition = definition
+    self.env = env
+    self.memo: Optional[Any] = None
+    self.memo_generation = -1
+
+  @property
+  def parameters(self) -> List[Identifier]:
+    return self.definition.parameters
+
+  @property
+  def body(self) -> Block:
+    assert self.definition.body is not None
+    return self.definition.body
+
+  def __getstate__(self) -> Dict[str, Any]:
+    state = self.__dict__.copy()
+    state['memo'] = None
+    state['memo_generation'] = -1
+    return state
+
+  def type(self) -> ObjectType:
+    return ObjectType.FUNCTION
+
+  def inspect(self) -> str:
+    params = ', '.join(str(parameter) for parameter in self.parameters)
+    return f'def({params}) {str(self.body)}'
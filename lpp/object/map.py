@@ -0,0 +1,31 @@
+from typing import Dict
+
+from lpp.object.object_base import Object, ObjectType
+
+import lpp.object.bool as object_bool
+import lpp.object.string as object_string
+import lpp.object.numbers as object_numbers
+
+
+KEY_TYPES = (
+    object_numbers.Integer,
+    object_numbers.Float,
+    object_string.String,
+    object_bool.Boolean,
+)
+
+
+class Map(Object):
+  def __init__(self, pairs: Dict[Object, Object]) -> None:
+    self.pairs = pairs
+
+  def type(self) -> ObjectType:
+    return ObjectType.MAP
+
+  def inspect(self) -> str:
+    pairs = ', '.join(f'{key.inspect()}: {value.inspect()}'
+                      for key, value in self.pairs.items())
+    return f'{{{pairs}}}'
+
+  def __len__(self) -> int:
+    return len(self.pairs)
@@ -8,3 +8,9 @@ class Null(Object):
 
   def inspect(self) -> str:
     return 'null'
+
+  def __reduce__(self) -> str:
+    return 'NULL'
+
+
+NULL = Null()
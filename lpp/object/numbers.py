@@ -1,3 +1,5 @@
+from typing import cast
+
 from lpp.object.object_base import Object, ObjectType
 
 
@@ -11,6 +13,12 @@ class Integer(Object):
   def inspect(self) -> str:
     return str(self.value)
 
+  def __eq__(self, other: object) -> bool:
+    return type(other) in _NUMBER_TYPES and cast(Integer, other).value == self.value
+
+  def __hash__(self) -> int:
+    return hash(self.value)
+
 
 class Float(Object):
   def __init__(self, value: float) -> None:
@@ -21,3 +29,12 @@ class Float(Object):
 
   def inspect(self) -> str:
     return str(self.value)
+
+  def __eq__(self, other: object) -> bool:
+    return type(other) in _NUMBER_TYPES and cast(Float, other).value == self.value
+
+  def __hash__(self) -> int:
+    return hash(self.value)
+
+
+_NUMBER_TYPES = (Integer, Float)
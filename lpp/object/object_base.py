@@ -16,6 +16,11 @@ class ObjectType(Enum):
   NULL = auto()
   RETURN = auto()
   ERROR = auto()
+  FUNCTION = auto()
+  ARRAY = auto()
+  BUILTIN = auto()
+  MAP = auto()
+  RANGE = auto()
 
 class Object(ABC):
 
@@ -0,0 +1,16 @@
+from lpp.object.object_base import Object, ObjectType
+
+
+class Range(Object):
+  def __init__(self, values: range) -> None:
+    self.values = values
+
+  def type(self) -> ObjectType:
+    return ObjectType.RANGE
+
+  def inspect(self) -> str:
+    values = self.values
+    return f'range({values.start}, {values.stop}, {values.step})'
+
+  def __len__(self) -> int:
+    return len(self.values)
@@ -1,12 +1,124 @@
+from sys import intern as intern_text
+from threading import Lock
+from weakref import WeakValueDictionary
+from typing import List, Optional, Tuple, cast
+
 from lpp.object.object_base import Object, ObjectType
 
 
 class String(Object):
   def __init__(self, value: str) -> None:
-    self.value = value
+    self._value: Optional[str] = value
+    self._rope: Optional[_Rope] = None
+    self._front = 0
+    self._back = 0
+    self._length = len(value)
+    self._hash: Optional[int] = None
+
+  @property
+  def value(self) -> str:
+    if self._value is None:
+      assert self._rope is not None
+      self._value = self._rope.join(self._front, self._back)
+    return self._value
 
   def type(self) -> ObjectType:
     return ObjectType.STRING
 
   def inspect(self) -> str:
     return self.value
+
+  def __len__(self) -> int:
+    return self._length
+
+  def __eq__(self, other: object) -> bool:
+    if other is self:
+      return True
+    if type(other) is not String:
+      return False
+    other_string = cast(String, other)
+    return self._length == other_string._length and self.value == other_string.value
+
+  def __hash__(self) -> int:
+    if self._hash is None:
+      self._hash = hash(self.value)
+    return self._hash
+
+  def __reduce__(self) -> Tuple[type, Tuple[str]]:
+    return String, (self.value,)
+
+
+class _Rope:
+
+  def __init__(self, left: str, right: str) -> None:
+    self.front: List[str] = []
+    self.back: List[str] = [left, right]
+    self._lock = Lock()
+
+  def append(self, back: int, piece: str) -> bool:
+    with self._lock:
+      if len(self.back) != back:
+        return False
+      self.back.append(piece)
+      return True
+
+  def prepend(self, front: int, piece: str) -> bool:
+    with self._lock:
+      if len(self.front) != front:
+        return False
+      self.front.append(piece)
+      return True
+
+  def join(self, front: int, back: int) -> str:
+    return ''.join(self.front[:front][::-1] + self.back[:back])
+
+
+_interned: 'WeakValueDictionary[str, String]' = WeakValueDictionary()
+
+
+def intern(value: str) -> String:
+  string = _interned.get(value)
+  if string is None:
+    string = _interned.setdefault(value, String(intern_text(value)))
+  return string
+
+
+def concat(left: String, right: String) -> String:
+  if not len(right):
+    return left
+  if not len(left):
+    return right
+
+  if left._length >= right._length:
+    result = _append(left, right) or _prepend(left, right)
+  else:
+    result = _prepend(left, right) or _append(left, right)
+
+  if result is None:
+    rope = _Rope(left.value, right.value)
+    result = _rope_string(rope, 0, 2, left._length + right._length)
+  return result
+
+
+def _append(left: String, right: String) -> Optional[String]:
+  rope = left._rope
+  if rope is None or not rope.append(left._back, right.value):
+    return None
+  return _rope_string(rope, left._front, left._back + 1, left._length + right._length)
+
+
+def _prepend(left: String, right: String) -> Optional[String]:
+  rope = right._rope
+  if rope is None or not rope.prepend(right._front, left.value):
+    return None
+  return _rope_string(rope, right._front + 1, right._back, left._length + right._length)
+
+
+def _rope_string(rope: _Rope, front: int, back: int, length: int) -> String:
+  result = String('')
+  result._value = None
+  result._rope = rope
+  result._front = front
+  result._back = back
+  result._length = length
+  return result
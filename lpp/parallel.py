@@ -0,0 +1,359 @@
+from time import perf_counter
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Set, Tuple, cast
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+
+from lpp.ast.walk import children, walk
+from lpp.object.map import Map
+from lpp.object.error import Error
+from lpp.evaluator import evaluate
+from lpp.ast.program import Program
+from lpp.ast.function import Function
+from lpp.ast.node_base import ASTNode
+from lpp.builtins import lookup_builtin
+from lpp.purity import _collect_free_names
+from lpp.ast.indentifier import Identifier
+from lpp.interpreter import Interpreter
+from lpp.object.object_base import Object
+from lpp.ast.let_statement import LetStatement
+from lpp.ast.for_statement import ForStatement
+from lpp.object.environment import Environment
+from lpp.ast.import_statement import ImportStatement
+from lpp.ast.update_statement import UpdateStatement
+
+import lpp.object.null as object_null
+import lpp.object.array as object_array
+import lpp.object.bool as object_bool
+import lpp.object.string as object_string
+import lpp.object.numbers as object_numbers
+import lpp.object.return_object as object_return
+
+
+Bindings = Dict[str, Object]
+Plan = List[Tuple[int, Optional[Bindings]]]
+
+
+class StatementEffects(NamedTuple):
+  reads: FrozenSet[str]
+  deferred: FrozenSet[str]
+  writes: FrozenSet[str]
+  mutations: FrozenSet[str] = frozenset()
+
+
+class DependencyGraph(NamedTuple):
+  effects: List[StatementEffects]
+  dependencies: List[FrozenSet[int]]
+
+  def levels(self) -> List[int]:
+    levels: List[int] = []
+    for dependencies in self.dependencies:
+      levels.append(1 + max((levels[dependency] for dependency in dependencies),
+                            default=0))
+    return levels
+
+  @property
+  def critical_path(self) -> int:
+    return max(self.levels(), default=0)
+
+  @property
+  def max_width(self) -> int:
+    widths: Dict[int, int] = {}
+    for level in self.levels():
+      widths[level] = widths.get(level, 0) + 1
+    return max(widths.values(), default=0)
+
+
+class ParallelReport(NamedTuple):
+  statements: int
+  executed: int
+  critical_path: int
+  max_width: int
+  wall_seconds: float
+  busy_seconds: float
+
+  @property
+  def parallelism(self) -> float:
+    return self.busy_seconds / self.wall_seconds if self.wall_seconds else 0.0
+
+  def format(self) -> str:
+    return (f'{self.executed}/{self.statements} statements, '
+            f'critical path {self.critical_path}, widest level {self.max_width}, '
+            f'parallelism {self.parallelism:.2f} '
+            f'({self.busy_seconds:.3f}s busy in {self.wall_seconds:.3f}s)')
+
+
+class ParallelResult(NamedTuple):
+  value: Optional[Object]
+  report: ParallelReport
+
+
+class _Outcome(NamedTuple):
+  index: int
+  shipped: bool
+  result: Optional[Object]
+  bindings: Optional[Bindings]
+  seconds: float
+
+
+def analyze_statement(statement: ASTNode) -> StatementEffects:
+  reads: Set[str] = set()
+  deferred: Set[str] = set()
+  writes: Set[str] = set()
+  mutations: Set[str] = set()
+  _collect_effects(statement, reads, deferred, writes, mutations)
+
+  return StatementEffects(frozenset(reads), frozenset(deferred),
+                          frozenset(writes), frozenset(mutations))
+
+
+def build_graph(program: Program) -> DependencyGraph:
+  effects = [analyze_statement(statement) for statement in program.statements]
+  dependencies: List[FrozenSet[int]] = []
+  carried: List[FrozenSet[str]] = []
+  writers: Dict[str, int] = {}
+
+  for statement_effects in effects:
+    pending = list(statement_effects.reads | statement_effects.deferred)
+    seen: Set[str] = set()
+    direct: Set[int] = set()
+    while pending:
+      name = pending.pop()
+      if name in seen:
+        continue
+      seen.add(name)
+
+      writer = writers.get(name)
+      if writer is not None:
+        direct.add(writer)
+        pending.extend(carried[writer])
+
+    dependencies.append(frozenset(direct))
+    carried.append(statement_effects.deferred.union(
+        *(carried[dependency] for dependency in direct)))
+    for name in statement_effects.writes:
+      writers[name] = len(dependencies) - 1
+
+  return DependencyGraph(effects, dependencies)
+
+
+def evaluate_parallel(source: str, jobs: Optional[int] = None) -> ParallelResult:
+  program = Interpreter.parse(source)
+  graph = build_graph(program)
+  statements = len(program.statements)
+  if _has_side_effects(graph):
+    return _evaluate_sequential(program, graph)
+
+  results: Dict[int, _Outcome] = {}
+  remaining = [len(dependencies) for dependencies in graph.dependencies]
+  dependents: List[List[int]] = [[] for _ in range(statements)]
+  for index, dependencies in enumerate(graph.dependencies):
+    for dependency in dependencies:
+      dependents[dependency].append(index)
+
+  stop = statements - 1
+  busy = 0.0
+  start = perf_counter()
+  with ProcessPoolExecutor(max_workers=jobs,
+                           initializer=_load_program,
+                           initargs=(source,)) as executor:
+    running: Set[Future] = set()
+
+    def submit(index: int) -> None:
+      plan = _plan(index, graph, results)
+      running.add(executor.submit(_run_statement, index, plan))
+
+    for index in range(statements):
+      if remaining[index] == 0:
+        submit(index)
+
+    while running:
+      done, _ = wait(running, return_when=FIRST_COMPLETED)
+      for future in done:
+        running.discard(future)
+        outcome = cast(_Outcome, future.result())
+        results[outcome.index] = outcome
+        busy += outcome.seconds
+
+        result_type = type(outcome.result)
+        if result_type == Error or result_type == object_return.Return:
+          stop = min(stop, outcome.index)
+
+        for dependent in dependents[outcome.index]:
+          remaining[dependent] -= 1
+          if remaining[dependent] == 0 and dependent <= stop:
+            submit(dependent)
+
+  wall = perf_counter() - start
+  report = ParallelReport(statements=statements,
+                          executed=len(results),
+                          critical_path=graph.critical_path,
+                          max_width=graph.max_width,
+                          wall_seconds=wall,
+                          busy_seconds=busy)
+  return ParallelResult(_program_result(program, graph, results), report)
+
+
+def _has_side_effects(graph: DependencyGraph) -> bool:
+  for effects in graph.effects:
+    if effects.mutations:
+      return True
+    for name in effects.reads | effects.deferred:
+      builtin = lookup_builtin(name)
+      if builtin is not None and not builtin.pure:
+        return True
+
+  return False
+
+
+def _evaluate_sequential(program: Program, graph: DependencyGraph) -> ParallelResult:
+  env = Environment()
+  result: Optional[Object] = None
+  executed = 0
+  start = perf_counter()
+  for statement in program.statements:
+    executed += 1
+    result = evaluate(statement, env)
+    if type(result) == object_return.Return:
+      result = cast(object_return.Return, result).value
+      break
+    elif type(result) == Error:
+      break
+
+  wall = perf_counter() - start
+  report = ParallelReport(statements=len(program.statements),
+                          executed=executed,
+                          critical_path=graph.critical_path,
+                          max_width=graph.max_width,
+                          wall_seconds=wall,
+                          busy_seconds=wall)
+  return ParallelResult(result, report)
+
+
+def _collect_effects(node: ASTNode,
+                     reads: Set[str],
+                     deferred: Set[str],
+                     writes: Set[str],
+                     mutations: Set[str]) -> None:
+  if isinstance(node, Function):
+    free_values: Set[str] = set()
+    callees: Set[str] = set()
+    _collect_free_names(node, set(), free_values, callees)
+    deferred |= free_values | callees
+    for child in walk(node):
+      update = cast(UpdateStatement, child)
+      if type(child) == UpdateStatement and update.name is not None \
+          and update.name.value in free_values:
+        mutations.add(update.name.value)
+  elif isinstance(node, Identifier):
+    reads.add(node.value)
+  elif type(node) == LetStatement:
+    let_statement = cast(LetStatement, node)
+    if let_statement.name is not None:
+      writes.add(let_statement.name.value)
+    if let_statement.value is not None:
+      _collect_effects(let_statement.value, reads, deferred, writes, mutations)
+  elif type(node) == UpdateStatement:
+    update = cast(UpdateStatement, node)
+    if update.name is not None:
+      reads.add(update.name.value)
+      writes.add(update.name.value)
+  elif type(node) == ImportStatement:
+    mutations.add(cast(ImportStatement, node).module)
+  elif type(node) == ForStatement:
+    for_statement = cast(ForStatement, node)
+    if for_statement.variable is not None:
+      writes.add(for_statement.variable.value)
+    for child in (for_statement.iterable, for_statement.body):
+      if child is not None:
+        _collect_effects(child, reads, deferred, writes, mutations)
+  else:
+    for child in children(node):
+      _collect_effects(child, reads, deferred, writes, mutations)
+
+
+def _plan(index: int, graph: DependencyGraph,
+          results: Dict[int, _Outcome]) -> Plan:
+  needed: Set[int] = set()
+  pending = list(graph.dependencies[index])
+  while pending:
+    dependency = pending.pop()
+    if dependency in needed:
+      continue
+    needed.add(dependency)
+    if results[dependency].bindings is None:
+      pending.extend(graph.dependencies[dependency])
+
+  return [(dependency, results[dependency].bindings)
+          for dependency in sorted(needed)]
+
+
+def _materialize(program: Program, plan: Plan, env: Environment) -> None:
+  for dependency, bindings in plan:
+    if bindings is None:
+      evaluate(program.statements[dependency], env)
+    else:
+      env.store.update(bindings)
+
+
+def _program_result(program: Program, graph: DependencyGraph,
+                    results: Dict[int, _Outcome]) -> Optional[Object]:
+  for index in range(len(program.statements)):
+    outcome = results[index]
+    result = outcome.result
+    if not outcome.shipped:
+      env = Environment()
+      _materialize(program, _plan(index, graph, results), env)
+      result = evaluate(program.statements[index], env)
+
+    if type(result) == object_return.Return:
+      return cast(object_return.Return, result).value
+    elif type(result) == Error or index == len(program.statements) - 1:
+      return result
+
+  return None
+
+
+_program: Optional[Program] = None
+
+
+def _load_program(source: str) -> None:
+  global _program
+  _program = Interpreter.parse(source)
+
+
+def _run_statement(index: int, plan: Plan) -> _Outcome:
+  assert _program is not None
+  start = perf_counter()
+  env = Environment()
+  _materialize(_program, plan, env)
+  result = evaluate(_program.statements[index], env)
+  seconds = perf_counter() - start
+
+  bindings: Optional[Bindings] = {}
+  for name in analyze_statement(_program.statements[index]).writes:
+    value = env.store.get(name)
+    if value is None or not _is_shippable(value):
+      bindings = None
+      break
+    cast(Bindings, bindings)[name] = value
+
+  shipped = result is None or _is_shippable(result)
+  return _Outcome(index, shipped, result if shipped else None, bindings, seconds)
+
+
+def _is_shippable(value: Object) -> bool:
+  if type(value) == object_return.Return:
+    return _is_shippable(cast(object_return.Return, value).value)
+
+  return type(value) in _SHIPPABLE_TYPES
+
+
+_SHIPPABLE_TYPES = (
+    object_numbers.Integer,
+    object_numbers.Float,
+    object_bool.Boolean,
+    object_string.String,
+    object_null.Null,
+    object_array.Array,
+    Map,
+    Error,
+)
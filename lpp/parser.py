@@ -7,19 +7,27 @@ from lpp.utils.type import (
 from lpp.lexer import Lexer
 from lpp.token import Token
 from lpp.ast.call import Call
+from lpp.ast.map import MapLiteral
+from lpp.ast.array import ArrayLiteral
 from lpp.ast.block import Block
 from lpp.ast.infix import Infix
 from lpp.ast.bool import Boolean
 from lpp.ast.prefix import Prefix
+from lpp.ast.logical import Logical
 from lpp.ast.program import Program
 from lpp.ast.if_expression import If
 from lpp.ast.function import Function
 from lpp.utils.const import PRECEDENCES
+from lpp.ast.string import StringLiteral
 from lpp.ast.number import Float, Integer
 from lpp.ast.indentifier import Identifier
 from lpp.ast.let_statement import LetStatement
+from lpp.ast.for_statement import ForStatement
+from lpp.ast.import_statement import ImportStatement
 from lpp.ast.node_base import Statement, Expression
+from lpp.ast.while_statement import WhileStatement
 from lpp.ast.return_statement import ReturnStatement
+from lpp.ast.update_statement import UpdateStatement
 from lpp.ast.expressions_statement import ExpressionStatement
 
 
@@ -28,6 +36,9 @@ InfixParseFn = Callable[[Expression], Optional[Expression]]
 PrefixParseFns = Dict[TokenType, PrefixParseFn]
 InfixParseFns = Dict[TokenType, InfixParseFn]
 
+_UPDATE_OPERATORS = (TokenType.INCR, TokenType.DECR)
+_MODULE_NAMES = (TokenType.IDENT, TokenType.STR)
+
 
 class Parser:
 
@@ -101,10 +112,45 @@ class Parser:
     return call
 
   def parse_call_arguments(self) -> List[Expression]:
+    return self._parse_expression_list(TokenType.RPAREN)
+
+  def _parse_array(self) -> ArrayLiteral:
+    assert self._current_token is not None
+    array = ArrayLiteral(token=self._current_token)
+    array.elements = self._parse_expression_list(TokenType.RBRACKET)
+
+    return array
+
+  def _parse_map(self) -> Optional[MapLiteral]:
+    assert self._current_token is not None
+    map_literal = MapLiteral(token=self._current_token, keys=[], values=[])
+
+    assert self._peek_token is not None
+    while self._peek_token.token_type != TokenType.RBRACE:
+      self._advance_token()
+      key = self._parse_expression(Precedence.LOWEST)
+      if not self._expected_token(TokenType.COLON):
+        return None
+
+      self._advance_token()
+      value = self._parse_expression(Precedence.LOWEST)
+      if key is None or value is None:
+        return None
+      map_literal.keys.append(key)
+      map_literal.values.append(value)
+
+      if self._peek_token.token_type != TokenType.RBRACE \
+          and not self._expected_token(TokenType.COMMA):
+        return None
+
+    self._advance_token()
+    return map_literal
+
+  def _parse_expression_list(self, end: TokenType) -> List[Expression]:
     arguments: List[Expression] = []
 
     assert self._peek_token is not None
-    if self._peek_token.token_type == TokenType.RPAREN:
+    if self._peek_token.token_type == end:
       self._advance_token()
       return arguments
 
@@ -119,7 +165,7 @@ class Parser:
       if expression := self._parse_expression(Precedence.LOWEST):
          arguments.append(expression)
 
-    if not self._expected_token(TokenType.RPAREN):
+    if not self._expected_token(end):
       return []
 
     return arguments
@@ -263,6 +309,54 @@ class Parser:
       if_expression.alternative = self._parse_block()
     return if_expression
 
+  def _parse_for_statement(self) -> Optional[ForStatement]:
+    assert self._current_token is not None
+    for_statement = ForStatement(token=self._current_token)
+
+    if not self._expected_token(TokenType.LPAREN):
+      return None
+
+    if not self._expected_token(TokenType.IDENT):
+      return None
+
+    for_statement.variable = self._parser_identifier()
+
+    if not self._expected_token(TokenType.IN):
+      return None
+
+    self._advance_token()
+    for_statement.iterable = self._parse_expression(Precedence.LOWEST)
+
+    if not self._expected_token(TokenType.RPAREN):
+      return None
+
+    if not self._expected_token(TokenType.LBRACE):
+      return None
+
+    for_statement.body = self._parse_block()
+
+    assert self._peek_token is not None
+    if self._peek_token.token_type == TokenType.SEMICOLON:
+      self._advance_token()
+    return for_statement
+
+  def _parse_import_statement(self) -> Optional[ImportStatement]:
+    assert self._current_token is not None and self._peek_token is not None
+    import_statement = ImportStatement(token=self._current_token)
+
+    if self._peek_token.token_type not in _MODULE_NAMES:
+      self._expected_token_error(TokenType.STR)
+      return None
+
+    self._advance_token()
+    literal = self._current_token.literal
+    import_statement.module = literal[1:-1] \
+        if self._current_token.token_type == TokenType.STR else literal
+
+    if self._peek_token.token_type == TokenType.SEMICOLON:
+      self._advance_token()
+    return import_statement
+
   def _parse_infix_expression(self, left: Expression) -> Infix:
     assert self._current_token is not None
     infix = Infix(token=self._current_token,
@@ -276,6 +370,19 @@ class Parser:
 
     return infix
 
+  def _parse_logical_expression(self, left: Expression) -> Logical:
+    assert self._current_token is not None
+    logical = Logical(token=self._current_token,
+                      left=left,
+                      operator=self._current_token.literal)
+    precedence = self._current_precedence()
+
+    self._advance_token()
+
+    logical.right = self._parse_expression(precedence)
+
+    return logical
+
   def _parse_let_statement(self) -> Optional[LetStatement]:
     assert self._current_token is not None
     let_statement = LetStatement(token=self._current_token)
@@ -298,6 +405,25 @@ class Parser:
 
     return let_statement
 
+  def _parse_update_statement(self) -> UpdateStatement:
+    assert self._current_token is not None
+    update_statement = UpdateStatement(token=self._current_token,
+                                       name=self._parser_identifier())
+
+    self._advance_token()
+    update_statement.operator = self._current_token.literal
+
+    assert self._peek_token is not None
+    if self._peek_token.token_type == TokenType.SEMICOLON:
+      self._advance_token()
+
+    return update_statement
+
+  def _parse_string(self) -> StringLiteral:
+    assert self._current_token is not None
+    return StringLiteral(token=self._current_token,
+                         value=self._current_token.literal[1:-1])
+
   def _parse_prefix_expression(self) -> Prefix:
     assert self._current_token is not None
     prefix_expression = Prefix(
@@ -322,6 +448,29 @@ class Parser:
       self._advance_token()
     return return_statement
 
+  def _parse_while_statement(self) -> Optional[WhileStatement]:
+    assert self._current_token is not None
+    while_statement = WhileStatement(token=self._current_token)
+
+    if not self._expected_token(TokenType.LPAREN):
+      return None
+
+    self._advance_token()
+    while_statement.condition = self._parse_expression(Precedence.LOWEST)
+
+    if not self._expected_token(TokenType.RPAREN):
+      return None
+
+    if not self._expected_token(TokenType.LBRACE):
+      return None
+
+    while_statement.body = self._parse_block()
+
+    assert self._peek_token is not None
+    if self._peek_token.token_type == TokenType.SEMICOLON:
+      self._advance_token()
+    return while_statement
+
   def parse_program(self) -> Program:
     program: Program = Program([])
 
@@ -340,6 +489,17 @@ class Parser:
       return self._parse_let_statement()
     if self._current_token.token_type == TokenType.RETURN:
       return self._parse_return_statement()
+    if self._current_token.token_type == TokenType.WHILE:
+      return self._parse_while_statement()
+    if self._current_token.token_type == TokenType.FOR:
+      return self._parse_for_statement()
+    if self._current_token.token_type == TokenType.IMPORT:
+      return self._parse_import_statement()
+
+    assert self._peek_token is not None
+    if self._current_token.token_type == TokenType.IDENT \
+        and self._peek_token.token_type in _UPDATE_OPERATORS:
+      return self._parse_update_statement()
     return self._parse_expression_statement()
 
   def _peek_precedence(self) -> Precedence:
@@ -362,8 +522,8 @@ class Parser:
         TokenType.LT_OR_EQUALS: self._parse_infix_expression,
         TokenType.GT: self._parse_infix_expression,
         TokenType.GT_OR_EQUALS: self._parse_infix_expression,
-        TokenType.AND: self._parse_infix_expression,
-        TokenType.OR: self._parse_infix_expression,
+        TokenType.AND: self._parse_logical_expression,
+        TokenType.OR: self._parse_logical_expression,
         TokenType.LPAREN: self._parse_call,
     }
 
@@ -375,8 +535,11 @@ class Parser:
         TokenType.LPAREN: self._parse_grouped_expression,
         TokenType.INT: self._parser_integer,
         TokenType.FLOAT: self._parser_float,
+        TokenType.STR: self._parse_string,
         TokenType.NEGATION: self._parse_prefix_expression,
         TokenType.MINUS: self._parse_prefix_expression,
         TokenType.IF: self._parse_if_expression,
         TokenType.FUNCTION: self._parse_function,
+        TokenType.LBRACKET: self._parse_array,
+        TokenType.LBRACE: self._parse_map,
     }
@@ -0,0 +1,108 @@
+from time import perf_counter
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import lpp.evaluator as evaluator
+from lpp.ast.walk import walk
+from lpp.ast.logical import Logical
+from lpp.ast.node_base import ASTNode
+from lpp.ast.quickened import count_quickened
+from lpp.inline_cache import collect_cache_stats
+
+
+class ShortCircuitStats(NamedTuple):
+  nodes: int
+  evaluations: int
+  short_circuits: int
+
+  @property
+  def rate(self) -> float:
+    return self.short_circuits / self.evaluations if self.evaluations else 0.0
+
+
+def collect_short_circuit_stats(node: ASTNode) -> ShortCircuitStats:
+  nodes = evaluations = short_circuits = 0
+
+  for child in walk(node):
+    if isinstance(child, Logical):
+      nodes += 1
+      evaluations += child.evaluations
+      short_circuits += child.short_circuits
+
+  return ShortCircuitStats(nodes, evaluations, short_circuits)
+
+
+class NodeTiming(NamedTuple):
+  name: str
+  evaluations: int
+  seconds: float
+
+
+class EvaluationProfile(NamedTuple):
+  result: Any
+  seconds: float
+  node_types: List[NodeTiming]
+  lines: List[Tuple[Optional[int], float]]
+
+
+def profile_evaluation(run: Callable[[], Any],
+                       line_of: Callable[[ASTNode], Optional[int]]) -> EvaluationProfile:
+  evaluations: Dict[str, List[Any]] = {}
+  lines: Dict[Optional[int], float] = {}
+  children: List[float] = [0.0]
+
+  def timed(name: str, evaluate: Callable[[Any, Any], Any]) -> Callable[[Any, Any], Any]:
+    def profiled(node: ASTNode, env: Any) -> Any:
+      children.append(0.0)
+      start = perf_counter()
+      try:
+        return evaluate(node, env)
+      finally:
+        elapsed = perf_counter() - start
+        own = elapsed - children.pop()
+        children[-1] += elapsed
+        entry = evaluations.setdefault(name, [0, 0.0])
+        entry[0] += 1
+        entry[1] += own
+        line = line_of(node)
+        lines[line] = lines.get(line, 0.0) + own
+    return profiled
+
+  table = evaluator._EVALUATORS
+  original = dict(table)
+  for node_type, evaluate in original.items():
+    table[node_type] = timed(node_type.__name__, evaluate)
+
+  start = perf_counter()
+  try:
+    result = run()
+  finally:
+    seconds = perf_counter() - start
+    table.update(original)
+
+  node_types = sorted((NodeTiming(name, count, own)
+                       for name, (count, own) in evaluations.items()),
+                      key=lambda timing: timing.seconds, reverse=True)
+  by_line = sorted(lines.items(), key=lambda entry: entry[1], reverse=True)
+  return EvaluationProfile(result, seconds, node_types, by_line)
+
+
+def profile_report(node: ASTNode) -> str:
+  cache = collect_cache_stats(node)
+  short_circuit = collect_short_circuit_stats(node)
+  quickened = count_quickened(node)
+
+  lines: List[str] = [
+      f'inline caches: {cache.nodes} nodes, {cache.hits} hits, '
+      f'{cache.misses} misses ({cache.hit_rate:.1%} hit rate), '
+      f'{cache.polymorphic} polymorphic, {cache.megamorphic} megamorphic',
+      f'short-circuit: {short_circuit.nodes} nodes, '
+      f'{short_circuit.evaluations} evaluations, '
+      f'{short_circuit.short_circuits} short-circuited '
+      f'({short_circuit.rate:.1%})',
+  ]
+  if quickened:
+    counts = ', '.join(f'{name}={count}'
+                       for name, count in sorted(quickened.items()))
+    lines.append(f'quickened: {counts}')
+
+  return '\n'.join(lines)
@@ -0,0 +1,103 @@
+from typing import FrozenSet, List, NamedTuple, Set, cast
+
+from lpp.ast.call import Call
+from lpp.ast.block import Block
+from lpp.ast.walk import children
+from lpp.ast.function import Function
+from lpp.ast.node_base import ASTNode
+from lpp.ast.string import StringLiteral
+from lpp.ast.indentifier import Identifier
+from lpp.ast.let_statement import LetStatement
+from lpp.ast.for_statement import ForStatement
+from lpp.ast.expressions_statement import ExpressionStatement
+
+
+MEMO_PRAGMA = 'memo'
+
+
+class Purity(NamedTuple):
+  pure: bool
+  callees: FrozenSet[str]
+  pragma: bool
+
+
+def analyze_purity(definition: Function) -> Purity:
+  purity = definition.purity
+  if purity is None:
+    free_values: Set[str] = set()
+    callees: Set[str] = set()
+    _collect_free_names(definition, set(), free_values, callees)
+
+    purity = Purity(pure=not free_values,
+                    callees=frozenset(callees),
+                    pragma=_has_memo_pragma(definition))
+    definition.purity = purity
+
+  return purity
+
+
+def _has_memo_pragma(definition: Function) -> bool:
+  if definition.body is None or not definition.body.statements:
+    return False
+
+  statement = definition.body.statements[0]
+  if type(statement) != ExpressionStatement:
+    return False
+
+  expression = cast(ExpressionStatement, statement).expression
+  return type(expression) == StringLiteral \
+      and cast(StringLiteral, expression).value == MEMO_PRAGMA
+
+
+def _collect_free_names(node: ASTNode,
+                        bound: Set[str],
+                        free_values: Set[str],
+                        callees: Set[str]) -> None:
+  node_type = type(node)
+
+  if node_type == Function:
+    function = cast(Function, node)
+    scope = bound | {parameter.value for parameter in function.parameters}
+    if function.body is not None:
+      scope |= _let_names(function.body)
+      _collect_free_names(function.body, scope, free_values, callees)
+  elif isinstance(node, Identifier):
+    if node.value not in bound:
+      free_values.add(node.value)
+  elif node_type == Call:
+    call = cast(Call, node)
+    if isinstance(call.function, Identifier):
+      if call.function.value not in bound:
+        callees.add(call.function.value)
+    else:
+      _collect_free_names(call.function, bound, free_values, callees)
+    for argument in call.arguments:
+      _collect_free_names(argument, bound, free_values, callees)
+  elif node_type == LetStatement:
+    let_statement = cast(LetStatement, node)
+    if let_statement.value is not None:
+      _collect_free_names(let_statement.value, bound, free_values, callees)
+  else:
+    for child in children(node):
+      _collect_free_names(child, bound, free_values, callees)
+
+
+def _let_names(block: Block) -> Set[str]:
+  names: Set[str] = set()
+  pending: List[ASTNode] = [block]
+
+  while pending:
+    current = pending.pop()
+    for child in children(current):
+      if type(child) == LetStatement:
+        let_statement = cast(LetStatement, child)
+        if let_statement.name is not None:
+          names.add(let_statement.name.value)
+      elif type(child) == ForStatement:
+        for_statement = cast(ForStatement, child)
+        if for_statement.variable is not None:
+          names.add(for_statement.variable.value)
+      if type(child) != Function:
+        pending.append(child)
+
+  return names
@@ -1,15 +1,368 @@
-from typing import List
+import gc
+import math
+import tracemalloc
+from time import perf_counter
+from collections import Counter
+from contextlib import contextmanager
+from typing import (Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence,
+                    Set, Tuple, cast)
 
+import lpp.tiering as tiering
+import lpp.memoization as memoization
 from lpp.token import Token
-from lpp.lexer import Lexer
+from lpp.object.map import Map
 from lpp.parser import Parser
-from lpp.evaluator import evaluate
+from lpp.lexer import TokenStream, tokenize
+from lpp.profiling import profile_evaluation
+from lpp.ast.call import Call
+from lpp.ast.walk import children, walk
+from lpp.limits import Limits
+from lpp.settings import Settings
 from lpp.ast.program import Program
+from lpp.ast.function import Function
 from lpp.utils.type import TokenType
+from lpp.ast.node_base import ASTNode
+from lpp.resolver import resolve_builtins
+from lpp.object.object_base import Object
+from lpp.ast.let_statement import LetStatement
+from lpp.object.environment import Environment
+from lpp.ast.for_statement import ForStatement
+from lpp.ast.while_statement import WhileStatement
+from lpp.ast.import_statement import ImportStatement
+from lpp.interpreter import Interpreter, ParseError
+
+import lpp.object.function as object_function
 
 
 EOF_TOKEN: Token = Token(TokenType.EOF, '')
 
+TIME_WARMUP = 3
+TIME_MIN_RUNS = 5
+TIME_MAX_RUNS = 10_000
+TIME_BUDGET = 0.5
+REPORT_ROWS = 8
+
+_USAGE = 'Usage: {} <expression>'
+_UNKNOWN_COMMAND = 'Unknown command: {} (available: {})'
+
+_COMPILED_NODES = (Function, WhileStatement, ForStatement)
+
+BuiltinSite = Tuple[Call, List[ASTNode]]
+
+_MEMORY_FILTERS = [tracemalloc.Filter(False, tracemalloc.__file__),
+                   tracemalloc.Filter(False, '<frozen *>')]
+
+
+class PhaseTimes(NamedTuple):
+  lex: float
+  parse: float
+  resolve: float
+
+
+class ReplSession:
+
+  def __init__(self,
+               limits: Optional[Limits] = Limits(),
+               search_path: Optional[Sequence[str]] = None) -> None:
+    self.interpreter = Interpreter(limits=limits, search_path=search_path)
+    self.lines = 0
+    self.history: List[str] = []
+    self._programs: List[Program] = []
+    self._globals: Set[str] = set()
+    self._builtin_sites: Dict[str, List[BuiltinSite]] = {}
+
+  @property
+  def env(self) -> Environment:
+    return self.interpreter.globals
+
+  def parse(self, source: str) -> Program:
+    return self._parse_phases(source)[0]
+
+  def run(self, source: str) -> Optional[Object]:
+    return self.interpreter.evaluate(self._accept(self.parse(source), source))
+
+  def command(self, line: str) -> str:
+    name, _, source = line.strip().partition(' ')
+    handler = _COMMANDS.get(name)
+    if handler is None:
+      return _UNKNOWN_COMMAND.format(name, ', '.join(sorted(_COMMANDS)))
+    if not source.strip():
+      return _USAGE.format(name)
+    return handler(self, source)
+
+  def _parse_phases(self, source: str) -> Tuple[Program, PhaseTimes]:
+    start = perf_counter()
+    tokens = tokenize(source)
+    lexed = perf_counter()
+    parser = Parser(TokenStream(tokens))
+    program = parser.parse_program()
+    if parser.errors:
+      raise ParseError(parser.errors)
+    parsed = perf_counter()
+    resolve_builtins(program, self._globals, exports=self.interpreter.modules.exports)
+    resolved = perf_counter()
+    return program, PhaseTimes(lexed - start, parsed - lexed, resolved - parsed)
+
+  def _accept(self, program: Program, source: str) -> Program:
+    bound = self._global_names(program)
+    self._rebind(bound)
+    self._globals.update(bound)
+    self._index_builtin_sites(program)
+
+    self.lines += 1
+    self.history.append(source)
+    self._programs.append(program)
+    return program
+
+  def _time(self, source: str) -> str:
+    program, _ = self._parse_phases(source)
+    self._accept(program, source)
+    scratch = _copy_environment(self.env, {})
+    for _ in range(TIME_WARMUP):
+      self.interpreter.evaluate(program, scratch)
+
+    samples: Dict[str, List[float]] = {'lex': [], 'parse': [], 'resolve': [],
+                                       'evaluate': []}
+    elapsed = 0.0
+    while len(samples['evaluate']) < TIME_MAX_RUNS and \
+        (elapsed < TIME_BUDGET or len(samples['evaluate']) < TIME_MIN_RUNS):
+      phases = self._parse_phases(source)[1]
+      start = perf_counter()
+      self.interpreter.evaluate(program, scratch)
+      seconds = perf_counter() - start
+      elapsed += seconds
+      for name, value in zip(PhaseTimes._fields, phases):
+        samples[name].append(value)
+      samples['evaluate'].append(seconds)
+
+    from lpp.batch import percentile
+
+    result = self.interpreter.evaluate(program)
+    lines = [_result_line(result),
+             f'{len(samples["evaluate"])} runs after {TIME_WARMUP} warmup runs',
+             f'{"phase":<10} {"min":>10} {"median":>10} {"p99":>10}']
+    for name, values in samples.items():
+      ordered = sorted(values)
+      lines.append(f'{name:<10} {_format_seconds(ordered[0]):>10} '
+                   f'{_format_seconds(percentile(ordered, 0.5)):>10} '
+                   f'{_format_seconds(percentile(ordered, 0.99)):>10}')
+    return '\n'.join(lines)
+
+  def _profile(self, source: str) -> str:
+    program, phases = self._parse_phases(source)
+    self._accept(program, source)
+    line_numbers = {id(node): number
+                    for number, parsed in enumerate(self._programs, 1)
+                    for node in walk(parsed)}
+
+    with _interpreted(self._programs, self.interpreter.settings) as deoptimized:
+      profile = profile_evaluation(lambda: self.interpreter.evaluate(program),
+                                   lambda node: line_numbers.get(id(node)))
+    total = sum(timing.seconds for timing in profile.node_types) or 1.0
+
+    lines = [_result_line(profile.result),
+             _phase_line(phases, profile.seconds),
+             f'interpreted, {deoptimized} compiled nodes set aside while profiling',
+             f'{"node type":<24} {"evaluations":>12} {"self":>10} {"share":>7}']
+    for timing in profile.node_types[:REPORT_ROWS]:
+      lines.append(f'{timing.name:<24} {timing.evaluations:>12} '
+                   f'{_format_seconds(timing.seconds):>10} {timing.seconds / total:>7.1%}')
+
+    lines.append(f'{"line":<37} {"self":>10} {"share":>7}')
+    for number, seconds in profile.lines[:REPORT_ROWS]:
+      label = f'[{number}] {self.history[number - 1]}' if number is not None \
+          else '[-] outside this session'
+      lines.append(f'{_truncate(label, 37):<37} {_format_seconds(seconds):>10} '
+                   f'{seconds / total:>7.1%}')
+    return '\n'.join(lines)
+
+  def _mem(self, source: str) -> str:
+    program, phases = self._parse_phases(source)
+    self._accept(program, source)
+
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+      tracemalloc.start()
+    gc.collect()
+    objects_before = _count_objects()
+    tracemalloc.reset_peak()
+    baseline, _ = tracemalloc.get_traced_memory()
+    before = tracemalloc.take_snapshot()
+
+    start = perf_counter()
+    result = self.interpreter.evaluate(program)
+    seconds = perf_counter() - start
+
+    current, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot().filter_traces(_MEMORY_FILTERS)
+    before = before.filter_traces(_MEMORY_FILTERS)
+    if not tracing:
+      tracemalloc.stop()
+    objects = _count_objects()
+    objects.subtract(objects_before)
+
+    lines = [_result_line(result),
+             _phase_line(phases, seconds),
+             f'peak {_format_bytes(peak - baseline)}, '
+             f'retained {_format_bytes(current - baseline)}',
+             f'{"allocation site":<37} {"size":>10} {"blocks":>8}']
+    sites = after.compare_to(before, 'lineno')
+    for site in sites[:REPORT_ROWS]:
+      frame = site.traceback[0]
+      label = f'{frame.filename.rsplit("/", 1)[-1]}:{frame.lineno}'
+      lines.append(f'{_truncate(label, 37):<37} {_format_bytes(site.size_diff):>10} '
+                   f'{site.count_diff:>8}')
+
+    changed = [(name, count) for name, count in objects.most_common() if count]
+    if changed:
+      lines.append('live objects: ' + ', '.join(f'{name} {count:+}'
+                                                for name, count in changed[:REPORT_ROWS]))
+    return '\n'.join(lines)
+
+  def _global_names(self, program: Program) -> Set[str]:
+    names: Set[str] = set()
+    for node in _outside_functions(program):
+      node_type = type(node)
+      if node_type == LetStatement:
+        let_statement = cast(LetStatement, node)
+        if let_statement.name is not None:
+          names.add(let_statement.name.value)
+      elif node_type == ForStatement:
+        for_statement = cast(ForStatement, node)
+        if for_statement.variable is not None:
+          names.add(for_statement.variable.value)
+      elif node_type == ImportStatement:
+        module = cast(ImportStatement, node).module
+        names.update(self.interpreter.modules.exports(module))
+
+    return names
+
+  def _rebind(self, names: Set[str]) -> None:
+    shadowed = names.intersection(self._builtin_sites)
+    if not shadowed and self._globals.isdisjoint(names):
+      return
+
+    tiering.wait_for_tier_ups()
+    for name in shadowed:
+      for call, holders in self._builtin_sites.pop(name):
+        call.builtin = None
+        for holder in holders:
+          _discard_compiled(holder)
+    memoization.invalidate(self.interpreter.settings)
+
+  def _index_builtin_sites(self, program: Program) -> None:
+    holders: Dict[int, List[ASTNode]] = {}
+    for node in walk(program):
+      if isinstance(node, _COMPILED_NODES):
+        for child in walk(node):
+          if type(child) == Call:
+            holders.setdefault(id(child), []).append(node)
+
+    for node in walk(program):
+      if type(node) == Call and cast(Call, node).builtin is not None:
+        call = cast(Call, node)
+        self._builtin_sites.setdefault(call.builtin.name, []).append(
+            (call, holders.get(id(call), [])))
+
+
+def _outside_functions(node: ASTNode) -> Iterator[ASTNode]:
+  pending: List[ASTNode] = [node]
+  while pending:
+    current = pending.pop()
+    yield current
+    if type(current) != Function:
+      pending.extend(children(current))
+
+
+def _discard_compiled(node: Any) -> None:
+  if type(node) == Function:
+    node.tier_requested = False
+    node.purity = None
+  node.compiled = None
+
+
+def _copy_environment(env: Environment, copies: Dict[int, Any]) -> Environment:
+  copied = copies.get(id(env))
+  if copied is not None:
+    return cast(Environment, copied)
+
+  outer = _copy_environment(env.outer, copies) if env.outer is not None else None
+  copied = copies[id(env)] = Environment(outer)
+  copied.budget, copied.modules, copied.settings = env.budget, env.modules, env.settings
+  copied.store = {name: _copy_value(value, copies) for name, value in env.store.items()}
+  return copied
+
+
+def _copy_value(value: Object, copies: Dict[int, Any]) -> Object:
+  value_type = type(value)
+  if value_type != object_function.Function and value_type != Map:
+    return value
+
+  copied = copies.get(id(value))
+  if copied is not None:
+    return cast(Object, copied)
+  if value_type == Map:
+    mapping = copies[id(value)] = Map({})
+    mapping.pairs = {key: _copy_value(item, copies)
+                     for key, item in cast(Map, value).pairs.items()}
+    return mapping
+
+  function = cast(object_function.Function, value)
+  closure = copies[id(value)] = object_function.Function(function.definition, function.env)
+  closure.env = _copy_environment(function.env, copies)
+  return closure
+
+
+@contextmanager
+def _interpreted(programs: List[Program], options: Settings) -> Iterator[int]:
+  tiering.wait_for_tier_ups()
+  compiled = [(node, node.compiled) for program in programs for node in walk(program)
+              if isinstance(node, _COMPILED_NODES) and node.compiled is not None]
+  threshold = options.tier_threshold
+  options.tier_threshold = cast(int, math.inf)
+  for node, _ in compiled:
+    node.compiled = None
+  try:
+    yield len(compiled)
+  finally:
+    options.tier_threshold = threshold
+    for node, code in compiled:
+      node.compiled = code
+
+
+def _count_objects() -> 'Counter[str]':
+  return Counter(type(value).__name__ for value in gc.get_objects()
+                 if isinstance(value, Object))
+
+
+def _result_line(result: Optional[Object]) -> str:
+  return f'result: {result.inspect() if result is not None else None}'
+
+
+def _phase_line(phases: PhaseTimes, evaluate: float) -> str:
+  return f'lex {_format_seconds(phases.lex)}, parse {_format_seconds(phases.parse)}, ' \
+      f'resolve {_format_seconds(phases.resolve)}, evaluate {_format_seconds(evaluate)}'
+
+
+def _format_seconds(seconds: float) -> str:
+  if seconds < 1e-3:
+    return f'{seconds * 1e6:.1f} us'
+  if seconds < 1:
+    return f'{seconds * 1e3:.2f} ms'
+  return f'{seconds:.2f} s'
+
+
+def _format_bytes(size: int) -> str:
+  if abs(size) < 1024:
+    return f'{size} B'
+  if abs(size) < 1024 * 1024:
+    return f'{size / 1024:.1f} KiB'
+  return f'{size / (1024 * 1024):.1f} MiB'
+
+
+def _truncate(text: str, width: int) -> str:
+  return text if len(text) <= width else text[:width - 3] + '...'
+
 
 def _print_parse_errors(errors: List[str]) -> None:
   for error in errors:
@@ -17,14 +370,23 @@ def _print_parse_errors(errors: List[str]) -> None:
 
 
 def start_repl() -> None:
+  session = ReplSession()
   while (source := input('>> ')) != 'exit()':
-    lexer: Lexer = Lexer(source)
-    parser: Parser = Parser(lexer)
-    program: Program = parser.parse_program()
-    if len(parser.errors) > 0:
-      _print_parse_errors(parser.errors)
+    try:
+      if source.startswith(':'):
+        print(session.command(source))
+        continue
+      evaluated = session.run(source)
+    except ParseError as error:
+      _print_parse_errors(error.errors)
       continue
 
-    evaluated = evaluate(program)
     if evaluated is not None:
       print(evaluated.inspect())
+
+
+_COMMANDS: Dict[str, Callable[[ReplSession, str], str]] = {
+    ':time': ReplSession._time,
+    ':profile': ReplSession._profile,
+    ':mem': ReplSession._mem,
+}
@@ -0,0 +1,56 @@
+from typing import AbstractSet, Callable, Iterable, List, Optional, Set, cast
+
+from lpp.ast.call import Call
+from lpp.ast.walk import walk
+from lpp.ast.function import Function
+from lpp.ast.node_base import ASTNode
+from lpp.builtins import lookup_builtin
+from lpp.ast.indentifier import Identifier
+from lpp.ast.let_statement import LetStatement
+from lpp.ast.for_statement import ForStatement
+from lpp.ast.import_statement import ImportStatement
+
+
+Exports = Callable[[str], Set[str]]
+
+
+def resolve_builtins(node: ASTNode,
+                     shadowed: AbstractSet[str] = frozenset(),
+                     exports: Optional[Exports] = None) -> int:
+  nodes: List[ASTNode] = list(walk(node))
+  bound = _bound_names(nodes, exports)
+  resolved = 0
+
+  for current in nodes:
+    if type(current) != Call:
+      continue
+
+    call = cast(Call, current)
+    call.builtin = None
+    if isinstance(call.function, Identifier) and call.function.value not in bound \
+        and call.function.value not in shadowed:
+      call.builtin = lookup_builtin(call.function.value)
+      resolved += call.builtin is not None
+
+  return resolved
+
+
+def _bound_names(nodes: Iterable[ASTNode], exports: Optional[Exports]) -> Set[str]:
+  names: Set[str] = set()
+  for node in nodes:
+    node_type = type(node)
+    if node_type == LetStatement:
+      let_statement = cast(LetStatement, node)
+      if let_statement.name is not None:
+        names.add(let_statement.name.value)
+    elif node_type == ForStatement:
+      for_statement = cast(ForStatement, node)
+      if for_statement.variable is not None:
+        names.add(for_statement.variable.value)
+    elif node_type == ImportStatement and exports is not None:
+      names.update(exports(cast(ImportStatement, node).module))
+    elif node_type == Function:
+      names.update(parameter.value
+                   for parameter in cast(Function, node).parameters)
+
+  return names
@@ -0,0 +1,268 @@
+import io
+import os
+import math
+import stat
+import json
+import socketserver
+from hashlib import sha256
+from time import perf_counter
+from collections import OrderedDict
+from threading import Lock, Semaphore
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (IO, Any, Dict, Mapping, Optional, Sequence, Tuple, cast, get_args,
+                    get_type_hints)
+
+import lpp.vector as vector
+from lpp.builtins import Output, capture_output, release_output, unbox
+from lpp.object.error import Error
+from lpp.object.array import Array
+from lpp.limits import Limits
+from lpp.interpreter import ParseError
+from lpp.engine import DEFAULT_CAPACITY, Engine
+
+
+DEFAULT_WORKERS = 4
+PIPELINE_DEPTH = 64
+PROGRAM_IDS = 4096
+
+_INVALID_JSON = 'Invalid JSON request: {}'
+_NOT_AN_OBJECT = 'Request must be a JSON object'
+_MISSING_SOURCE = "Request needs a 'source' or a 'program'"
+_UNKNOWN_PROGRAM = 'Unknown program: {}'
+_INVALID_SOURCE = "'source' must be a string"
+_INVALID_BINDINGS = "'bindings' must be an object"
+_INVALID_LIMITS = "'limits' must be an object"
+_INVALID_LIMIT = 'Invalid limit {}: {!r}'
+_UNKNOWN_OP = 'Unknown op: {}'
+_NO_UNIX_SOCKETS = 'Unix domain sockets are not available on this platform'
+_INTERNAL_ERROR = 'Internal error: {}: {}'
+
+Response = Dict[str, Any]
+
+_LIMIT_TYPES = {name: (int, float) if get_args(hint)[0] is float else (int,)
+                for name, hint in get_type_hints(Limits).items()}
+
+
+class Server:
+
+  def __init__(self,
+               workers: int = DEFAULT_WORKERS,
+               capacity: int = DEFAULT_CAPACITY,
+               limits: Optional[Limits] = Limits(),
+               search_path: Optional[Sequence[str]] = None,
+               pipeline_depth: int = PIPELINE_DEPTH) -> None:
+    self.engine = Engine(capacity, limits, search_path)
+    self.limits = limits
+    self.workers = workers
+    self.pipeline_depth = pipeline_depth
+    self.requests = 0
+    self._sources: 'OrderedDict[str, str]' = OrderedDict()
+    self._lock = Lock()
+    self._executor = ThreadPoolExecutor(max_workers=workers,
+                                        thread_name_prefix='lpp-server')
+
+  def handle(self, line: str, received: Optional[float] = None) -> Response:
+    start = perf_counter()
+    received = received if received is not None else start
+    with self._lock:
+      self.requests += 1
+
+    try:
+      request = json.loads(line)
+    except ValueError as error:
+      return _failure(None, 'REQUEST', _INVALID_JSON.format(error))
+    if type(request) is not dict:
+      return _failure(None, 'REQUEST', _NOT_AN_OBJECT)
+
+    request_id = request.get('id')
+    op = request.get('op', 'eval')
+    if op == 'stats':
+      return {'id': request_id, 'ok': True, 'stats': self.stats()}
+    if op != 'eval':
+      return _failure(request_id, 'REQUEST', _UNKNOWN_OP.format(op))
+
+    try:
+      response = self._evaluate(request, start)
+    except ParseError as error:
+      response = _failure(request_id, 'PARSE', str(error))
+    except ValueError as error:
+      response = _failure(request_id, 'REQUEST', str(error))
+    except Exception as error:
+      response = _failure(request_id, 'INTERNAL',
+                          _INTERNAL_ERROR.format(type(error).__name__, error))
+
+    timing = response.setdefault('timing', {})
+    timing['queued_ms'] = _milliseconds(start - received)
+    timing['total_ms'] = _milliseconds(perf_counter() - received)
+    return response
+
+  def serve_stream(self, requests: IO[str], responses: IO[str]) -> None:
+    write_lock = Lock()
+    slots = Semaphore(self.pipeline_depth)
+
+    def respond(future: 'Future[Response]') -> None:
+      try:
+        response = future.result()
+      except Exception as error:
+        response = _failure(None, 'INTERNAL', repr(error))
+
+      try:
+        payload = json.dumps(response, allow_nan=False)
+      except (TypeError, ValueError) as error:
+        payload = json.dumps(_failure(response.get('id'), 'INTERNAL',
+                                   _INTERNAL_ERROR.format(type(error).__name__, error)))
+
+      try:
+        with write_lock:
+          responses.write(payload + '\n')
+          responses.flush()
+      except (OSError, ValueError):
+        pass
+      finally:
+        slots.release()
+
+    for line in requests:
+      if not line.strip():
+        continue
+      received = perf_counter()
+      slots.acquire()
+      self._executor.submit(self.handle, line, received).add_done_callback(respond)
+
+    for _ in range(self.pipeline_depth):
+      slots.acquire()
+
+  def listen_unix(self, path: str) -> socketserver.BaseServer:
+    if not hasattr(socketserver, 'ThreadingUnixStreamServer'):
+      raise OSError(_NO_UNIX_SOCKETS)
+    if os.path.exists(path) and stat.S_ISSOCK(os.stat(path).st_mode):
+      os.unlink(path)
+
+    listener = socketserver.ThreadingUnixStreamServer(path, _ConnectionHandler)
+    listener.daemon_threads = True
+    setattr(listener, 'evaluation_server', self)
+    return listener
+
+  def serve_unix(self, path: str) -> None:
+    with self.listen_unix(path) as listener:
+      try:
+        listener.serve_forever()
+      finally:
+        os.unlink(path)
+
+  def stats(self) -> Dict[str, Any]:
+    engine = self.engine.stats()
+    return {'requests': self.requests, 'workers': self.workers,
+            'programs': engine.size, 'capacity': engine.capacity,
+            'hits': engine.hits, 'misses': engine.misses,
+            'evictions': engine.evictions, 'hit_rate': engine.hit_rate}
+
+  def close(self) -> None:
+    self._executor.shutdown()
+
+  def __enter__(self) -> 'Server':
+    return self
+
+  def __exit__(self, *exc_info: object) -> None:
+    self.close()
+
+  def _evaluate(self, request: Mapping[str, Any], start: float) -> Response:
+    source, program_id = self._source(request)
+    bindings = request.get('bindings') or {}
+    if type(bindings) is not dict:
+      raise ValueError(_INVALID_BINDINGS)
+    limits = self._limits(request.get('limits'))
+
+    compiled = self.engine.compile(source, bindings)
+    compiled_at = perf_counter()
+    output = Output()
+    token = capture_output(output)
+    try:
+      result = compiled.run(bindings, limits)
+    finally:
+      release_output(token)
+    finished = perf_counter()
+
+    response: Response = {'id': request.get('id'), 'program': program_id}
+    if output.lines:
+      response['output'] = output.text()
+    if type(result) == Error:
+      error = cast(Error, result)
+      response.update(ok=False, kind=error.kind.name, error=error.message)
+    else:
+      response['ok'] = True
+      response['result'] = result.inspect() if result is not None else None
+      response['type'] = result.type().name if result is not None else None
+      value = _json_value(result)
+      if value is not None:
+        response['value'] = value
+
+    response['timing'] = {'compile_ms': _milliseconds(compiled_at - start),
+                          'run_ms': _milliseconds(finished - compiled_at)}
+    return response
+
+  def _source(self, request: Mapping[str, Any]) -> Tuple[str, str]:
+    source = request.get('source')
+    with self._lock:
+      if source is not None:
+        if type(source) is not str:
+          raise ValueError(_INVALID_SOURCE)
+        program_id = sha256(source.encode('utf-8')).hexdigest()[:16]
+        self._sources[program_id] = source
+        self._sources.move_to_end(program_id)
+        while len(self._sources) > PROGRAM_IDS:
+          self._sources.popitem(last=False)
+        return source, program_id
+
+      program_id = request.get('program')
+      if program_id is None:
+        raise ValueError(_MISSING_SOURCE)
+      source = self._sources.get(program_id) if type(program_id) is str else None
+      if source is None:
+        raise ValueError(_UNKNOWN_PROGRAM.format(program_id))
+      self._sources.move_to_end(program_id)
+      return source, program_id
+
+  def _limits(self, requested: Any) -> Optional[Limits]:
+    if requested is None:
+      return None
+    if type(requested) is not dict:
+      raise ValueError(_INVALID_LIMITS)
+
+    base = self.limits if self.limits is not None else Limits(*[None] * len(Limits._fields))
+    values = base._asdict()
+    for name, value in requested.items():
+      accepted = _LIMIT_TYPES.get(name, ())
+      if type(value) not in accepted or value <= 0:
+        raise ValueError(_INVALID_LIMIT.format(name, value))
+      ceiling = values[name]
+      values[name] = value if ceiling is None else min(ceiling, value)
+    return Limits(**values)
+
+
+class _ConnectionHandler(socketserver.StreamRequestHandler):
+
+  def handle(self) -> None:
+    server = cast(Server, getattr(self.server, 'evaluation_server'))
+    requests = io.TextIOWrapper(self.rfile, encoding='utf-8')
+    responses = io.TextIOWrapper(cast(Any, self.wfile), encoding='utf-8',
+                                 write_through=True)
+    server.serve_stream(requests, responses)
+
+
+def _failure(request_id: Any, kind: str, message: str) -> Response:
+  return {'id': request_id, 'ok': False, 'kind': kind, 'error': message}
+
+
+def _json_value(result: Any) -> Any:
+  if type(result) == Array:
+    return [_finite(value) for value in vector.to_list(cast(Array, result).values)]
+  value = unbox(result) if result is not None else None
+  return _finite(value) if type(value) in (int, float, bool, str) else None
+
+
+def _finite(value: Any) -> Any:
+  return None if type(value) is float and not math.isfinite(value) else value
+
+
+def _milliseconds(seconds: float) -> float:
+  return round(seconds * 1000, 3)
@@ -0,0 +1,22 @@
+class Settings:
+
+  def __init__(self,
+               adaptive: bool = False,
+               tier_threshold: int = 64,
+               tier_in_background: bool = True,
+               memoize_all: bool = False,
+               memo_size: int = 1024) -> None:
+    self.adaptive = adaptive
+    self.tier_threshold = tier_threshold
+    self.tier_in_background = tier_in_background
+    self.memoize_all = memoize_all
+    self.memo_size = memo_size
+    self.memo_generation = 0
+    self.memo_cleared = 0
+
+  def copy(self) -> 'Settings':
+    return Settings(self.adaptive, self.tier_threshold, self.tier_in_background,
+                    self.memoize_all, self.memo_size)
+
+
+defaults = Settings()
@@ -0,0 +1,187 @@
+import gc
+import os
+import sys
+import pickle
+from time import perf_counter
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import get_all_start_methods, get_context
+from typing import Iterable, List, NamedTuple, Optional, Sequence, Tuple, cast
+
+import lpp.tiering as tiering
+from lpp.object.error import Error
+from lpp.ast.program import Program
+from lpp.limits import Limits
+from lpp.interpreter import Interpreter, ParseError
+from lpp.object.environment import Environment
+
+
+SNAPSHOT_VERSION = 2
+SNAPSHOT_SUFFIX = '.lpps'
+
+_PRELUDE_FAILED = 'Prelude {} failed: {}'
+_INVALID_SNAPSHOT = 'Cannot load snapshot {}: {}'
+_INCOMPATIBLE_SNAPSHOT = 'Snapshot {} was written by {}, this is {}'
+_SNAPSHOT_TOO_DEEP = 'Interpreter state is nested too deeply to snapshot'
+_NO_FORK = 'Fork server needs the fork start method, which this platform lacks'
+_REQUEST_DIED = 'Request process exited without a result: status {}'
+_INTERNAL_ERROR = 'Internal error: {}: {}'
+
+SnapshotHeader = Tuple[int, str]
+
+_LOAD_ERRORS = (EOFError, pickle.UnpicklingError, AttributeError, ImportError,
+                LookupError, TypeError, ValueError)
+
+
+class SnapshotError(Exception):
+  pass
+
+
+class ServedResult(NamedTuple):
+  output: Optional[str]
+  error: Optional[str]
+  seconds: float
+
+  @property
+  def ok(self) -> bool:
+    return self.error is None
+
+
+def warm_interpreter(preludes: Iterable[str],
+                     limits: Optional[Limits] = Limits(),
+                     search_path: Optional[Sequence[str]] = None) -> Interpreter:
+  interpreter = Interpreter(limits=limits, search_path=search_path)
+  for path in preludes:
+    with open(path, encoding='utf-8') as prelude:
+      evaluated = interpreter.run(prelude.read())
+    if type(evaluated) == Error:
+      raise SnapshotError(_PRELUDE_FAILED.format(path, cast(Error, evaluated).message))
+
+  tiering.wait_for_tier_ups()
+  return interpreter
+
+
+def save_snapshot(interpreter: Interpreter, path: str) -> None:
+  tiering.wait_for_tier_ups()
+  header: SnapshotHeader = (SNAPSHOT_VERSION, _runtime_tag())
+  temporary = f'{path}.{os.getpid()}.tmp'
+  try:
+    with open(temporary, 'wb') as snapshot:
+      pickle.dump(header, snapshot, pickle.HIGHEST_PROTOCOL)
+      pickle.dump(interpreter, snapshot, pickle.HIGHEST_PROTOCOL)
+    os.replace(temporary, path)
+  except RecursionError:
+    raise SnapshotError(_SNAPSHOT_TOO_DEEP) from None
+  finally:
+    if os.path.exists(temporary):
+      os.unlink(temporary)
+
+
+def load_snapshot(path: str) -> Interpreter:
+  collecting = gc.isenabled()
+  gc.disable()
+  try:
+    with open(path, 'rb') as snapshot:
+      header: SnapshotHeader = pickle.load(snapshot)
+      if header != (SNAPSHOT_VERSION, _runtime_tag()):
+        raise SnapshotError(_INCOMPATIBLE_SNAPSHOT.format(path, header,
+                                                          _runtime_tag()))
+      interpreter = pickle.load(snapshot)
+  except _LOAD_ERRORS as error:
+    raise SnapshotError(_INVALID_SNAPSHOT.format(path, error)) from None
+  finally:
+    if collecting:
+      gc.enable()
+
+  if type(interpreter) != Interpreter:
+    raise SnapshotError(_INVALID_SNAPSHOT.format(path, type(interpreter).__name__))
+  return cast(Interpreter, interpreter)
+
+
+class ForkServer:
+
+  def __init__(self, interpreter: Interpreter,
+               workers: Optional[int] = None) -> None:
+    if 'fork' not in get_all_start_methods():
+      raise SnapshotError(_NO_FORK)
+
+    tiering.wait_for_tier_ups()
+    gc.collect()
+    gc.freeze()
+    self._executor = ProcessPoolExecutor(max_workers=workers,
+                                         mp_context=get_context('fork'),
+                                         initializer=_adopt,
+                                         initargs=(interpreter,))
+    self._executor.submit(os.getpid).result()
+
+  def submit(self, source: str) -> 'Future[ServedResult]':
+    return self._executor.submit(_serve, source)
+
+  def map(self, sources: Iterable[str]) -> List[ServedResult]:
+    return list(self._executor.map(_serve, sources))
+
+  def close(self) -> None:
+    self._executor.shutdown()
+    gc.unfreeze()
+
+  def __enter__(self) -> 'ForkServer':
+    return self
+
+  def __exit__(self, *exc_info: object) -> None:
+    self.close()
+
+
+def _runtime_tag() -> str:
+  return f'{sys.implementation.cache_tag}-{sys.byteorder}'
+
+
+_warm: Optional[Interpreter] = None
+
+
+def _adopt(interpreter: Interpreter) -> None:
+  global _warm
+  _warm = interpreter
+
+
+def _serve(source: str) -> ServedResult:
+  start = perf_counter()
+  interpreter = cast(Interpreter, _warm)
+  scope = Environment(interpreter.globals)
+  try:
+    program = interpreter.parse(source, scope)
+  except ParseError as error:
+    return ServedResult(None, str(error), perf_counter() - start)
+
+  reader, writer = os.pipe()
+  pid = os.fork()
+  if pid == 0:
+    os.close(reader)
+    try:
+      with os.fdopen(writer, 'wb') as pipe:
+        result = _evaluate(interpreter, program, scope, start)
+        pickle.dump(result, pipe, pickle.HIGHEST_PROTOCOL)
+    finally:
+      os._exit(0)
+
+  os.close(writer)
+  with os.fdopen(reader, 'rb') as pipe:
+    payload = pipe.read()
+  _, status = os.waitpid(pid, 0)
+  if not payload:
+    return ServedResult(None, _REQUEST_DIED.format(status), perf_counter() - start)
+  return cast(ServedResult, pickle.loads(payload))
+
+
+def _evaluate(interpreter: Interpreter, program: Program,
+              scope: Environment, start: float) -> ServedResult:
+  try:
+    evaluated = interpreter.evaluate(program, scope)
+  except Exception as error:
+    return ServedResult(None, _INTERNAL_ERROR.format(type(error).__name__, error),
+                        perf_counter() - start)
+
+  seconds = perf_counter() - start
+  if type(evaluated) == Error:
+    return ServedResult(None, evaluated.inspect(), seconds)
+
+  output = evaluated.inspect() if evaluated is not None else None
+  return ServedResult(output, None, seconds)
@@ -0,0 +1,588 @@
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Type, cast
+
+from lpp.ast.call import Call
+from lpp.ast.map import MapLiteral
+from lpp.ast.array import ArrayLiteral
+from lpp.ast.block import Block
+from lpp.ast.infix import Infix
+from lpp.ast.bool import Boolean
+from lpp.ast.prefix import Prefix
+from lpp.ast.logical import Logical
+from lpp.object.error import Error
+from lpp.object.builtin import Builtin
+from lpp.ast.program import Program
+from lpp.ast.if_expression import If
+from lpp.ast.function import Function
+from lpp.ast.node_base import ASTNode
+from lpp.ast.number import Float, Integer
+from lpp.ast.quickened import GENERIC_NODES
+from lpp.ast.string import StringLiteral
+from lpp.ast.indentifier import Identifier
+from lpp.object.object_base import Object
+from lpp.limits import Budget, activate, deactivate
+from lpp.ast.let_statement import LetStatement
+from lpp.ast.for_statement import ForStatement
+from lpp.ast.import_statement import ImportStatement
+from lpp.object.environment import Environment
+from lpp.ast.while_statement import WhileStatement
+from lpp.ast.return_statement import ReturnStatement
+from lpp.ast.update_statement import UpdateStatement
+from lpp.ast.expressions_statement import ExpressionStatement
+from lpp.evaluator import (
+    NULL,
+    _SHORT_CIRCUIT_VALUES,
+    _bind,
+    _build_array,
+    _build_map,
+    _check_call,
+    _dispatch_infix_expression,
+    _dispatch_prefix_expression,
+    _evaluate_import_statement,
+    _evaluate_string,
+    _evaluate_update_statement,
+    _exits_loop,
+    _function_environment,
+    _is_truthy,
+    _iterate,
+    _lookup_identifier,
+    _to_boolean_object,
+)
+
+import lpp.object.numbers as object_numbers
+import lpp.object.function as object_function
+import lpp.object.return_object as object_return
+
+
+Values = List[Optional[Object]]
+Task = Tuple[Callable[..., None], Any, Environment, Any]
+Tasks = List[Task]
+
+
+class StackMachine:
+
+  def __init__(self, node: ASTNode, env: Optional[Environment] = None) -> None:
+    env = env if env is not None else Environment()
+    self._tasks: Tasks = [_schedule(node, env)]
+    self._values: Values = []
+    self._budget = env.budget
+    self.steps = 0
+    if self._budget is not None:
+      self._budget.start()
+
+  @property
+  def done(self) -> bool:
+    return not self._tasks
+
+  @property
+  def result(self) -> Optional[Object]:
+    assert self.done
+    return self._values[-1] if self._values else None
+
+  @property
+  def depth(self) -> int:
+    return len(self._tasks)
+
+  def run(self, max_steps: Optional[int] = None) -> bool:
+    budget = self._budget
+    if budget is None:
+      return self._run(max_steps, None)
+
+    token = activate(budget.limits)
+    try:
+      return self._run(max_steps, budget)
+    finally:
+      deactivate(token)
+
+  def _run(self, max_steps: Optional[int], budget: Optional[Budget]) -> bool:
+    tasks = self._tasks
+    values = self._values
+    pop = tasks.pop
+
+    if max_steps is None:
+      while tasks:
+        if budget is not None:
+          budget.fuel -= 1
+          if budget.fuel < 0 and self._exhausted(budget):
+            break
+        handler, node, env, state = pop()
+        handler(tasks, values, node, env, state)
+        self.steps += 1
+      return True
+
+    for _ in range(max_steps):
+      if not tasks:
+        break
+      if budget is not None:
+        budget.fuel -= 1
+        if budget.fuel < 0 and self._exhausted(budget):
+          break
+      handler, node, env, state = pop()
+      handler(tasks, values, node, env, state)
+      self.steps += 1
+
+    return not tasks
+
+  def _exhausted(self, budget: Budget) -> bool:
+    error = budget.refuel()
+    if error is None:
+      return False
+
+    self._tasks.clear()
+    self._values[:] = [error]
+    return True
+
+
+def evaluate_iterative(node: ASTNode,
+                       env: Optional[Environment] = None) -> Optional[Object]:
+  machine = StackMachine(node, env)
+  machine.run()
+  return machine.result
+
+
+def _schedule(node: Any, env: Environment) -> Task:
+  return (_VISITORS.get(type(node), _visit_unknown), node, env, None)
+
+
+def _visit_unknown(tasks: Tasks, values: Values,
+                   node: ASTNode, env: Environment, state: Any) -> None:
+  values.append(None)
+
+
+def _visit_integer(tasks: Tasks, values: Values,
+                   node: Integer, env: Environment, state: Any) -> None:
+  values.append(object_numbers.Integer(cast(int, node.value)))
+
+
+def _visit_float(tasks: Tasks, values: Values,
+                 node: Float, env: Environment, state: Any) -> None:
+  values.append(object_numbers.Float(cast(float, node.value)))
+
+
+def _visit_boolean(tasks: Tasks, values: Values,
+                   node: Boolean, env: Environment, state: Any) -> None:
+  values.append(_to_boolean_object(cast(bool, node.value)))
+
+
+def _visit_string(tasks: Tasks, values: Values,
+                  node: StringLiteral, env: Environment, state: Any) -> None:
+  values.append(_evaluate_string(node, env))
+
+
+def _visit_identifier(tasks: Tasks, values: Values,
+                      node: Identifier, env: Environment, state: Any) -> None:
+  values.append(_lookup_identifier(node.value, env))
+
+
+def _visit_function(tasks: Tasks, values: Values,
+                    node: Function, env: Environment, state: Any) -> None:
+  values.append(object_function.Function(node, env))
+
+
+def _integer_leaf(node: Integer, env: Environment) -> Object:
+  return object_numbers.Integer(cast(int, node.value))
+
+
+def _float_leaf(node: Float, env: Environment) -> Object:
+  return object_numbers.Float(cast(float, node.value))
+
+
+def _boolean_leaf(node: Boolean, env: Environment) -> Object:
+  return _to_boolean_object(cast(bool, node.value))
+
+
+def _identifier_leaf(node: Identifier, env: Environment) -> Object:
+  return _lookup_identifier(node.value, env)
+
+
+def _visit_expression_statement(tasks: Tasks, values: Values,
+                                node: ExpressionStatement,
+                                env: Environment, state: Any) -> None:
+  tasks.append(_schedule(node.expression, env))
+
+
+def _visit_prefix(tasks: Tasks, values: Values,
+                  node: Prefix, env: Environment, state: Any) -> None:
+  leaf = _LEAVES.get(type(node.right))
+  if leaf is not None:
+    values.append(_dispatch_prefix_expression(node, leaf(node.right, env)))
+    return
+
+  tasks.append((_apply_prefix, node, env, None))
+  tasks.append(_schedule(node.right, env))
+
+
+def _apply_prefix(tasks: Tasks, values: Values,
+                  node: Prefix, env: Environment, state: Any) -> None:
+  right = cast(Object, values.pop())
+  values.append(_dispatch_prefix_expression(node, right))
+
+
+def _visit_infix(tasks: Tasks, values: Values,
+                 node: Infix, env: Environment, state: Any) -> None:
+  left_leaf = _LEAVES.get(type(node.left))
+  right_leaf = _LEAVES.get(type(node.right))
+  if left_leaf is not None and right_leaf is not None:
+    values.append(_dispatch_infix_expression(node,
+                                             left_leaf(node.left, env),
+                                             right_leaf(node.right, env)))
+    return
+
+  tasks.append((_apply_infix, node, env, None))
+  tasks.append(_schedule(node.right, env))
+  tasks.append(_schedule(node.left, env))
+
+
+def _apply_infix(tasks: Tasks, values: Values,
+                 node: Infix, env: Environment, state: Any) -> None:
+  right = cast(Object, values.pop())
+  left = cast(Object, values.pop())
+  values.append(_dispatch_infix_expression(node, left, right))
+
+
+def _visit_logical(tasks: Tasks, values: Values,
+                   node: Logical, env: Environment, state: Any) -> None:
+  tasks.append((_continue_logical, node, env, None))
+  tasks.append(_schedule(node.left, env))
+
+
+def _continue_logical(tasks: Tasks, values: Values,
+                      node: Logical, env: Environment, state: Any) -> None:
+  node.evaluations += 1
+  if values[-1] is _SHORT_CIRCUIT_VALUES[node.operator]:
+    node.short_circuits += 1
+    return
+
+  tasks.append((_apply_infix, node, env, None))
+  tasks.append(_schedule(node.right, env))
+
+
+def _visit_array(tasks: Tasks, values: Values,
+                 node: ArrayLiteral, env: Environment, state: Any) -> None:
+  tasks.append((_collect_element, node, env, 0))
+
+
+def _collect_element(tasks: Tasks, values: Values,
+                     node: ArrayLiteral, env: Environment, index: int) -> None:
+  if _unwind_error(values, index):
+    return
+
+  if index < len(node.elements):
+    tasks.append((_collect_element, node, env, index + 1))
+    tasks.append(_schedule(node.elements[index], env))
+    return
+
+  elements = cast(List[Object], values[len(values) - index:])
+  del values[len(values) - index:]
+  values.append(_build_array(elements))
+
+
+def _visit_map(tasks: Tasks, values: Values,
+               node: MapLiteral, env: Environment, state: Any) -> None:
+  tasks.append((_collect_entry, node, env, 0))
+
+
+def _collect_entry(tasks: Tasks, values: Values,
+                   node: MapLiteral, env: Environment, index: int) -> None:
+  if _unwind_error(values, index):
+    return
+
+  if index < 2 * len(node.keys):
+    tasks.append((_collect_entry, node, env, index + 1))
+    expressions = node.values if index % 2 else node.keys
+    tasks.append(_schedule(expressions[index // 2], env))
+    return
+
+  entries = cast(List[Object], values[len(values) - index:])
+  del values[len(values) - index:]
+  values.append(_build_map(entries))
+
+
+def _unwind_error(values: Values, collected: int) -> bool:
+  if collected == 0 or type(values[-1]) != Error:
+    return False
+
+  error = values.pop()
+  del values[len(values) - collected + 1:]
+  values.append(error)
+  return True
+
+
+def _visit_let(tasks: Tasks, values: Values,
+               node: LetStatement, env: Environment, state: Any) -> None:
+  tasks.append((_bind_let, node, env, None))
+  tasks.append(_schedule(node.value, env))
+
+
+def _bind_let(tasks: Tasks, values: Values,
+              node: LetStatement, env: Environment, state: Any) -> None:
+  value = values.pop()
+  if type(value) == Error:
+    values.append(value)
+    return
+
+  assert node.name is not None
+  _bind(env, node.name.value, cast(Object, value))
+  values.append(None)
+
+
+def _visit_return(tasks: Tasks, values: Values,
+                  node: ReturnStatement, env: Environment, state: Any) -> None:
+  tasks.append((_wrap_return, node, env, None))
+  tasks.append(_schedule(node.return_value, env))
+
+
+def _wrap_return(tasks: Tasks, values: Values,
+                 node: ReturnStatement, env: Environment, state: Any) -> None:
+  values.append(object_return.Return(cast(Object, values.pop())))
+
+
+def _visit_block(tasks: Tasks, values: Values,
+                 node: Block, env: Environment, state: Any) -> None:
+  _start_statements(tasks, values, node, env, _continue_block)
+
+
+def _continue_block(tasks: Tasks, values: Values,
+                    node: Block, env: Environment, index: int) -> None:
+  result = values[-1]
+  if type(result) == object_return.Return or type(result) == Error \
+      or index == len(node.statements):
+    return
+
+  values.pop()
+  tasks.append((_continue_block, node, env, index + 1))
+  tasks.append(_schedule(node.statements[index], env))
+
+
+def _visit_program(tasks: Tasks, values: Values,
+                   node: Program, env: Environment, state: Any) -> None:
+  _start_statements(tasks, values, node, env, _continue_program)
+
+
+def _continue_program(tasks: Tasks, values: Values,
+                      node: Program, env: Environment, index: int) -> None:
+  result = values[-1]
+  if type(result) == object_return.Return:
+    values[-1] = cast(object_return.Return, result).value
+    return
+  elif type(result) == Error or index == len(node.statements):
+    return
+
+  values.pop()
+  tasks.append((_continue_program, node, env, index + 1))
+  tasks.append(_schedule(node.statements[index], env))
+
+
+def _start_statements(tasks: Tasks, values: Values, node: Any,
+                      env: Environment,
+                      continuation: Callable[..., None]) -> None:
+  if not node.statements:
+    values.append(None)
+    return
+
+  tasks.append((continuation, node, env, 1))
+  tasks.append(_schedule(node.statements[0], env))
+
+
+def _visit_if(tasks: Tasks, values: Values,
+              node: If, env: Environment, state: Any) -> None:
+  tasks.append((_choose_branch, node, env, None))
+  tasks.append(_schedule(node.condition, env))
+
+
+def _choose_branch(tasks: Tasks, values: Values,
+                   node: If, env: Environment, state: Any) -> None:
+  condition = cast(Object, values.pop())
+  if _is_truthy(condition):
+    tasks.append(_schedule(node.consequence, env))
+  elif node.alternative is not None:
+    tasks.append(_schedule(node.alternative, env))
+  else:
+    values.append(NULL)
+
+
+def _visit_while(tasks: Tasks, values: Values,
+                 node: WhileStatement, env: Environment, state: Any) -> None:
+  tasks.append((_check_while, node, env, None))
+  tasks.append(_schedule(node.condition, env))
+
+
+def _check_while(tasks: Tasks, values: Values,
+                 node: WhileStatement, env: Environment, state: Any) -> None:
+  condition = cast(Object, values.pop())
+  if type(condition) == Error:
+    values.append(condition)
+  elif not _is_truthy(condition):
+    values.append(None)
+  else:
+    tasks.append((_after_while_body, node, env, None))
+    tasks.append(_schedule(node.body, env))
+
+
+def _after_while_body(tasks: Tasks, values: Values,
+                      node: WhileStatement, env: Environment, state: Any) -> None:
+  if _exits_loop(values[-1]):
+    return
+
+  values.pop()
+  _visit_while(tasks, values, node, env, None)
+
+
+def _visit_for(tasks: Tasks, values: Values,
+               node: ForStatement, env: Environment, state: Any) -> None:
+  tasks.append((_start_for, node, env, None))
+  tasks.append(_schedule(node.iterable, env))
+
+
+def _start_for(tasks: Tasks, values: Values,
+               node: ForStatement, env: Environment, state: Any) -> None:
+  iterable = cast(Object, values.pop())
+  if type(iterable) == Error:
+    values.append(iterable)
+    return
+
+  iterator = _iterate(iterable)
+  if type(iterator) == Error:
+    values.append(cast(Error, iterator))
+    return
+  _next_iteration(tasks, values, node, env, iterator)
+
+
+def _next_iteration(tasks: Tasks, values: Values, node: ForStatement,
+                    env: Environment, iterator: Iterator[Object]) -> None:
+  value = next(iterator, None)
+  if value is None:
+    values.append(None)
+    return
+
+  assert node.variable is not None
+  env.set(node.variable.value, value)
+  tasks.append((_after_for_body, node, env, iterator))
+  tasks.append(_schedule(node.body, env))
+
+
+def _after_for_body(tasks: Tasks, values: Values, node: ForStatement,
+                    env: Environment, iterator: Iterator[Object]) -> None:
+  if _exits_loop(values[-1]):
+    return
+
+  values.pop()
+  _next_iteration(tasks, values, node, env, iterator)
+
+
+def _visit_update(tasks: Tasks, values: Values,
+                  node: UpdateStatement, env: Environment, state: Any) -> None:
+  values.append(_evaluate_update_statement(node, env))
+
+
+def _visit_import(tasks: Tasks, values: Values,
+                  node: ImportStatement, env: Environment, state: Any) -> None:
+  values.append(_evaluate_import_statement(node, env))
+
+
+def _visit_call(tasks: Tasks, values: Values,
+                node: Call, env: Environment, state: Any) -> None:
+  tasks.append((_collect_argument, node, env, 0))
+  if node.builtin is not None:
+    values.append(node.builtin)
+  else:
+    tasks.append(_schedule(node.function, env))
+
+
+def _collect_argument(tasks: Tasks, values: Values,
+                      node: Call, env: Environment, index: int) -> None:
+  if type(values[-1]) == Error:
+    error = values.pop()
+    del values[len(values) - index:]
+    values.append(error)
+    return
+
+  arguments = node.arguments
+  while index < len(arguments):
+    argument = arguments[index]
+    leaf = _LEAVES.get(type(argument))
+    if leaf is None:
+      tasks.append((_collect_argument, node, env, index + 1))
+      tasks.append(_schedule(argument, env))
+      return
+
+    index += 1
+    value = leaf(argument, env)
+    if type(value) == Error:
+      del values[len(values) - index:]
+      values.append(value)
+      return
+    values.append(value)
+
+  args = cast(List[Object], values[len(values) - index:])
+  del values[len(values) - index:]
+  function = cast(Object, values.pop())
+
+  error = _check_call(function, args)
+  if error is not None:
+    values.append(error)
+    return
+  if type(function) == Builtin:
+    values.append(cast(Builtin, function).function(*args))
+    return
+
+  function = cast(object_function.Function, function)
+  budget = env.budget
+  if budget is not None:
+    error = budget.enter_call()
+    if error is not None:
+      values.append(error)
+      return
+
+  tasks.append((_unwrap_call_result, node, env, None))
+  tasks.append(_schedule(function.body,
+                         _function_environment(function, args)))
+
+
+def _unwrap_call_result(tasks: Tasks, values: Values,
+                        node: Call, env: Environment, state: Any) -> None:
+  if env.budget is not None:
+    env.budget.depth -= 1
+
+  result = values[-1]
+  if type(result) == object_return.Return:
+    values[-1] = cast(object_return.Return, result).value
+  elif result is None:
+    values[-1] = NULL
+
+
+_VISITORS: Dict[Type, Callable[..., None]] = {
+    Program: _visit_program,
+    ExpressionStatement: _visit_expression_statement,
+    Integer: _visit_integer,
+    Float: _visit_float,
+    Boolean: _visit_boolean,
+    StringLiteral: _visit_string,
+    ArrayLiteral: _visit_array,
+    MapLiteral: _visit_map,
+    Identifier: _visit_identifier,
+    Prefix: _visit_prefix,
+    Infix: _visit_infix,
+    Logical: _visit_logical,
+    Block: _visit_block,
+    If: _visit_if,
+    LetStatement: _visit_let,
+    ReturnStatement: _visit_return,
+    WhileStatement: _visit_while,
+    ForStatement: _visit_for,
+    UpdateStatement: _visit_update,
+    ImportStatement: _visit_import,
+    Function: _visit_function,
+    Call: _visit_call,
+}
+
+_LEAVES: Dict[Type, Callable[[Any, Environment], Object]] = {
+    Integer: _integer_leaf,
+    Float: _float_leaf,
+    Boolean: _boolean_leaf,
+    Identifier: _identifier_leaf,
+}
+
+for _quick_type, _generic_type in GENERIC_NODES.items():
+  _VISITORS[_quick_type] = _VISITORS[_generic_type]
+  if _generic_type in _LEAVES:
+    _LEAVES[_quick_type] = _LEAVES[_generic_type]
@@ -0,0 +1,107 @@
+import os
+from time import perf_counter
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Callable, List, NamedTuple, Optional, Set
+
+import lpp.settings as settings
+import lpp.ast.function as ast_function
+
+if TYPE_CHECKING:
+  from concurrent.futures import Future, ThreadPoolExecutor
+
+
+class TierUpEvent(NamedTuple):
+  definition: ast_function.Function
+  calls: int
+  compile_seconds: float
+
+
+TierUpHook = Callable[[TierUpEvent], None]
+
+
+_hooks: List[TierUpHook] = []
+_pending: Set['Future'] = set()
+_executor: Optional['ThreadPoolExecutor'] = None
+_lock = Lock()
+
+
+def configure(calls: Optional[int] = None,
+              in_background: Optional[bool] = None) -> None:
+  if calls is not None:
+    settings.defaults.tier_threshold = calls
+  if in_background is not None:
+    settings.defaults.tier_in_background = in_background
+
+
+def add_tier_up_hook(hook: TierUpHook) -> None:
+  _hooks.append(hook)
+
+
+def remove_tier_up_hook(hook: TierUpHook) -> None:
+  _hooks.remove(hook)
+
+
+def request_tier_up(definition: ast_function.Function,
+                    in_background: bool = True) -> None:
+  with _lock:
+    if definition.tier_requested:
+      return
+    definition.tier_requested = True
+
+  if not in_background:
+    _tier_up(definition)
+    return
+
+  from concurrent.futures import ThreadPoolExecutor
+
+  global _executor
+  with _lock:
+    if _executor is None:
+      _executor = ThreadPoolExecutor(max_workers=1,
+                                     thread_name_prefix='lpp-tier-up')
+    future = _executor.submit(_tier_up, definition)
+    _pending.add(future)
+  future.add_done_callback(_forget)
+
+
+def compile_loop(node: Any) -> None:
+  from lpp.compiler import compile_loop as compile_loop_body
+
+  node.compiled = compile_loop_body(node)
+
+
+def wait_for_tier_ups() -> None:
+  with _lock:
+    futures = list(_pending)
+
+  for future in futures:
+    future.result()
+
+
+def _forget(future: 'Future') -> None:
+  with _lock:
+    _pending.discard(future)
+
+
+def _reset_after_fork() -> None:
+  global _executor, _lock
+  _executor = None
+  _pending.clear()
+  _lock = Lock()
+
+
+def _tier_up(definition: ast_function.Function) -> None:
+  from lpp.compiler import compile_function
+
+  start = perf_counter()
+  code = compile_function(definition)
+  elapsed = perf_counter() - start
+
+  definition.compiled = code
+  event = TierUpEvent(definition, definition.calls, elapsed)
+  for hook in list(_hooks):
+    hook(event)
+
+
+if hasattr(os, 'register_at_fork'):
+  os.register_at_fork(after_in_child=_reset_after_fork)
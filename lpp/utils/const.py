@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Dict, FrozenSet
 
 from lpp.utils.type import Precedence, TokenType
 
@@ -16,7 +16,10 @@ TOKENS: Dict[str, TokenType] = {
     ')': TokenType.RPAREN,
     '{': TokenType.LBRACE,
     '}': TokenType.RBRACE,
+    '[': TokenType.LBRACKET,
+    ']': TokenType.RBRACKET,
     ',': TokenType.COMMA,
+    ':': TokenType.COLON,
     ';': TokenType.SEMICOLON,
     '<': TokenType.LT,
     '<=': TokenType.LT_OR_EQUALS,
@@ -32,13 +35,17 @@ KEIWORDS: Dict[str, TokenType] = {
     'def': TokenType.FUNCTION,
     'else': TokenType.ELSE,
     'false': TokenType.FALSE,
+    'for': TokenType.FOR,
     'if': TokenType.IF,
+    'import': TokenType.IMPORT,
+    'in': TokenType.IN,
     'let': TokenType.LET,
     'mod': TokenType.MOD,
     'not': TokenType.NEGATION,
     'or': TokenType.OR,
     'return': TokenType.RETURN,
     'true': TokenType.TRUE,
+    'while': TokenType.WHILE,
 }
 
 
@@ -58,3 +65,16 @@ PRECEDENCES: Dict[TokenType, Precedence] = {
     TokenType.AND: Precedence.LOGIC,
     TokenType.OR: Precedence.LOGIC,
 }
+
+
+INITIAL_TOKEN_CHARACTERS: FrozenSet[str] = frozenset('=<>!+-')
+
+TWO_CHARACTER_TOKENS: FrozenSet[str] = frozenset(
+    token for token in TOKENS if len(token) == 2)
+
+LETTER_INITIALS: FrozenSet[str] = frozenset(
+    'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_')
+
+LETTERS: FrozenSet[str] = LETTER_INITIALS | frozenset('áéíóúÁÉÍÓÚ0123456789')
+
+STRING_TERMINATORS: FrozenSet[str] = frozenset(('', '\n'))
@@ -5,6 +5,7 @@ from enum import Enum, IntEnum, auto, unique
 class TokenType(Enum):
   AND = auto()
   ASSIGN = auto()
+  COLON = auto()
   COMMA = auto()
   DECR = auto()
   DIFF = auto()
@@ -14,15 +15,19 @@ class TokenType(Enum):
   EQUALS = auto()
   FALSE = auto()
   FLOAT = auto()
+  FOR = auto()
   FUNCTION = auto()
   GT = auto()
   GT_OR_EQUALS = auto()
   IDENT = auto()
   IF = auto()
   ILLEGAL = auto()
+  IMPORT = auto()
+  IN = auto()
   INCR = auto()
   INT = auto()
   LBRACE = auto()
+  LBRACKET = auto()
   LET = auto()
   LPAREN = auto()
   LT = auto()
@@ -35,11 +40,13 @@ class TokenType(Enum):
   PLUS = auto()
   POWER = auto()
   RBRACE = auto()
+  RBRACKET = auto()
   RETURN = auto()
   RPAREN = auto()
   SEMICOLON = auto()
   STR = auto()
   TRUE = auto()
+  WHILE = auto()
 
 
 class Precedence(IntEnum):
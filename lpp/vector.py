@@ -0,0 +1,303 @@
+import math
+from array import array
+from itertools import repeat
+from operator import add, and_, eq, ge, gt, le, lt, mul, ne, or_, sub
+from typing import Any, Callable, Dict, Iterable, List, Sequence, Union
+
+try:
+  import numpy
+except ImportError:
+  numpy = None
+
+
+HAS_NUMPY = numpy is not None
+
+Storage = Any
+Operand = Union[Storage, int, float]
+
+ARITHMETIC_OPERATORS = ('+', '-', '*', '/', '^')
+COMPARISON_OPERATORS = ('<', '<=', '>', '>=', '==', '!=')
+REDUCTIONS = ('sum', 'min', 'max', 'mean')
+EXACT_LIMIT = 1 << 53
+LOGICAL_OPERATORS = ('and', 'or', '==', '!=')
+
+
+def from_values(values: Sequence[float]) -> Storage:
+  if numpy is not None:
+    return numpy.array(values, dtype=numpy.float64)
+  return array('d', values)
+
+
+def as_column(values: Sequence[Any]) -> Storage:
+  if numpy is not None:
+    storage = numpy.asarray(values)
+    if storage.dtype == numpy.bool_:
+      return storage
+    return storage.astype(numpy.float64)
+
+  if isinstance(values, array) and values.typecode in ('b', 'd'):
+    return values
+  values = list(values)
+  if values and all(type(value) is bool for value in values):
+    return array('b', values)
+  return array('d', values)
+
+
+def full(length: int, value: Union[bool, int, float]) -> Storage:
+  if numpy is not None:
+    return numpy.full(length, value)
+  return array('b' if type(value) is bool else 'd', [value]) * length
+
+
+def zeros(length: int) -> Storage:
+  if numpy is not None:
+    return numpy.zeros(length)
+  return array('d', bytes(8 * length))
+
+
+def ones(length: int) -> Storage:
+  if numpy is not None:
+    return numpy.ones(length)
+  return array('d', [1.0]) * length
+
+
+def arange(start: float, stop: float, step: float) -> Storage:
+  if numpy is not None:
+    return numpy.arange(start, stop, step, dtype=numpy.float64)
+
+  length = arange_length(start, stop, step)
+  return array('d', (start + index * step for index in range(length)))
+
+
+def arange_length(start: float, stop: float, step: float) -> int:
+  return max(0, math.ceil((stop - start) / step))
+
+
+def linspace(start: float, stop: float, count: int) -> Storage:
+  if numpy is not None:
+    return numpy.linspace(start, stop, count)
+  if count == 1:
+    return array('d', [start])
+
+  step = (stop - start) / (count - 1)
+  return array('d', (start + index * step for index in range(count)))
+
+
+def is_storage(value: Any) -> bool:
+  return isinstance(value, array) or (numpy is not None
+                                      and isinstance(value, numpy.ndarray))
+
+
+def is_boolean(storage: Storage) -> bool:
+  if numpy is not None and isinstance(storage, numpy.ndarray):
+    return storage.dtype == numpy.bool_
+  return storage.typecode == 'b'
+
+
+def to_list(storage: Storage) -> List[Any]:
+  if is_boolean(storage):
+    return [bool(value) for value in storage]
+  return [float(value) for value in storage]
+
+
+def binary(operator: str, left: Operand, right: Operand) -> Storage:
+  if numpy is not None:
+    return _numpy_binary(operator, left, right)
+
+  left_length = len(left) if is_storage(left) else None
+  right_length = len(right) if is_storage(right) else None
+  length = _broadcast_length(left_length, right_length)
+  left_values = _expand(left, left_length, length)
+  right_values = _expand(right, right_length, length)
+
+  if operator in COMPARISON_OPERATORS:
+    return array('b', map(_COMPARISONS[operator], left_values, right_values))
+  return array('d', map(_ARITHMETIC[operator], left_values, right_values))
+
+
+def logical(operator: str, left: Operand, right: Operand) -> Storage:
+  if numpy is not None:
+    return _NUMPY_LOGICAL[operator](left, right)
+
+  left_length = len(left) if is_storage(left) else None
+  right_length = len(right) if is_storage(right) else None
+  length = _broadcast_length(left_length, right_length)
+  return array('b', map(_LOGICAL[operator],
+                        _expand(left, left_length, length),
+                        _expand(right, right_length, length)))
+
+
+def invert(mask: Storage) -> Storage:
+  if numpy is not None:
+    return numpy.logical_not(mask)
+  return array('b', (not value for value in mask))
+
+
+def where(mask: Storage, left: Operand, right: Operand) -> Storage:
+  if numpy is not None:
+    return numpy.where(mask, left, right)
+
+  length = len(mask)
+  typecode = 'b' if _is_boolean_operand(left) and _is_boolean_operand(right) else 'd'
+  left_values = _expand(left, len(left) if is_storage(left) else None, length)
+  right_values = _expand(right, len(right) if is_storage(right) else None, length)
+  return array(typecode, [left_value if selected else right_value
+                          for selected, left_value, right_value
+                          in zip(mask, left_values, right_values)])
+
+
+def any_true(mask: Storage) -> bool:
+  if numpy is not None:
+    return bool(mask.any())
+  return any(mask)
+
+
+def indices(mask: Storage) -> List[int]:
+  if numpy is not None:
+    return numpy.flatnonzero(mask).tolist()
+  return [index for index, value in enumerate(mask) if value]
+
+
+def inexact_rows(storage: Storage, mask: Storage) -> List[int]:
+  if numpy is not None:
+    with numpy.errstate(all='ignore'):
+      return numpy.flatnonzero(mask & ~(numpy.abs(storage) < EXACT_LIMIT)).tolist()
+  if not storage or -EXACT_LIMIT < min(storage) and max(storage) < EXACT_LIMIT:
+    return []
+  return [index for index, (value, selected) in enumerate(zip(storage, mask))
+          if selected and not -EXACT_LIMIT < value < EXACT_LIMIT]
+
+
+def has_large_integers(storage: Storage) -> bool:
+  if numpy is not None:
+    magnitude = numpy.abs(storage)
+    return bool(((magnitude > EXACT_LIMIT) & (magnitude < math.inf)).any())
+  if not storage or -EXACT_LIMIT <= min(storage) and max(storage) <= EXACT_LIMIT:
+    return False
+  return any(EXACT_LIMIT < abs(value) < math.inf for value in storage)
+
+
+def negate(storage: Storage) -> Storage:
+  if numpy is not None:
+    return -storage.astype(numpy.float64)
+  return array('d', (-value for value in storage))
+
+
+def reduce(name: str, storage: Storage) -> float:
+  if len(storage) == 0 and name != 'sum':
+    raise ValueError(f'{name} of an empty array')
+
+  if numpy is not None:
+    return float(getattr(numpy, name)(storage.astype(numpy.float64)))
+  if name == 'sum':
+    return math.fsum(storage)
+  if name == 'mean':
+    return math.fsum(storage) / len(storage)
+  return float(min(storage) if name == 'min' else max(storage))
+
+
+def _numpy_binary(operator: str, left: Operand, right: Operand) -> Storage:
+  assert numpy is not None
+  if operator in ARITHMETIC_OPERATORS:
+    left = _as_float(left)
+    right = _as_float(right)
+
+  with numpy.errstate(all='ignore'):
+    return _NUMPY_OPERATIONS[operator](left, right)
+
+
+def _as_float(operand: Operand) -> Operand:
+  if is_storage(operand) and operand.dtype == numpy.bool_:
+    return operand.astype(numpy.float64)
+  return operand
+
+
+def _is_boolean_operand(operand: Operand) -> bool:
+  return is_boolean(operand) if is_storage(operand) else type(operand) is bool
+
+
+def _broadcast_length(left: Any, right: Any) -> int:
+  if left is None:
+    return right
+  if right is None or left == right or right == 1:
+    return left
+  if left == 1:
+    return right
+  raise ValueError(f'operands could not be broadcast together: {left} and {right}')
+
+
+def _expand(operand: Operand, length: Any, target: int) -> Iterable[Any]:
+  if length is None:
+    return repeat(operand, target)
+  if length == 1 and target != 1:
+    return repeat(operand[0], target)
+  return operand
+
+
+def _divide(left: float, right: float) -> float:
+  try:
+    return left / right
+  except ZeroDivisionError:
+    if left == 0 or math.isnan(left):
+      return math.nan
+    return math.copysign(math.inf, left) * math.copysign(1.0, right)
+
+
+def _power(left: float, right: float) -> float:
+  try:
+    result = float(left) ** right
+  except OverflowError:
+    return math.inf
+  except ZeroDivisionError:
+    return math.inf
+  return result if type(result) is float else math.nan
+
+
+_ARITHMETIC: Dict[str, Callable[[Any, Any], float]] = {
+    '+': add,
+    '-': sub,
+    '*': mul,
+    '/': _divide,
+    '^': _power,
+}
+
+_COMPARISONS: Dict[str, Callable[[Any, Any], bool]] = {
+    '<': lt,
+    '<=': le,
+    '>': gt,
+    '>=': ge,
+    '==': eq,
+    '!=': ne,
+}
+
+_LOGICAL: Dict[str, Callable[[Any, Any], Any]] = {
+    'and': and_,
+    'or': or_,
+    '==': eq,
+    '!=': ne,
+}
+
+_NUMPY_OPERATIONS: Dict[str, Callable[[Any, Any], Any]] = {}
+if numpy is not None:
+  _NUMPY_OPERATIONS = {
+      '+': numpy.add,
+      '-': numpy.subtract,
+      '*': numpy.multiply,
+      '/': numpy.true_divide,
+      '^': numpy.power,
+      '<': numpy.less,
+      '<=': numpy.less_equal,
+      '>': numpy.greater,
+      '>=': numpy.greater_equal,
+      '==': numpy.equal,
+      '!=': numpy.not_equal,
+  }
+
+_NUMPY_LOGICAL: Dict[str, Callable[[Any, Any], Any]] = {}
+if numpy is not None:
+  _NUMPY_LOGICAL = {
+      'and': numpy.logical_and,
+      'or': numpy.logical_or,
+      '==': numpy.equal,
+      '!=': numpy.not_equal,
+  }
@@ -1,4 +1,10 @@
-from lpp.repl import start_repl
+import sys
+from time import perf_counter
+from argparse import ArgumentParser
+from typing import TYPE_CHECKING, Iterator, List, Optional
+
+if TYPE_CHECKING:
+  from lpp.batch import ScriptResult
 
 
 message = '''
@@ -12,13 +18,122 @@ message = '''
 '''
 
 
-def main() -> None:
+def _build_parser() -> ArgumentParser:
+  parser = ArgumentParser(prog='lpp')
+  commands = parser.add_subparsers(dest='command')
+
+  run = commands.add_parser('run', help='evaluate lpp scripts in a process pool')
+  run.add_argument('files', nargs='+')
+  run.add_argument('--jobs', '-j', type=int, default=None,
+                   help='worker processes (defaults to the CPU count)')
+  run.add_argument('--snapshot', '-s', default=None,
+                   help='fork workers from an interpreter restored from this snapshot')
+
+  snapshot = commands.add_parser('snapshot',
+                                 help='save an interpreter warmed by prelude scripts')
+  snapshot.add_argument('output')
+  snapshot.add_argument('preludes', nargs='*')
+
+  serve = commands.add_parser('serve',
+                              help='evaluate JSON-lines requests from stdin or a socket')
+  serve.add_argument('--socket', default=None,
+                     help='listen on this Unix domain socket instead of stdin')
+  serve.add_argument('--workers', '-w', type=int, default=4)
+  serve.add_argument('--capacity', type=int, default=256,
+                     help='compiled programs kept in the cache')
+  serve.add_argument('--max-steps', type=int, default=10_000_000)
+  serve.add_argument('--timeout', type=float, default=None,
+                     help='seconds each request may run')
+
+  return parser
+
+
+def _run(files: List[str], jobs: Optional[int], snapshot: Optional[str]) -> int:
+  from lpp.batch import run_batch, summarize
+
+  start = perf_counter()
+  results = []
+  scripts = run_batch(files, jobs=jobs) if snapshot is None \
+      else _serve_from_snapshot(files, jobs, snapshot)
+  for result in scripts:
+    results.append(result)
+    if result.ok:
+      print(f'{result.path}: {result.output}')
+    else:
+      print(f'{result.path}: {result.error}', file=sys.stderr)
+
+  report = summarize(results, perf_counter() - start)
+  print(report.format(), file=sys.stderr)
+  return 1 if report.failures else 0
+
+
+def _serve_from_snapshot(files: List[str],
+                         jobs: Optional[int],
+                         snapshot: str) -> Iterator['ScriptResult']:
+  from lpp.batch import ScriptResult
+  from lpp.snapshot import ForkServer, load_snapshot
+
+  sources = []
+  for path in files:
+    with open(path, encoding='utf-8') as script:
+      sources.append(script.read())
+
+  with ForkServer(load_snapshot(snapshot), workers=jobs) as server:
+    for path, served in zip(files, server.map(sources)):
+      yield ScriptResult(path, *served)
+
+
+def _snapshot(output: str, preludes: List[str]) -> int:
+  from lpp.snapshot import SnapshotError, save_snapshot, warm_interpreter
+
+  start = perf_counter()
+  try:
+    save_snapshot(warm_interpreter(preludes), output)
+  except SnapshotError as error:
+    print(error, file=sys.stderr)
+    return 1
+
+  print(f'{output}: {len(preludes)} preludes in {perf_counter() - start:.2f}s',
+        file=sys.stderr)
+  return 0
+
+
+def _serve(socket: Optional[str], workers: int, capacity: int,
+           max_steps: int, timeout: Optional[float]) -> int:
+  from lpp.limits import Limits
+  from lpp.server import Server
+
+  limits = Limits(max_steps=max_steps, timeout=timeout)
+  with Server(workers=workers, capacity=capacity, limits=limits) as server:
+    if socket is None:
+      server.serve_stream(sys.stdin, sys.stdout)
+      return 0
+
+    try:
+      server.serve_unix(socket)
+    except KeyboardInterrupt:
+      pass
+  return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+  args = _build_parser().parse_args(argv)
+  if args.command == 'run':
+    return _run(args.files, args.jobs, args.snapshot)
+  if args.command == 'snapshot':
+    return _snapshot(args.output, args.preludes)
+  if args.command == 'serve':
+    return _serve(args.socket, args.workers, args.capacity, args.max_steps,
+                  args.timeout)
+
   print('Welcome!!!')
   print(message)
   print('shell!!')
 
+  from lpp.repl import start_repl
   start_repl()
+  return 0
 
 
 if __name__ == '__main__':
-  main()
+  sys.exit(main())
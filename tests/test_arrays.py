@@ -0,0 +1,90 @@
+from unittest import TestCase
+from typing import List, Optional
+
+from lpp.evaluator import evaluate
+from lpp.object.array import Array
+from lpp.interpreter import Interpreter
+from lpp.object.object_base import Object
+from lpp.stack_evaluator import evaluate_iterative
+
+
+class ArraysTest(TestCase):
+
+  def _evaluate(self, source: str) -> Optional[Object]:
+    return evaluate(Interpreter.parse(source))
+
+  def _check(self, tests: List[tuple]) -> None:
+    for source, expected in tests:
+      evaluated = self._evaluate(source)
+      assert evaluated is not None
+      self.assertEqual(evaluated.inspect(), expected, source)
+
+  def test_literals(self) -> None:
+    self._check([
+        ('[1, 2.5, -3]', '[1, 2.5, -3]'),
+        ('[]', '[]'),
+        ('[1 + 1, 2 * 3]', '[2, 6]'),
+        ('[1, true]', 'Error: Array elements must be numbers, got BOOLEAN'),
+        ('[1, x]', 'Error: Identifier not found: x'),
+    ])
+    self.assertIsInstance(self._evaluate('[1]'), Array)
+
+  def test_elementwise_operators(self) -> None:
+    self._check([
+        ('[1, 2, 3] + [10, 20, 30]', '[11, 22, 33]'),
+        ('[1, 2, 3] * 2 + 1', '[3, 5, 7]'),
+        ('10 - [1, 2]', '[9, 8]'),
+        ('[1, 2] / [4, 8]', '[0.25, 0.25]'),
+        ('2 ^ [1, 2, 3]', '[2, 4, 8]'),
+        ('-[1, 2]', '[-1, -2]'),
+        ('[1, 2, 3] > 1.5', '[false, true, true]'),
+        ('[1, 2] == [1, 3]', '[true, false]'),
+        ('[1, 2, 3] + [1]', '[2, 3, 4]'),
+        ('[1, 0, -1] / 0', '[inf, nan, -inf]'),
+        ('[1, 2] + [1, 2, 3]',
+         'Error: Shape mismatch: operands could not be broadcast together: 2 and 3'),
+        ('[1, 2] + true', 'Error: Type mismatch: ARRAY + BOOLEAN'),
+    ])
+
+  def test_builtins(self) -> None:
+    self._check([
+        ('sum([1, 2, 3.5])', '6.5'),
+        ('min([3, -1, 2])', '-1'),
+        ('max([3, -1, 2])', '3'),
+        ('mean([1, 2])', '1.5'),
+        ('sum([])', '0'),
+        ('sum([1, 2] < 2)', '1'),
+        ('len(zeros(4))', '4'),
+        ('ones(3)', '[1, 1, 1]'),
+        ('arange(4)', '[0, 1, 2, 3]'),
+        ('arange(1, 2, 0.25)', '[1, 1.25, 1.5, 1.75]'),
+        ('linspace(0, 1, 5)', '[0, 0.25, 0.5, 0.75, 1]'),
+        ('sum(arange(100000) * 2)', '9999900000'),
+        ('min([])', 'Error: Invalid argument to min: min of an empty array'),
+        ('sum(1)', 'Error: Argument to sum must be ARRAY or RANGE, got INTEGER'),
+        ('sum([1], [2])', 'Error: Wrong number of arguments: expected 1, got 2'),
+        ('zeros(-1)',
+         'Error: Argument to zeros must be a non-negative INTEGER, got INTEGER'),
+        ('let sum = def(x) { x }; sum(5)', '5'),
+    ])
+
+  def test_functions_over_arrays(self) -> None:
+    self._check([
+        ('let norm = def(v) { sum(v * v) }; norm([3, 4])', '25'),
+        ('let scale = def(v, k) { v * k }; mean(scale(arange(5), 2))', '4'),
+    ])
+
+  def test_stack_evaluator(self) -> None:
+    sources = [
+        '[1, 2, 3] * 2',
+        '[1, x, 3]',
+        '[1, 2 + true]',
+        'sum(arange(10))',
+        'len(1, 2)',
+    ]
+
+    for source in sources:
+      expected = self._evaluate(source)
+      evaluated = evaluate_iterative(Interpreter.parse(source))
+      assert expected is not None and evaluated is not None
+      self.assertEqual(evaluated.inspect(), expected.inspect())
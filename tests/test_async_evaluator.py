@@ -0,0 +1,98 @@
+import asyncio
+from unittest import TestCase
+from typing import List, Optional, cast
+from concurrent.futures import ProcessPoolExecutor
+
+from lpp.limits import Limits
+from lpp.evaluator import evaluate
+from lpp.object.error import Error, ErrorKind
+from lpp.interpreter import Interpreter
+from lpp.object.object_base import Object
+from lpp.async_evaluator import evaluate_async, run_in_executor
+
+
+FIB = '''
+    let fib = def(n) {
+      if (n < 2) {
+        return n;
+      }
+      return fib(n - 1) + fib(n - 2);
+    };
+    fib({n});
+'''
+
+
+class AsyncEvaluatorTest(TestCase):
+
+  def _inspect(self, value: Optional[Object]) -> Optional[str]:
+    return value.inspect() if value is not None else None
+
+  def test_matches_evaluate(self) -> None:
+    tests = [
+        FIB.replace('{n}', '12'),
+        'let a = 5; a * 2; a + true',
+        'if (1 < 2) { return 3; } 4',
+        '',
+    ]
+
+    for source in tests:
+      expected = evaluate(Interpreter.parse(source))
+      evaluated = asyncio.run(
+          evaluate_async(Interpreter.parse(source), yield_every=7))
+      self.assertEqual(self._inspect(evaluated), self._inspect(expected))
+
+  def test_yields_to_the_loop(self) -> None:
+    ticks: List[int] = []
+
+    async def ticker() -> None:
+      while True:
+        ticks.append(len(ticks))
+        await asyncio.sleep(0)
+
+    async def main() -> Optional[Object]:
+      task = asyncio.create_task(ticker())
+      result = await evaluate_async(Interpreter.parse(FIB.replace('{n}', '12')),
+                                    yield_every=100)
+      task.cancel()
+      return result
+
+    self.assertEqual(self._inspect(asyncio.run(main())), '144')
+    self.assertGreater(len(ticks), 10)
+
+  def test_cancellation(self) -> None:
+    async def main() -> None:
+      task = asyncio.create_task(
+          evaluate_async(Interpreter.parse(FIB.replace('{n}', '40')),
+                         yield_every=50))
+      await asyncio.sleep(0.01)
+      task.cancel()
+      await task
+
+    with self.assertRaises(asyncio.CancelledError):
+      asyncio.run(main())
+
+  def test_timeout(self) -> None:
+    env = Interpreter(limits=Limits(max_steps=None, timeout=0.05)).globals
+
+    evaluated = asyncio.run(evaluate_async(Interpreter.parse(FIB.replace('{n}', '40')),
+                                           env, yield_every=50))
+
+    self.assertIsInstance(evaluated, Error)
+    self.assertEqual(cast(Error, evaluated).kind, ErrorKind.TIMEOUT)
+
+  def test_invalid_yield_interval(self) -> None:
+    with self.assertRaises(ValueError):
+      asyncio.run(evaluate_async(Interpreter.parse('1'), yield_every=0))
+
+  def test_run_in_executor(self) -> None:
+    async def main() -> List[Optional[Object]]:
+      with ProcessPoolExecutor(max_workers=2) as executor:
+        return list(await asyncio.gather(
+            run_in_executor(FIB.replace('{n}', '10'), executor),
+            run_in_executor('5 + true', executor),
+            run_in_executor('1 + 1')))
+
+    results = asyncio.run(main())
+
+    self.assertEqual([self._inspect(result) for result in results],
+                     ['55', 'Error: Type mismatch: INTEGER + BOOLEAN', '2'])
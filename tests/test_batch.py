@@ -0,0 +1,102 @@
+import os
+from unittest import TestCase
+from unittest.mock import patch
+from tempfile import TemporaryDirectory
+from typing import List, Optional
+
+from lpp.interpreter import Interpreter
+from lpp.object.object_base import Object
+from lpp.batch import chunk_paths, percentile, run_batch, summarize
+
+
+class BatchTest(TestCase):
+
+  def setUp(self) -> None:
+    self._directory = TemporaryDirectory()
+
+  def tearDown(self) -> None:
+    self._directory.cleanup()
+
+  def _write(self, name: str, source: str) -> str:
+    path = os.path.join(self._directory.name, name)
+    with open(path, 'w', encoding='utf-8') as script:
+      script.write(source)
+    return path
+
+  def _scripts(self, count: int) -> List[str]:
+    return [self._write(f'script_{i}.lpp', f'let f = def(x) {{ x * {i} }}; f(2);')
+            for i in range(count)]
+
+  def test_run_batch_in_process_pool(self) -> None:
+    paths = self._scripts(12)
+
+    results = list(run_batch(paths, jobs=2, chunk_bytes=100))
+
+    self.assertEqual(sorted(result.path for result in results), sorted(paths))
+    outputs = {result.path: result.output for result in results}
+    for i, path in enumerate(paths):
+      self.assertEqual(outputs[path], str(i * 2))
+
+  def test_failures_are_reported(self) -> None:
+    paths = [
+        self._write('parse.lpp', 'let = 5;'),
+        self._write('runtime.lpp', '5 + true;'),
+        os.path.join(self._directory.name, 'missing.lpp'),
+        self._write('ok.lpp', '1 + 1'),
+    ]
+
+    results = {result.path: result for result in run_batch(paths, jobs=1)}
+
+    self.assertIn('no function found to parse =', results[paths[0]].error)
+    self.assertEqual(results[paths[1]].error,
+                     'Error: Type mismatch: INTEGER + BOOLEAN')
+    self.assertIsNotNone(results[paths[2]].error)
+    self.assertTrue(results[paths[3]].ok)
+    self.assertEqual(results[paths[3]].output, '2')
+
+    report = summarize(list(results.values()), wall_seconds=2.0)
+    self.assertEqual(report.scripts, 4)
+    self.assertEqual(report.failures, 3)
+    self.assertEqual(report.throughput, 2.0)
+
+  def test_host_exceptions_fail_only_their_script(self) -> None:
+    paths = self._scripts(4)
+    paths[1] = self._write('overflow.lpp', '2 ^ 2000 / 3;')
+
+    for jobs in (1, 2):
+      results = {result.path: result for result in run_batch(paths, jobs=jobs)}
+      self.assertEqual(len(results), 4)
+      self.assertFalse(results[paths[1]].ok)
+      self.assertEqual([results[path].output for path in paths[2:]], ['4', '6'])
+
+    run = Interpreter.run
+
+    def crash(interpreter: Interpreter, source: str) -> Optional[Object]:
+      if 'crash' in source:
+        raise RuntimeError('host failure')
+      return run(interpreter, source)
+
+    paths[1] = self._write('crash.lpp', 'crash;')
+    with patch.object(Interpreter, 'run', crash):
+      results = {result.path: result for result in run_batch(paths, jobs=1)}
+
+    self.assertEqual(results[paths[1]].error,
+                     'Internal error: RuntimeError: host failure')
+    self.assertEqual(results[paths[3]].output, '6')
+
+  def test_chunk_paths(self) -> None:
+    paths = self._scripts(5)
+    size = os.path.getsize(paths[0])
+
+    chunks = list(chunk_paths(paths, chunk_bytes=size * 2))
+
+    self.assertEqual([len(chunk) for chunk in chunks], [2, 2, 1])
+    self.assertEqual([path for chunk in chunks for path in chunk], paths)
+
+  def test_percentile(self) -> None:
+    latencies = [float(i) for i in range(1, 101)]
+
+    self.assertEqual(percentile(latencies, 0.5), 50.0)
+    self.assertEqual(percentile(latencies, 0.99), 99.0)
+    self.assertEqual(percentile(latencies, 1.0), 100.0)
+    self.assertEqual(percentile([], 0.5), 0.0)
@@ -0,0 +1,94 @@
+import io
+from unittest import TestCase
+from contextlib import redirect_stdout
+from typing import List, Optional, Tuple, cast
+
+from lpp.ast.call import Call
+from lpp.evaluator import evaluate
+from lpp.interpreter import Interpreter
+from lpp.object.object_base import Object
+from lpp.object.environment import Environment
+from lpp.stack_evaluator import evaluate_iterative
+from lpp.ast.expressions_statement import ExpressionStatement
+from lpp.builtins import box, lookup_builtin, register_builtin, unbox, unregister_builtin
+
+
+class BuiltinsTest(TestCase):
+
+  def _inspect(self, value: Optional[Object]) -> Optional[str]:
+    return value.inspect() if value is not None else None
+
+  def _check(self, tests: List[Tuple[str, str]]) -> None:
+    for source, expected in tests:
+      self.assertEqual(self._inspect(evaluate(Interpreter.parse(source))),
+                       expected, source)
+      self.assertEqual(self._inspect(evaluate_iterative(Interpreter.parse(source))),
+                       expected, source)
+
+  def test_native_builtins(self) -> None:
+    self._check([
+        ('abs(-3)', '3'),
+        ('abs(-2.5)', '2.5'),
+        ('min(3, 1, 2)', '1'),
+        ('max(range(10))', '9'),
+        ('max([1, 4.5])', '4.5'),
+        ('sum(range(101))', '5050'),
+        ('mean(range(4))', '1.5'),
+        ('len(range(0, 10, 2))', '5'),
+        ("int('42') + int(2.9)", '44'),
+        ("float('1.5')", '1.5'),
+        ("str(1.5) + str(true)", '1.5true'),
+        ('floor(sqrt(17))', '4'),
+        ('exp(0)', '1'),
+        ('abs(true)', 'Error: Argument to abs must be a number, got BOOLEAN'),
+        ("int('x')",
+         "Error: Invalid argument to int: invalid literal for int() with base 10: 'x'"),
+        ('log(0)', 'Error: Invalid argument to log: math domain error'),
+        ('min()', 'Error: Wrong number of arguments: expected at least 1, got 0'),
+        ('max(range(0))', 'Error: Invalid argument to max: max() arg is an empty sequence'),
+    ])
+
+  def test_print_writes_inspected_values(self) -> None:
+    output = io.StringIO()
+    with redirect_stdout(output):
+      result = evaluate(Interpreter.parse("print('total', 1 + 2, [1, 2])"))
+
+    self.assertEqual(output.getvalue(), 'total 3 [1, 2]\n')
+    self.assertEqual(self._inspect(result), 'null')
+
+  def test_calls_are_resolved_at_parse_time(self) -> None:
+    program = Interpreter.parse('len([1]); let f = def(abs) { abs(1) }; f(def(x) { -x })')
+    calls = [cast(Call, cast(ExpressionStatement, program.statements[0]).expression)]
+    self.assertIs(calls[0].builtin, lookup_builtin('len'))
+
+    self.assertEqual(self._inspect(evaluate(program)), '-1')
+    self.assertEqual(self._inspect(evaluate(Interpreter.parse('let len = 7; len'))), '7')
+
+    env = Environment()
+    env.set('sum', cast(Object, lookup_builtin('len')))
+    shadowed = Interpreter.parse('sum(range(3))', env)
+    self.assertIsNone(cast(Call, cast(ExpressionStatement,
+                                      shadowed.statements[0]).expression).builtin)
+    self.assertEqual(self._inspect(evaluate(shadowed, env)), '3')
+
+  def test_host_builtins(self) -> None:
+    def clamp(value: float, low: float = 0, high: float = 1) -> float:
+      return max(low, min(high, value))
+
+    register_builtin('clamp', clamp)
+    register_builtin('pair', lambda first, second: [first, second])
+    try:
+      self._check([
+          ('clamp(1.5) + clamp(-1, 2, 3)', '3'),
+          ('clamp(0.25, 0, 1)', '0.25'),
+          ('pair(1, 2.5)', '[1, 2.5]'),
+          ("pair('a', 1)", 'Error: Cannot convert host value of type list from pair'),
+          ('clamp()', 'Error: Wrong number of arguments: expected 1 to 3, got 0'),
+      ])
+    finally:
+      unregister_builtin('clamp')
+      unregister_builtin('pair')
+
+    self.assertIsNone(lookup_builtin('clamp'))
+    self.assertEqual(unbox(box('hola')), 'hola')
+    self.assertEqual(unbox(box(range(3))), range(3))
@@ -0,0 +1,110 @@
+from unittest import TestCase
+from typing import Any, Dict, List, Optional
+
+from lpp.evaluator import evaluate
+from lpp.interpreter import Interpreter
+from lpp.object.environment import Environment
+from lpp.builtins import to_number_object
+from lpp.columnar import compile_expression
+
+import lpp.object.bool as object_bool
+
+
+COLUMNS: Dict[str, List[Any]] = {
+    'x': [1, 0, -2, 3.5, 0],
+    'y': [2, 0, 1, 0, 4],
+    'flag': [True, False, True, False, True],
+}
+
+
+class ColumnarTest(TestCase):
+
+  def _row_wise(self, source: str, columns: Dict[str, List[Any]]) -> List[Optional[str]]:
+    program = Interpreter.parse(source)
+    results: List[Optional[str]] = []
+    for row in range(len(columns['x'])):
+      env = Environment()
+      for name, column in columns.items():
+        value = column[row]
+        env.set(name, (object_bool.TRUE if value else object_bool.FALSE)
+                if type(value) is bool else to_number_object(value))
+      result = evaluate(program, env)
+      results.append(result.inspect() if result is not None else None)
+    return results
+
+  def _check(self, source: str, vectorized: bool = True,
+             columns: Dict[str, List[Any]] = COLUMNS) -> None:
+    result = compile_expression(source).evaluate_batch(columns)
+    self.assertEqual(result.vectorized, vectorized, source)
+    self.assertEqual([value.inspect() if value is not None else None
+                      for value in result.objects()],
+                     self._row_wise(source, columns), source)
+
+  def test_matches_row_wise_evaluation(self) -> None:
+    sources = [
+        'x + y * 2 - 1',
+        'x ^ 2 >= y',
+        'if (x > 0) { x } else { -x }',
+        'if (flag) { x } else { if (y > 1) { y } else { 0 } }',
+        'flag and x > 0',
+        'not flag or y == 0',
+        'flag == (x > 0)',
+        'let z = x * 2; z + 1',
+        '1 + 2 * 3',
+    ]
+
+    for source in sources:
+      self._check(source)
+
+  def test_errors_are_reported_per_row(self) -> None:
+    result = compile_expression('if (flag) { y / x } else { y }').evaluate_batch(COLUMNS)
+
+    self.assertTrue(result.vectorized)
+    self.assertEqual(sorted(result.errors), [4])
+    self.assertEqual(result.errors[4].message, 'Division by zero')
+    self.assertEqual(result.value(0).inspect(), '2')
+
+    for source in ['x / y', 'x + flag', 'x and y', 'flag or y', 'missing + x',
+                   'x > 0 or x / 0 > 1', '-flag']:
+      self._check(source)
+
+  def test_arithmetic_edge_cases_match_row_wise_evaluation(self) -> None:
+    columns: Dict[str, List[Any]] = {'x': [-8, 0, 2, 4, 0.5], 'y': [1, 0, 3, 2, 10]}
+    cases = [
+        ('x ^ 0.5', True),
+        ('0 ^ -1 + x', True),
+        ('x ^ -1', True),
+        ('x * y', True),
+        ('x ^ 2000', False),
+        ('x ^ 100000', True),
+    ]
+    for source, vectorized in cases:
+      self._check(source, vectorized, columns)
+
+    result = compile_expression('x ^ 0.5').evaluate_batch(columns)
+    self.assertEqual(result.errors[0].message, 'Power has no real result: -8 ^ 0.5')
+    self.assertEqual(result.value(3).inspect(), '2')
+
+    large = {'x': [2 ** 60, 1], 'y': [1, 2]}
+    for source in ['x + 1', 'x * y', 'y']:
+      self._check(source, False, large)
+    self._check('x + 1', False, {'x': [float(2 ** 60), 1.0]})
+    self._check('x + y', False, {'x': [2 ** 53, 1], 'y': [1, 1]})
+    self._check('x + y', True, {'x': [1.5, float('nan'), float('inf')], 'y': [1, 1, 1]})
+
+  def test_falls_back_to_row_wise_evaluation(self) -> None:
+    self.assertFalse(compile_expression('def(a) { a }(x)').vectorized)
+    self._check('def(a) { a * 2 }(x)', vectorized=False)
+    self._check('if (x > 0) { 1 } else { true }', vectorized=False)
+    self._check('if (x) { y }', vectorized=False)
+
+  def test_column_validation(self) -> None:
+    expression = compile_expression('x + 1')
+    with self.assertRaises(ValueError):
+      expression.evaluate_batch({'x': [1, 2], 'y': [1]})
+    with self.assertRaises(ValueError):
+      expression.evaluate_batch({})
+
+    self.assertEqual([value.inspect() for value in
+                      compile_expression('2 * 3').evaluate_batch({}, rows=2).objects()],
+                     ['6', '6'])
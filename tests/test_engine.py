@@ -0,0 +1,84 @@
+from unittest import TestCase
+from typing import Optional, cast
+from concurrent.futures import ThreadPoolExecutor
+
+from lpp import Engine
+from lpp.limits import Limits
+from lpp.interpreter import ParseError
+from lpp.object.object_base import Object
+from lpp.object.error import Error, ErrorKind
+
+
+RULE = '''
+    let fee = def(amount) { if (amount > limit) { amount * rate } else { 0 } };
+    fee(amount) + max(0, bonus)
+'''
+
+
+class EngineTest(TestCase):
+
+  def _inspect(self, value: Optional[Object]) -> Optional[str]:
+    return value.inspect() if value is not None else None
+
+  def test_compiled_programs_run_with_bindings(self) -> None:
+    engine = Engine()
+    rule = engine.compile(RULE)
+
+    self.assertEqual(self._inspect(rule.run({'amount': 200, 'limit': 100,
+                                             'rate': 0.5, 'bonus': 3})), '103')
+    self.assertEqual(self._inspect(rule.run({'amount': 50, 'limit': 100,
+                                             'rate': 0.5, 'bonus': -1})), '0')
+    self.assertEqual(self._inspect(rule.run({'amount': 50, 'limit': 100})),
+                     'Error: Identifier not found: bonus')
+    self.assertEqual(self._inspect(engine.run('return x * 2; 0', {'x': 4})), '8')
+    self.assertIs(engine.compile(RULE), rule)
+
+    with self.assertRaises(AttributeError):
+      rule.source = 'changed'  # type: ignore
+    with self.assertRaises(ParseError):
+      engine.compile('let = 1')
+
+  def test_bindings_that_shadow_builtins_must_be_declared(self) -> None:
+    engine = Engine()
+    with self.assertRaises(ValueError):
+      engine.compile('max(1, 2)').run({'max': 5})
+
+    shadowing = engine.compile('max + 1', ['max'])
+    self.assertEqual(self._inspect(shadowing.run({'max': 5})), '6')
+    self.assertEqual(self._inspect(engine.run('len(xs)', {'xs': [1.0, 2.0]})), '2')
+
+  def test_lru_statistics(self) -> None:
+    engine = Engine(capacity=2)
+    for source in ['1', '2', '1', '3', '2']:
+      engine.compile(source)
+
+    stats = engine.stats()
+    self.assertEqual((stats.size, stats.capacity), (2, 2))
+    self.assertEqual((stats.hits, stats.misses, stats.evictions), (1, 4, 2))
+    self.assertAlmostEqual(stats.hit_rate, 0.2)
+
+    engine.clear()
+    self.assertEqual(engine.stats().size, 0)
+
+  def test_limits_apply_per_run(self) -> None:
+    engine = Engine(limits=Limits(max_steps=10_000))
+    spin = engine.compile('let i = 0; while (true) { i++; }')
+
+    for _ in range(2):
+      error = cast(Error, spin.run())
+      self.assertIsInstance(error, Error)
+      self.assertEqual(error.kind, ErrorKind.STEP_LIMIT)
+
+  def test_shared_across_threads(self) -> None:
+    engine = Engine(capacity=8)
+
+    def run(index: int) -> Optional[str]:
+      source = f'let f = def(n) {{ if (n < 2) {{ n }} else {{ f(n - 1) + f(n - 2) }} }}; ' \
+          f'f(n) + {index % 4}'
+      return self._inspect(engine.run(source, {'n': 10}))
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+      results = list(executor.map(run, range(64)))
+
+    self.assertEqual(results, [str(55 + index % 4) for index in range(64)])
+    self.assertEqual(engine.stats().size, 4)
@@ -51,6 +51,8 @@ class EvaluatorTest(TestCase):
         ('5 + 5', 10),
         ('(5 + (5 * 8)) ^ 2', 2025),
         ('5 - 10', -5),
+        ('5 - 5', 0),
+        ('0 * 3', 0),
         ('2 * 2 * 2 * 2', 16),
         ('2 * 5 - 3', 7),
         ('2 ^ 3', 8),
@@ -187,7 +189,15 @@ class EvaluatorTest(TestCase):
           } else {
             return true / false;
           }
-        ''', 'Unknown operator: BOOLEAN / BOOLEAN')
+        ''', 'Unknown operator: BOOLEAN / BOOLEAN'),
+        ('1 / 0;', 'Division by zero'),
+        ('let x = 2.5; x / (x - x);', 'Division by zero'),
+        ('0 ^ -1;', 'Division by zero'),
+        ('2.5 ^ 100000;', 'Numeric overflow: INTEGER ^ INTEGER'),
+        ('2 ^ 2000 / 3;', 'Numeric overflow: INTEGER / INTEGER'),
+        ('2 ^ 2000 + 0.5;', 'Numeric overflow: INTEGER + INTEGER'),
+        ('2 ^ 2000 * 0.5;', 'Numeric overflow: INTEGER * INTEGER'),
+        ('(0 - 8) ^ 0.5;', 'Power has no real result: -8 ^ 0.5'),
     ]
     for source, expected in tests:
       evaluated = self._evaluate_tests(source)
@@ -195,4 +205,89 @@ class EvaluatorTest(TestCase):
 
       evaluated = cast(Error, evaluated)
       self.assertEquals(evaluated.message, expected)
-      
\ No newline at end of file
+      
+  def test_let_evaluation(self) -> None:
+    tests: List[Tuple[str, int]] = [
+        ('let a = 5; a;', 5),
+        ('let a = 5 * 5; a;', 25),
+        ('let a = 5; let b = a; b;', 5),
+        ('let a = 5; let b = a; let c = a + b + 5; c;', 15),
+    ]
+
+    for source, expected in tests:
+      evaluated = self._evaluate_tests(source)
+      self._test_integer_object(evaluated, expected)
+
+  def test_function_application(self) -> None:
+    tests: List[Tuple[str, int]] = [
+        ('let identidad = def(x) { x }; identidad(5);', 5),
+        ('let identidad = def(x) { return x; }; identidad(5);', 5),
+        ('let doble = def(x) { 2 * x; }; doble(5);', 10),
+        ('let suma = def(x, y) { return x + y; }; suma(3, 8);', 11),
+        ('let suma = def(x, y) { x + y; }; suma(5 + 5, suma(10, 10));', 30),
+        ('def(x) { x }(5)', 5),
+        ('''
+            let sumador = def(x) {
+              def(y) { x + y };
+            };
+            let suma_dos = sumador(2);
+            suma_dos(3);
+         ''', 5),
+        ('''
+            let fib = def(n) {
+              if (n < 2) {
+                return n;
+              }
+              return fib(n - 1) + fib(n - 2);
+            };
+            fib(10);
+         ''', 55),
+    ]
+
+    for source, expected in tests:
+      evaluated = self._evaluate_tests(source)
+      self._test_integer_object(evaluated, expected)
+
+  def test_function_errors(self) -> None:
+    tests: List[Tuple[str, str]] = [
+        ('foobar;', 'Identifier not found: foobar'),
+        ('let a = 5; a(1);', 'Not a function: INTEGER'),
+        ('let f = def(x) { x }; f(1, 2);',
+         'Wrong number of arguments: expected 1, got 2'),
+        ('(true + false) + 1', 'Unknown operator: BOOLEAN + BOOLEAN'),
+        ('let f = def(x) { x + true }; f(1) * 2;',
+         'Type mismatch: INTEGER + BOOLEAN'),
+    ]
+
+    for source, expected in tests:
+      evaluated = self._evaluate_tests(source)
+      self.assertIsInstance(evaluated, Error)
+
+      evaluated = cast(Error, evaluated)
+      self.assertEqual(evaluated.message, expected)
+
+  def test_short_circuit_evaluation(self) -> None:
+    tests: List[Tuple[str, bool]] = [
+        ('false and undefined', False),
+        ('true or undefined', True),
+        ('true and 1 < 2', True),
+        ('false or 1 > 2', False),
+        ('let f = def(n) { f(n) }; false and f(1)', False),
+        ('false and 5', False),
+        ('true or 5', True),
+    ]
+
+    for source, expected in tests:
+      evaluated = self._evaluate_tests(source)
+      self._test_boolean_object(evaluated, expected)
+
+    evaluated = self._evaluate_tests('true and undefined')
+    self.assertIsInstance(evaluated, Error)
+    self.assertEqual(cast(Error, evaluated).message,
+                     'Identifier not found: undefined')
+
+    for source, message in [('true and 5', 'Type mismatch: BOOLEAN and INTEGER'),
+                            ('false or 5', 'Type mismatch: BOOLEAN or INTEGER')]:
+      evaluated = self._evaluate_tests(source)
+      self.assertIsInstance(evaluated, Error)
+      self.assertEqual(cast(Error, evaluated).message, message)
@@ -0,0 +1,89 @@
+from unittest import TestCase
+from typing import Dict, List, Optional
+
+import lpp.memoization as memoization
+from lpp.evaluator import evaluate
+from lpp.interpreter import Interpreter
+from lpp.columnar import compile_expression
+from lpp.object.object_base import Object
+from lpp.object.environment import Environment
+from lpp.ffi import expose, unexpose
+
+
+PRICES: Dict[str, float] = {'apple': 1.5, 'pear': 2.0}
+
+
+class FFITest(TestCase):
+
+  def setUp(self) -> None:
+    self.calls: List[int] = []
+
+  def tearDown(self) -> None:
+    memoization.configure(memoize_all=False)
+    for name in ('price', 'scale', 'discount', 'risk', 'bucket'):
+      try:
+        unexpose(name)
+      except KeyError:
+        pass
+
+  def _inspect(self, source: str, env: Optional[Environment] = None) -> str:
+    result: Optional[Object] = evaluate(Interpreter.parse(source, env), env)
+    assert result is not None
+    return result.inspect()
+
+  def test_converts_arguments_from_type_hints(self) -> None:
+    @expose
+    def price(item: str, quantity: int = 1) -> float:
+      return PRICES[item] * quantity
+
+    expose(lambda value, factor: value * factor, name='scale')
+
+    self.assertEqual(self._inspect("price('apple', 4) + price('pear')"), '8')
+    self.assertEqual(self._inspect('scale(2.5, 2)'), '5')
+    self.assertEqual(self._inspect("scale('ab', 2)"), 'abab')
+    self.assertEqual(self._inspect("price('apple', true)"),
+                     'Error: Argument to price must be an INTEGER, got BOOLEAN')
+    self.assertEqual(self._inspect("price('plum')"),
+                     "Error: Invalid argument to price: 'plum'")
+    self.assertEqual(self._inspect('price()'),
+                     'Error: Wrong number of arguments: expected 1 to 2, got 0')
+    self.assertEqual(price('pear'), 2.0)
+
+  def test_pure_functions_can_be_memoized(self) -> None:
+    def discount(value: float) -> float:
+      self.calls.append(1)
+      return value * 0.5
+
+    memoization.configure(memoize_all=True)
+    for pure, expected_calls in ((True, 1), (False, 2)):
+      self.calls.clear()
+      expose(discount, pure=pure)
+      env = Environment()
+      evaluate(Interpreter.parse('let f = def(x) { discount(x) };', env), env)
+      self.assertEqual(self._inspect('f(4) + f(4)', env), '4')
+      self.assertEqual(len(self.calls), expected_calls)
+
+  def test_batch_functions_receive_whole_columns(self) -> None:
+    @expose(batch=True)
+    def risk(scores: List[float], flagged: List[bool]) -> List[float]:
+      self.calls.append(len(scores))
+      return [score * (2 if flag else 1) for score, flag in zip(scores, flagged)]
+
+    @expose(batch=True)
+    def bucket(values: List[int]) -> List[int]:
+      return [value // 10 for value in values]
+
+    expression = compile_expression('if (x > 0) { risk(x, flag) + 1 } else { 0 }')
+    result = expression.evaluate_batch({'x': [1, -1, 3, 4],
+                                        'flag': [True, True, False, True]})
+
+    self.assertTrue(result.vectorized)
+    self.assertEqual([value.inspect() for value in result.objects()
+                      if value is not None], ['3', '0', '4', '9'])
+    self.assertEqual(self.calls, [3])
+    self.assertEqual(self._inspect('risk(2, true)'), '4')
+
+    fallback = compile_expression('bucket(x)').evaluate_batch({'x': [15, 2.5]})
+    self.assertFalse(fallback.vectorized)
+    self.assertEqual(sorted(fallback.errors), [1])
+    self.assertEqual(self._inspect('bucket(15)'), '1')
@@ -0,0 +1,91 @@
+from unittest import TestCase
+from typing import List, cast
+
+from lpp.lexer import Lexer
+from lpp.parser import Parser
+from lpp.ast.infix import Infix
+from lpp.ast.prefix import Prefix
+from lpp.evaluator import evaluate
+from lpp.ast.program import Program
+from lpp.ast.node_base import Expression
+from lpp.object.numbers import Integer
+import lpp.inline_cache as inline_cache
+from lpp.ast.expressions_statement import ExpressionStatement
+from lpp.inline_cache import collect_cache_stats, reset_caches
+
+
+class InlineCacheTest(TestCase):
+
+  def _parse_program(self, source: str) -> Program:
+    parser: Parser = Parser(Lexer(source))
+    program: Program = parser.parse_program()
+    self.assertEqual(len(parser.errors), 0)
+    return program
+
+  def _parse_expression(self, source: str) -> Expression:
+    program = self._parse_program(source)
+    statement = cast(ExpressionStatement, program.statements[0])
+    assert statement.expression is not None
+    return statement.expression
+
+  def test_monomorphic_hits(self) -> None:
+    program = self._parse_program('2 + 3')
+    infix = cast(Infix, cast(ExpressionStatement,
+                             program.statements[0]).expression)
+
+    for _ in range(10):
+      evaluated = evaluate(program)
+      self.assertIsInstance(evaluated, Integer)
+      self.assertEqual(cast(Integer, evaluated).value, 5)
+
+    self.assertEqual(infix.cache.misses, 1)
+    self.assertEqual(infix.cache.hits, 9)
+    self.assertEqual(len(infix.cache.entries), 1)
+    self.assertFalse(infix.cache.megamorphic)
+
+  def test_prefix_cache(self) -> None:
+    program = self._parse_program('-5')
+    prefix = cast(Prefix, cast(ExpressionStatement,
+                               program.statements[0]).expression)
+
+    for _ in range(3):
+      evaluate(program)
+
+    self.assertEqual(prefix.cache.misses, 1)
+    self.assertEqual(prefix.cache.hits, 2)
+
+  def test_polymorphic_and_megamorphic(self) -> None:
+    infix = cast(Infix, self._parse_expression('1 + 1'))
+    operands: List[str] = ['1', '1.5', 'true', '2', '2.5', 'false']
+
+    for left in operands:
+      for right in operands:
+        infix.left = self._parse_expression(left)
+        infix.right = self._parse_expression(right)
+        evaluate(infix)
+
+    self.assertTrue(infix.cache.megamorphic)
+    self.assertEqual(len(infix.cache.entries), inline_cache.POLYMORPHIC_LIMIT)
+
+    infix.left = self._parse_expression('5')
+    infix.right = self._parse_expression('true')
+    evaluated = evaluate(infix)
+    assert evaluated is not None
+    self.assertEqual(evaluated.inspect(),
+                     'Error: Type mismatch: INTEGER + BOOLEAN')
+
+  def test_collect_and_reset_stats(self) -> None:
+    program = self._parse_program('(1 + 2) * -3; 4 < 5;')
+
+    evaluate(program)
+    evaluate(program)
+
+    stats = collect_cache_stats(program)
+    self.assertEqual(stats.nodes, 4)
+    self.assertEqual(stats.misses, 4)
+    self.assertEqual(stats.hits, 4)
+    self.assertEqual(stats.hit_rate, 0.5)
+
+    reset_caches(program)
+    stats = collect_cache_stats(program)
+    self.assertEqual(stats.hits + stats.misses, 0)
@@ -0,0 +1,116 @@
+from unittest import TestCase, skipUnless
+from typing import List, Optional, cast
+from concurrent.futures import ThreadPoolExecutor
+
+import lpp.tiering as tiering
+import lpp.settings as settings
+import lpp.memoization as memoization
+from lpp.limits import Limits
+from lpp.settings import Settings
+from lpp.ast.function import Function
+from lpp.evaluator import set_adaptive
+from lpp.ast.let_statement import LetStatement
+from lpp.object.object_base import Object
+from lpp.object.function import Function as RuntimeFunction
+from lpp.interpreter import Interpreter, ParseError, free_threaded
+
+
+FIB = '''
+    let fib = def(n) {
+      if (n < 2) {
+        return n;
+      }
+      return fib(n - 1) + fib(n - 2);
+    };
+    fib(14) + 0.5 * 2;
+'''
+
+
+class InterpreterTest(TestCase):
+
+  def setUp(self) -> None:
+    self._threshold = settings.defaults.tier_threshold
+    self._background = settings.defaults.tier_in_background
+
+  def tearDown(self) -> None:
+    set_adaptive(False)
+    tiering.configure(calls=self._threshold, in_background=self._background)
+    tiering.wait_for_tier_ups()
+
+  def _inspect(self, value: Optional[Object]) -> Optional[str]:
+    return value.inspect() if value is not None else None
+
+  def _run_concurrently(self, threads: int, tasks: int) -> List[Optional[str]]:
+    program = Interpreter.parse(FIB)
+
+    def task(_: int) -> Optional[str]:
+      return self._inspect(Interpreter().evaluate(program))
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+      return list(executor.map(task, range(tasks)))
+
+  def test_globals_are_isolated(self) -> None:
+    first = Interpreter()
+    second = Interpreter()
+
+    first.run('let a = 5;')
+
+    self.assertEqual(self._inspect(first.run('a * 2')), '10')
+    self.assertEqual(self._inspect(second.run('a')),
+                     'Error: Identifier not found: a')
+    self.assertEqual(first.evaluations, 2)
+
+  def test_settings_are_isolated(self) -> None:
+    program = Interpreter.parse('let square = def(x) { x * x }; square(2) + square(2);')
+    eager = Interpreter(settings=Settings(tier_threshold=1, tier_in_background=False,
+                                          memoize_all=True))
+    small = Interpreter(limits=Limits(max_integer_bits=8))
+    plain = Interpreter()
+    definition = cast(Function, cast(LetStatement, program.statements[0]).value)
+
+    self.assertEqual(self._inspect(plain.evaluate(program)), '8')
+    self.assertIsNone(definition.compiled)
+    self.assertEqual(self._inspect(eager.evaluate(program)), '8')
+    self.assertIsNotNone(definition.compiled)
+
+    self.assertEqual(memoization.stats(cast(RuntimeFunction,
+                                            eager.globals.get('square'))),
+                     memoization.MemoStats(1, 1024, 1, 1, 0))
+    self.assertIsNone(cast(RuntimeFunction, plain.globals.get('square')).memo)
+    self.assertEqual(self._inspect(small.run('2 ^ 10')),
+                     'Error: Integer too large: result exceeds 8 bits')
+    self.assertEqual(self._inspect(plain.run('2 ^ 10')), '1024')
+
+  def test_parse_errors(self) -> None:
+    with self.assertRaises(ParseError) as context:
+      Interpreter().run('let = 5;')
+
+    self.assertGreater(len(context.exception.errors), 0)
+
+  def test_concurrent_evaluation(self) -> None:
+    set_adaptive(True)
+    tiering.configure(calls=20, in_background=True)
+
+    results = self._run_concurrently(threads=8, tasks=32)
+
+    self.assertEqual(results, ['378'] * 32)
+
+  def test_shared_interpreter(self) -> None:
+    interpreter = Interpreter()
+    interpreter.run('let double = def(x) { x * 2 };')
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+      results = list(executor.map(
+          lambda i: self._inspect(interpreter.run(f'double({i})')), range(16)))
+
+    self.assertEqual(results, [str(i * 2) for i in range(16)])
+    self.assertEqual(interpreter.evaluations, 17)
+
+  @skipUnless(free_threaded(), 'requires a free-threaded CPython build')
+  def test_free_threaded_stress(self) -> None:
+    set_adaptive(True)
+    tiering.configure(calls=5, in_background=True)
+
+    results = self._run_concurrently(threads=16, tasks=256)
+
+    self.assertEqual(results, ['378'] * 256)
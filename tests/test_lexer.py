@@ -53,7 +53,7 @@ class LexerTest(TestCase):
     self.assertEquals(tokens, expected_tokens)
 
   def test_delimiters(self) -> None:
-    source = '(){},;'
+    source = '(){}[],;:'
     lexer: Lexer = Lexer(source)
 
     tokens: List[Token] = []
@@ -65,8 +65,11 @@ class LexerTest(TestCase):
         Token(TokenType.RPAREN, ')'),
         Token(TokenType.LBRACE, '{'),
         Token(TokenType.RBRACE, '}'),
+        Token(TokenType.LBRACKET, '['),
+        Token(TokenType.RBRACKET, ']'),
         Token(TokenType.COMMA, ','),
         Token(TokenType.SEMICOLON, ';'),
+        Token(TokenType.COLON, ':'),
     ]
 
     self.assertEquals(tokens, expected_tokens)
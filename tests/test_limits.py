@@ -0,0 +1,134 @@
+from threading import Thread
+from unittest import TestCase
+from typing import List, Optional, cast
+
+from lpp.limits import Limits
+from lpp.interpreter import Interpreter
+from lpp.object.numbers import Integer
+from lpp.object.error import Error, ErrorKind
+from lpp.object.object_base import Object
+
+
+COUNT = '''
+    let count = def(n) {
+      if (n == 0) {
+        0
+      } else {
+        1 + count(n - 1)
+      }
+    };
+    count({n});
+'''
+
+
+class LimitsTest(TestCase):
+
+  def _error(self, value: Optional[Object], kind: ErrorKind) -> Error:
+    self.assertIsInstance(value, Error)
+    error = cast(Error, value)
+    self.assertEqual(error.kind, kind)
+    return error
+
+  def test_step_limit(self) -> None:
+    interpreter = Interpreter(limits=Limits(max_steps=5))
+
+    error = self._error(interpreter.run('1 + 2 + 3'), ErrorKind.STEP_LIMIT)
+
+    self.assertEqual(error.message, 'Step limit exceeded: 5 steps')
+    self.assertEqual(interpreter.budget.steps, 5)
+
+    evaluated = interpreter.run('1 + 2')
+    self.assertEqual(cast(Integer, evaluated).value, 3)
+    self.assertEqual(interpreter.budget.steps, 5)
+
+  def test_timeout(self) -> None:
+    interpreter = Interpreter(limits=Limits(max_steps=None, timeout=0.01))
+
+    self._error(interpreter.run('''
+        let fib = def(n) {
+          if (n < 2) {
+            return n;
+          }
+          return fib(n - 1) + fib(n - 2);
+        };
+        fib(40);
+    '''), ErrorKind.TIMEOUT)
+
+  def test_call_depth(self) -> None:
+    interpreter = Interpreter(limits=Limits(max_call_depth=20))
+
+    self.assertEqual(cast(Integer, interpreter.run(COUNT.replace('{n}', '19'))).value,
+                     19)
+    error = self._error(interpreter.run(COUNT.replace('{n}', '30')),
+                        ErrorKind.CALL_DEPTH)
+    self.assertEqual(error.message, 'Call depth exceeded: 20 calls')
+
+  def test_default_call_depth_is_reachable(self) -> None:
+    depth = cast(int, Limits().max_call_depth)
+    results: List[Optional[Object]] = []
+
+    def run() -> None:
+      interpreter = Interpreter()
+      results.append(interpreter.run(COUNT.replace('{n}', str(depth - 1))))
+      results.append(interpreter.run(COUNT.replace('{n}', str(depth))))
+
+    run()
+    thread = Thread(target=run)
+    thread.start()
+    thread.join()
+
+    for index in (0, 2):
+      self.assertEqual(cast(Integer, results[index]).value, depth - 1)
+      error = self._error(results[index + 1], ErrorKind.CALL_DEPTH)
+      self.assertEqual(error.message, f'Call depth exceeded: {depth} calls')
+
+  def test_host_recursion_is_reported(self) -> None:
+    interpreter = Interpreter(limits=Limits(max_call_depth=None))
+
+    self._error(interpreter.run(COUNT.replace('{n}', '100000')),
+                ErrorKind.CALL_DEPTH)
+    self._error(interpreter.run(' + '.join(['1'] * 20000)), ErrorKind.CALL_DEPTH)
+
+  def test_integer_size(self) -> None:
+    interpreter = Interpreter(limits=Limits(max_integer_bits=64))
+    tests = [
+        ('2 ^ 63', 2 ** 63),
+        ('3 ^ 40', 3 ** 40),
+        ('4294967296 * 2147483648', 2 ** 63),
+    ]
+
+    for source, expected in tests:
+      evaluated = interpreter.run(source)
+      self.assertEqual(cast(Integer, evaluated).value, expected)
+
+    for source in ('2 ^ 65', '4294967296 * 4294967296 * 4294967296',
+                   'let sq = def(x) { x * x }; sq(sq(sq(sq(sq(sq(sq(3)))))))'):
+      self._error(interpreter.run(source), ErrorKind.INTEGER_SIZE)
+
+    self.assertEqual(cast(Integer, Interpreter().run('2 ^ 65')).value, 2 ** 65)
+
+  def test_length(self) -> None:
+    interpreter = Interpreter(limits=Limits(max_length=1000))
+    double = '''
+        let double = def(s, n) {
+          if (n == 0) { len(s) } else { double(s + s, n - 1) }
+        };
+        double('ab', {n});
+    '''
+
+    self.assertEqual(cast(Integer, interpreter.run(double.replace('{n}', '8'))).value,
+                     512)
+    for source in (double.replace('{n}', '9'), 'zeros(1001)', 'ones(5000)',
+                   'arange(0, 2002, 2) + 1', 'linspace(0, 1, 1001)'):
+      error = self._error(interpreter.run(source), ErrorKind.LENGTH)
+      self.assertIn('exceeds 1000', error.message)
+
+    self._error(Interpreter().run('zeros(10000000000)'), ErrorKind.LENGTH)
+
+  def test_no_limits(self) -> None:
+    interpreter = Interpreter(limits=None)
+
+    evaluated = interpreter.run(COUNT.replace('{n}', '30'))
+
+    self.assertIsNone(interpreter.budget)
+    self.assertEqual(cast(Integer, evaluated).value, 30)
@@ -0,0 +1,92 @@
+from unittest import TestCase
+from typing import List, Optional, Tuple, cast
+
+import lpp.tiering as tiering
+import lpp.settings as settings
+from lpp.limits import Limits
+from lpp.evaluator import evaluate
+from lpp.interpreter import Interpreter
+from lpp.object.error import ErrorKind
+from lpp.object.object_base import Object
+from lpp.ast.for_statement import ForStatement
+from lpp.ast.while_statement import WhileStatement
+from lpp.stack_evaluator import evaluate_iterative
+
+
+class LoopsTest(TestCase):
+
+  def setUp(self) -> None:
+    self._threshold = settings.defaults.tier_threshold
+
+  def tearDown(self) -> None:
+    tiering.configure(calls=self._threshold)
+
+  def _inspect(self, value: Optional[Object]) -> Optional[str]:
+    return value.inspect() if value is not None else None
+
+  def _check(self, tests: List[Tuple[str, Optional[str]]]) -> None:
+    for source, expected in tests:
+      self.assertEqual(self._inspect(evaluate(Interpreter.parse(source))),
+                       expected, source)
+      self.assertEqual(self._inspect(evaluate_iterative(Interpreter.parse(source))),
+                       expected, source)
+
+  def test_loops(self) -> None:
+    self._check([
+        ('let i = 0; while (i < 200) { i++; }; i', '200'),
+        ('let t = 0; for (i in range(100)) { let t = t + i; }; t', '4950'),
+        ('let t = 0; for (i in range(10, 0, -3)) { let t = t * 100 + i; }; t', '10070401'),
+        ('let t = 0; for (x in [1.5, 2]) { let t = t + x; }; t', '3.5'),
+        ("let s = ''; for (c in 'hola') { let s = c + s; }; s", 'aloh'),
+        ("let t = 0; for (k in {1: 'a', 2: 'b'}) { let t = t + k; }; t", '3'),
+        ('let i = 5; i--; i--; i', '3'),
+        ('let x = 1.5; x++; x', '2.5'),
+        ('range(1, 10, 2)', 'range(1, 10, 2)'),
+        ('len(range(0, 10, 3))', '4'),
+        ('while (false) { 1 }', None),
+    ])
+
+  def test_return_and_errors_leave_the_loop(self) -> None:
+    self._check([
+        ('''
+          let find = def(items, target) {
+            let i = 0;
+            for (item in items) {
+              if (item == target) { return i; }
+              i++;
+            };
+            -1
+          };
+          find([4, 5, 6], 6) + find([4], 7)
+        ''', '1'),
+        ('let i = 0; while (true) { i++; if (i == 3) { return i * 10; } }', '30'),
+        ('for (i in range(5)) { i + true }', 'Error: Type mismatch: INTEGER + BOOLEAN'),
+        ('for (x in 5) { x }', 'Error: Cannot iterate over INTEGER'),
+        ('let b = true; b++', 'Error: Unknown operator: BOOLEAN++'),
+        ('missing--', 'Error: Identifier not found: missing'),
+        ('range(1, 2, 0)', 'Error: Invalid argument to range: step must not be zero'),
+    ])
+
+  def test_hot_loops_are_compiled(self) -> None:
+    tiering.configure(calls=5)
+    program = Interpreter.parse('''
+        let total = 0;
+        let i = 0;
+        while (i < 50) { let total = total + i; i++; };
+        for (j in range(50)) { let total = total + j; };
+        total
+    ''')
+
+    self.assertEqual(self._inspect(evaluate(program)), '2450')
+    self.assertIsNotNone(cast(WhileStatement, program.statements[2]).compiled)
+    self.assertIsNotNone(cast(ForStatement, program.statements[3]).compiled)
+
+  def test_loops_respect_limits(self) -> None:
+    tiering.configure(calls=5)
+    interpreter = Interpreter(limits=Limits(max_steps=1000))
+    value = interpreter.run('while (true) { }')
+    self.assertEqual(getattr(value, 'kind', None), ErrorKind.STEP_LIMIT)
+
+    interpreter = Interpreter(limits=Limits(max_steps=None, timeout=0.01))
+    value = interpreter.run('let i = 0; while (true) { i++; }')
+    self.assertEqual(getattr(value, 'kind', None), ErrorKind.TIMEOUT)
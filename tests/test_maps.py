@@ -0,0 +1,77 @@
+import pickle
+from unittest import TestCase
+from typing import List, Optional, Tuple, cast
+
+from lpp.evaluator import evaluate
+from lpp.object.map import Map
+from lpp.interpreter import Interpreter
+from lpp.object.object_base import Object
+from lpp.stack_evaluator import evaluate_iterative
+
+import lpp.object.bool as object_bool
+import lpp.object.string as object_string
+import lpp.object.numbers as object_numbers
+
+
+class MapsTest(TestCase):
+
+  def _evaluate(self, source: str) -> Optional[Object]:
+    return evaluate(Interpreter.parse(source))
+
+  def _check(self, tests: List[Tuple[str, str]]) -> None:
+    for source, expected in tests:
+      evaluated = self._evaluate(source)
+      assert evaluated is not None
+      self.assertEqual(evaluated.inspect(), expected, source)
+
+  def test_literals(self) -> None:
+    self._check([
+        ("{1: 'one', 'two': 2, true: 3}", '{1: one, two: 2, true: 3}'),
+        ('{}', '{}'),
+        ("{'a' + 'b': 1 + 1}", '{ab: 2}'),
+        ('{1: 1, 1.0: 2}', '{1: 2}'),
+        ('{[1]: 2}', 'Error: Unusable as map key: ARRAY'),
+        ('{1: x}', 'Error: Identifier not found: x'),
+    ])
+    self.assertIsInstance(self._evaluate('{}'), Map)
+
+  def test_keys_follow_lpp_equality(self) -> None:
+    self._check([
+        ("get({1: 'a'}, 1.0)", 'a'),
+        ("get({2.5: 'a'}, 5 / 2)", 'a'),
+        ("get({'ab': 1}, 'a' + 'b')", '1'),
+        ("contains({1: 'a'}, true)", 'false'),
+        ("contains({true: 'a'}, 1)", 'false'),
+        ("get({true: 'a', false: 'b'}, 1 > 2)", 'b'),
+    ])
+    self.assertEqual(object_numbers.Integer(1), object_numbers.Float(1.0))
+    self.assertNotEqual(object_numbers.Integer(1), object_bool.TRUE)
+    self.assertEqual(hash(object_numbers.Integer(3)), hash(object_numbers.Float(3.0)))
+
+    rope = object_string.concat(object_string.String('a'), object_string.String('b'))
+    self.assertEqual(rope, object_string.intern('ab'))
+    self.assertEqual(hash(rope), hash(object_string.intern('ab')))
+
+  def test_builtins(self) -> None:
+    self._check([
+        ('let m = {}; set(m, 1, 2); set(m, 1, 3); m', '{1: 3}'),
+        ('let m = {}; set(set(m, 1, 2), 2, 4); get(m, 2)', '4'),
+        ('get({}, 1, 42)', '42'),
+        ("let m = {'a': 1}; contains(m, 'a') and not contains(m, 'b')", 'true'),
+        ('get(1, 2)', 'Error: Argument to get must be MAP, got INTEGER'),
+        ('set({}, [1], 2)', 'Error: Unusable as map key: ARRAY'),
+        ('get({})', 'Error: Wrong number of arguments: expected 2 to 3, got 1'),
+        ('contains({}, 1, 2)', 'Error: Wrong number of arguments: expected 2, got 3'),
+    ])
+
+  def test_stack_evaluator_and_pickling(self) -> None:
+    for source in ["{1: 'a', 'b': 2 + 1}", '{1: x}', '{1: {2: 3}}', '{[1]: 1}']:
+      expected = self._evaluate(source)
+      evaluated = evaluate_iterative(Interpreter.parse(source))
+      assert expected is not None and evaluated is not None
+      self.assertEqual(evaluated.inspect(), expected.inspect())
+
+    mapping = cast(Map, self._evaluate("{1: 'a', 'b' + 'c': true}"))
+    restored = pickle.loads(pickle.dumps(mapping))
+    self.assertEqual(restored.inspect(), mapping.inspect())
+    self.assertIs(restored.pairs[object_string.String('bc')], object_bool.TRUE)
@@ -0,0 +1,176 @@
+from unittest import TestCase
+from typing import cast
+
+import lpp.memoization as memoization
+from lpp.lexer import Lexer
+from lpp.parser import Parser
+from lpp.ast.walk import walk
+from lpp.ast.program import Program
+from lpp.evaluator import evaluate
+from lpp.interpreter import Interpreter
+from lpp.stack_evaluator import evaluate_iterative
+from lpp.purity import analyze_purity
+from lpp.object.numbers import Integer
+from lpp.object.environment import Environment
+from lpp.object.function import Function
+import lpp.ast.function as ast_function
+
+
+FIB = '''
+    let fib = def(n) {
+      {pragma}
+      if (n < 2) {
+        return n;
+      }
+      return fib(n - 1) + fib(n - 2);
+    };
+'''
+
+
+class MemoizationTest(TestCase):
+
+  def tearDown(self) -> None:
+    memoization.configure(memoize_all=False, size=1024)
+
+  def _parse_program(self, source: str) -> Program:
+    parser: Parser = Parser(Lexer(source))
+    program: Program = parser.parse_program()
+    self.assertEqual(len(parser.errors), 0)
+    return program
+
+  def _define(self, source: str, env: Environment) -> None:
+    self.assertIsNone(evaluate(self._parse_program(source), env))
+
+  def _run(self, source: str, env: Environment) -> Integer:
+    evaluated = evaluate(self._parse_program(source), env)
+    self.assertIsInstance(evaluated, Integer)
+    return cast(Integer, evaluated)
+
+  def _definition(self, source: str) -> ast_function.Function:
+    program = self._parse_program(source)
+    return next(cast(ast_function.Function, node) for node in walk(program)
+                if isinstance(node, ast_function.Function))
+
+  def test_purity_analysis(self) -> None:
+    tests = [
+        ("def(n) { n * 2 }", True, set()),
+        ("def(n) { let m = n + 1; m }", True, set()),
+        ("def(n) { fib(n - 1) }", True, {'fib'}),
+        ("def(n) { n + limit }", False, set()),
+        ("def(n) { def(m) { n + m } }", True, set()),
+        ("def(n) { def(m) { n + other } }", False, set()),
+    ]
+
+    for source, expected_pure, expected_callees in tests:
+      purity = analyze_purity(self._definition(source))
+      self.assertEqual(purity.pure, expected_pure, source)
+      self.assertEqual(set(purity.callees), expected_callees, source)
+      self.assertFalse(purity.pragma)
+
+    self.assertTrue(analyze_purity(self._definition("def(n) { 'memo'; n }")).pragma)
+
+  def test_memo_pragma(self) -> None:
+    env = Environment()
+    self._define(FIB.replace('{pragma}', "'memo';"), env)
+
+    self.assertEqual(self._run('fib(60);', env).value, 1548008755920)
+
+    stats = memoization.stats(cast(Function, env.get('fib')))
+    assert stats is not None
+    self.assertEqual(stats.size, 61)
+    self.assertEqual(stats.misses, 61)
+    self.assertEqual(stats.evictions, 0)
+
+  def test_disabled_without_pragma(self) -> None:
+    env = Environment()
+    self._define(FIB.replace('{pragma}', ''), env)
+
+    self.assertEqual(self._run('fib(10);', env).value, 55)
+    self.assertIsNone(memoization.stats(cast(Function, env.get('fib'))))
+
+  def test_global_enable_and_eviction(self) -> None:
+    memoization.configure(memoize_all=True, size=8)
+    env = Environment()
+    self._define(FIB.replace('{pragma}', ''), env)
+
+    self.assertEqual(self._run('fib(30);', env).value, 832040)
+
+    stats = memoization.stats(cast(Function, env.get('fib')))
+    assert stats is not None
+    self.assertEqual(stats.size, 8)
+    self.assertEqual(stats.max_size, 8)
+    self.assertGreater(stats.evictions, 0)
+
+  def test_impure_functions_are_not_memoized(self) -> None:
+    memoization.configure(memoize_all=True)
+    env = Environment()
+    self._run('let offset = 1; let f = def(n) { n + offset }; f(1);', env)
+    self._define('let offset = 10;', env)
+
+    self.assertEqual(self._run('f(1);', env).value, 11)
+    self.assertIsNone(memoization.stats(cast(Function, env.get('f'))))
+
+  def test_impure_builtins_are_not_memoized(self) -> None:
+    memoization.configure(memoize_all=True)
+    env = Environment()
+    self._run('let m = {1: 1}; let f = def(n) { get(m, n) }; f(1);', env)
+    self._run('set(m, 1, 2); 0;', env)
+
+    self.assertEqual(self._run('f(1);', env).value, 2)
+    self.assertIsNone(memoization.stats(cast(Function, env.get('f'))))
+
+  def test_mutable_results_are_not_shared(self) -> None:
+    env = Environment()
+    self._run("let mk = def(x) { 'memo'; {x: 0} }; let a = mk(1); set(a, 1, 99); 0;", env)
+    self._run("let wrap = def(x) { 'memo'; let m = {x: 0}; def() { m } }; "
+              "set(wrap(1)(), 1, 99); 0;", env)
+
+    self.assertEqual(self._run('get(mk(1), 1);', env).value, 0)
+    self.assertEqual(self._run('get(wrap(1)(), 1);', env).value, 0)
+    self.assertEqual(self._run("let sq = def(x) { 'memo'; x * x }; sq(3) + sq(3);", env).value, 18)
+
+    stats = memoization.stats(cast(Function, env.get('mk')))
+    assert stats is not None
+    self.assertEqual((stats.size, stats.hits), (0, 0))
+    stats = memoization.stats(cast(Function, env.get('sq')))
+    assert stats is not None
+    self.assertEqual((stats.size, stats.hits), (1, 1))
+
+  def test_rebinding_a_callee_invalidates_results(self) -> None:
+    source = '''
+        let g = def(x) { x };
+        let f = def(n) { {pragma} g(n) };
+        let a = f(1);
+        let g = def(x) { x * 100 };
+        let b = f(1);
+        let len = def(x) { 7 };
+        let h = def(n) { {pragma} len(n) };
+        let c = h('ab');
+        [a, b, c]
+    '''
+    for pragma, memoize_all in [("'memo';", False), ('', True)]:
+      memoization.configure(memoize_all=memoize_all)
+      program = source.replace('{pragma}', pragma)
+      for evaluator in (evaluate, evaluate_iterative):
+        evaluated = evaluator(self._parse_program(program), Environment())
+        assert evaluated is not None
+        self.assertEqual(evaluated.inspect(), '[1, 100, 7]', (pragma, evaluator))
+
+      interpreter = Interpreter()
+      interpreter.run('let g = def(x) { x }; let k = def(n) { ' + pragma + ' g(n) * 2 };')
+      self.assertEqual(cast(Integer, interpreter.run('k(2)')).value, 4)
+      interpreter.run('let g = def(x) { x + 1 };')
+      self.assertEqual(cast(Integer, interpreter.run('k(2)')).value, 6)
+
+  def test_keys_distinguish_types(self) -> None:
+    env = Environment()
+    self._run("let f = def(n) { 'memo'; n * 2 }; f(2);", env)
+
+    evaluated = evaluate(self._parse_program('f(2.5);'), env)
+    assert evaluated is not None
+    self.assertEqual(evaluated.inspect(), '5')
+    self.assertEqual(self._run('f(2);', env).value, 4)
+
+    stats = memoization.stats(cast(Function, env.get('f')))
+    assert stats is not None
+    self.assertEqual((stats.hits, stats.misses), (1, 2))
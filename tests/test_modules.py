@@ -0,0 +1,163 @@
+import os
+from unittest import TestCase, mock
+from tempfile import TemporaryDirectory
+from typing import Any, Optional, Tuple, cast
+
+import lpp.modules as modules
+from lpp.ast.call import Call
+from lpp.evaluator import evaluate
+from lpp.interpreter import Interpreter
+from lpp.object.environment import Environment
+from lpp.object.object_base import Object
+from lpp.stack_evaluator import evaluate_iterative
+from lpp.ast.expressions_statement import ExpressionStatement
+
+
+RULES = '''
+    let threshold = 10;
+    let max = def(a, b) { if (a > b) { a - 1 } else { b - 1 } };
+    let above = def(x) { x > threshold };
+'''
+
+
+class ModulesTest(TestCase):
+
+  def setUp(self) -> None:
+    self._directory = TemporaryDirectory()
+    self.path = self._directory.name
+    self._write('rules', RULES)
+    self._key = mock.patch.dict(os.environ, {
+        modules.CACHE_KEY_VARIABLE: os.path.join(self.path, 'keys', 'cache.key')})
+    self._key.start()
+    modules.clear_program_cache()
+
+  def tearDown(self) -> None:
+    modules.clear_program_cache()
+    self._key.stop()
+    self._directory.cleanup()
+
+  def _write(self, name: str, source: str) -> None:
+    with open(os.path.join(self.path, name + modules.SOURCE_SUFFIX), 'w') as module:
+      module.write(source)
+
+  def _run(self, interpreter: Interpreter, source: str) -> Optional[str]:
+    result: Optional[Object] = interpreter.run(source)
+    return result.inspect() if result is not None else None
+
+  def test_import_binds_module_names(self) -> None:
+    interpreter = Interpreter(search_path=[self.path])
+
+    self.assertEqual(self._run(interpreter, "import rules; above(threshold + 1)"), 'true')
+    self.assertEqual(self._run(interpreter, "import 'rules'; max(1, 5)"), '4')
+    self.assertEqual(self._run(interpreter, 'import missing;'),
+                     'Error: Module not found: missing')
+    self.assertEqual(interpreter.modules.evaluations, 1)
+
+    program = Interpreter.parse('import rules; max(1, 2)', interpreter.globals)
+    call = cast(Call, cast(ExpressionStatement, program.statements[1]).expression)
+    self.assertIsNone(call.builtin)
+
+    self.assertEqual(Interpreter(search_path=[self.path]).modules.evaluations, 0)
+    self.assertEqual(evaluate_iterative(
+        Interpreter.parse('import rules; threshold'),
+        Interpreter(search_path=[self.path]).globals).inspect(), '10')
+
+  def test_nested_and_circular_imports(self) -> None:
+    self._write('scoring', 'import rules; let score = def(x) { x * threshold };')
+    self._write('loop_a', 'import loop_b; let a = 1;')
+    self._write('loop_b', 'import loop_a; let b = 2;')
+    interpreter = Interpreter(search_path=[self.path])
+
+    self.assertEqual(self._run(interpreter, 'import scoring; score(2) + threshold'), '30')
+    self.assertEqual(self._run(interpreter, 'import loop_a; a'),
+                     'Error: Circular import: loop_a')
+
+  def test_parsed_modules_are_cached_on_disk(self) -> None:
+    first = Interpreter(search_path=[self.path])
+    self.assertEqual(self._run(first, 'import rules; threshold'), '10')
+    self.assertEqual(first.modules.parses, 1)
+    cache = modules.cache_path(os.path.join(self.path, 'rules.lpp'))
+    self.assertTrue(os.path.exists(cache))
+
+    modules.clear_program_cache()
+    second = Interpreter(search_path=[self.path])
+    self.assertEqual(self._run(second, 'import rules; threshold'), '10')
+    self.assertEqual((second.modules.parses, second.modules.cache_hits), (0, 1))
+
+    modules.clear_program_cache()
+    self._write('rules', RULES.replace('10', '20') + ' ')
+    third = Interpreter(search_path=[self.path])
+    self.assertEqual(self._run(third, 'import rules; threshold'), '20')
+    self.assertEqual((third.modules.parses, third.modules.cache_hits), (1, 0))
+
+  def test_unsigned_caches_are_not_loaded(self) -> None:
+    import pickle
+
+    marker = os.path.join(self.path, 'loaded')
+    cache = modules.cache_path(os.path.join(self.path, 'rules.lpp'))
+    os.makedirs(os.path.dirname(cache))
+    with open(cache, 'wb') as forged:
+      forged.write(pickle.dumps(_Payload(marker)))
+
+    interpreter = Interpreter(search_path=[self.path])
+    self.assertEqual(self._run(interpreter, 'import rules; threshold'), '10')
+    self.assertFalse(os.path.exists(marker))
+    self.assertEqual((interpreter.modules.parses, interpreter.modules.cache_hits), (1, 0))
+
+    with open(os.environ[modules.CACHE_KEY_VARIABLE], 'rb') as key_file:
+      self.assertEqual(len(key_file.read()), 32)
+    if os.name == 'posix':
+      mode = os.stat(os.environ[modules.CACHE_KEY_VARIABLE]).st_mode
+      self.assertEqual(mode & 0o077, 0)
+
+  def test_bare_environments_get_their_own_loader(self) -> None:
+    self._write('counter', "let created = len('x');")
+    first, second = Environment(), Environment()
+    program = Interpreter.parse('import counter; created')
+    with mock.patch.object(modules, 'default_search_path', return_value=[self.path]):
+      self.assertEqual(evaluate(program, first).inspect(), '1')
+      self.assertEqual(evaluate(program, Environment(first)).inspect(), '1')
+      self.assertEqual(evaluate(program, second).inspect(), '1')
+
+    assert first.modules is not None and second.modules is not None
+    self.assertIsNot(first.modules, second.modules)
+    self.assertEqual(first.modules.evaluations, 1)
+    self.assertEqual(second.modules.evaluations, 1)
+
+  def test_module_names_stay_inside_the_search_path(self) -> None:
+    inner = os.path.join(self.path, 'inner')
+    os.mkdir(inner)
+    interpreter = Interpreter(search_path=[inner])
+
+    for name in ('../rules', 'nested/../../rules', os.path.join(self.path, 'rules')):
+      self.assertIsNone(interpreter.modules.find(name))
+      self.assertEqual(self._run(interpreter, f"import '{name}';"),
+                       f'Error: Invalid module name: {name}')
+    self.assertEqual(interpreter.modules.evaluations, 0)
+
+  def test_loaders_resolve_their_own_copy_of_a_module(self) -> None:
+    shadowing = os.path.join(self.path, 'shadowing')
+    os.mkdir(shadowing)
+    with open(os.path.join(shadowing, 'helper' + modules.SOURCE_SUFFIX), 'w') as module:
+      module.write('let len = def(x) { 42 };')
+    self._write('helper', 'let unused = 0;')
+    self._write('main', "import helper; let size = len('abc');")
+
+    plain = Interpreter(search_path=[self.path])
+    shadowed = Interpreter(search_path=[shadowing, self.path])
+    self.assertEqual(self._run(plain, 'import main; size'), '3')
+    self.assertEqual(self._run(shadowed, 'import main; size'), '42')
+    self.assertEqual(plain.modules.parses, 2)
+    self.assertEqual(shadowed.modules.parses, 1)
+    self.assertIsNot(plain.modules.program('main'), shadowed.modules.program('main'))
+    self.assertIs(plain.modules.program('main'), plain.modules.program('main'))
+
+
+
+class _Payload:
+
+  def __init__(self, marker: str) -> None:
+    self.marker = marker
+
+  def __reduce__(self) -> Tuple[Any, Tuple[str]]:
+    return open, (self.marker, 'w')
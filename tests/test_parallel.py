@@ -0,0 +1,95 @@
+import pickle
+from unittest import TestCase
+from typing import Optional
+
+from lpp.evaluator import FALSE, NULL, TRUE, evaluate
+from lpp.interpreter import Interpreter
+from lpp.object.object_base import Object
+from lpp.parallel import analyze_statement, build_graph, evaluate_parallel
+
+
+FIB = '''
+    let fib = def(n) {
+      if (n < 2) {
+        return n;
+      }
+      return fib(n - 1) + fib(n - 2);
+    };
+'''
+
+
+class ParallelTest(TestCase):
+
+  def _inspect(self, value: Optional[Object]) -> Optional[str]:
+    return value.inspect() if value is not None else None
+
+  def test_statement_effects(self) -> None:
+    program = Interpreter.parse('''
+        let a = b + c;
+        let f = def(x) { x + g(y) };
+        if (a) { let z = 1; }
+    ''')
+
+    effects = [analyze_statement(statement) for statement in program.statements]
+
+    self.assertEqual(effects[0].reads, {'b', 'c'})
+    self.assertEqual(effects[0].writes, {'a'})
+    self.assertEqual(effects[1].reads, set())
+    self.assertEqual(effects[1].deferred, {'g', 'y'})
+    self.assertEqual(effects[1].writes, {'f'})
+    self.assertEqual(effects[2].reads, {'a'})
+    self.assertEqual(effects[2].writes, {'z'})
+
+  def test_dependency_graph(self) -> None:
+    program = Interpreter.parse(FIB + '''
+        let a = fib(10);
+        let b = fib(11);
+        let c = a + b;
+        let a = 1;
+        a + c;
+    ''')
+
+    graph = build_graph(program)
+
+    self.assertEqual(graph.dependencies, [
+        frozenset(), {0}, {0}, {0, 1, 2}, frozenset(), {0, 3, 4},
+    ])
+    self.assertEqual(graph.critical_path, 4)
+    self.assertEqual(graph.max_width, 2)
+
+  def test_matches_sequential_evaluation(self) -> None:
+    tests = [
+        FIB + 'let a = fib(12); let b = fib(13); let c = fib(14); a + b + c',
+        'let a = 1; let a = a + 1; let b = a * 10; b',
+        'let f = def() { g() }; let g = def() { 7 }; f()',
+        'let f = def() { g() }; f(); let g = def() { 7 };',
+        'let a = 1; let b = 1 + true; let c = a; c',
+        'let a = 1; return a + 1; let b = 3; b',
+        'let make = def(x) { def(y) { x + y } }; let add = make(2); add(5)',
+        'if (true) { let z = 4; } z * 2',
+        'let t = 1 < 2; not t',
+        'let m = {1: 2}; let a = get(m, 1); set(m, 1, 5); get(m, 1.0) + a',
+    ]
+
+    for source in tests:
+      expected = evaluate(Interpreter.parse(source))
+      result = evaluate_parallel(source, jobs=2)
+      self.assertEqual(self._inspect(result.value), self._inspect(expected),
+                       source)
+
+  def test_report(self) -> None:
+    result = evaluate_parallel(
+        FIB + 'let a = fib(15); let b = fib(15); let c = fib(15); 1 + true; a',
+        jobs=2)
+
+    self.assertEqual(self._inspect(result.value),
+                     'Error: Type mismatch: INTEGER + BOOLEAN')
+    self.assertEqual(result.report.statements, 6)
+    self.assertEqual(result.report.critical_path, 3)
+    self.assertEqual(result.report.max_width, 3)
+    self.assertLessEqual(result.report.executed, 5)
+    self.assertGreater(result.report.busy_seconds, 0)
+
+  def test_singletons_survive_pickling(self) -> None:
+    for singleton in (TRUE, FALSE, NULL):
+      self.assertIs(pickle.loads(pickle.dumps(singleton)), singleton)
@@ -8,13 +8,20 @@ from lpp.ast.block import Block
 from lpp.ast.infix import Infix
 from lpp.ast.bool import Boolean
 from lpp.ast.prefix import Prefix
+from lpp.ast.logical import Logical
+from lpp.ast.map import MapLiteral
+from lpp.ast.array import ArrayLiteral
 from lpp.ast.program import Program
+from lpp.ast.string import StringLiteral
 from lpp.ast.if_expression import If
 from lpp.ast.function import Function
 from lpp.ast.node_base import Expression
 from lpp.ast.number import Float, Integer
 from lpp.ast.indentifier import Identifier
 from lpp.ast.let_statement import LetStatement
+from lpp.ast.for_statement import ForStatement
+from lpp.ast.import_statement import ImportStatement
+from lpp.ast.while_statement import WhileStatement
 from lpp.ast.return_statement import ReturnStatement
 from lpp.ast.expressions_statement import ExpressionStatement
 
@@ -224,6 +231,90 @@ class ParserTest(TestCase):
     assert expression_statement.expression is not None
     self._test_literal_expression(expression_statement.expression, 4.3)
 
+  def test_string_literal_expression(self) -> None:
+    source: str = "'hola mundo';"
+    lexer: Lexer = Lexer(source)
+    parser: Parser = Parser(lexer)
+
+    program: Program = parser.parse_program()
+
+    self._test_program_statement(parser, program)
+
+    string = cast(StringLiteral, cast(ExpressionStatement,
+                                      program.statements[0]).expression)
+    self.assertIsInstance(string, StringLiteral)
+    self.assertEqual(string.value, 'hola mundo')
+    self.assertEqual(str(string), "'hola mundo'")
+
+  def test_array_literal_expression(self) -> None:
+    source: str = '[1, 2 * 3, x]; [];'
+    lexer: Lexer = Lexer(source)
+    parser: Parser = Parser(lexer)
+
+    program: Program = parser.parse_program()
+
+    self._test_program_statement(parser, program, expect_statement_count=2)
+
+    array = cast(ArrayLiteral, cast(ExpressionStatement,
+                                    program.statements[0]).expression)
+    self.assertIsInstance(array, ArrayLiteral)
+    self.assertEqual(len(array.elements), 3)
+    self.assertEqual(str(array), '[1, (2 * 3), x]')
+
+    empty = cast(ArrayLiteral, cast(ExpressionStatement,
+                                    program.statements[1]).expression)
+    self.assertEqual(empty.elements, [])
+
+  def test_map_literal_expression(self) -> None:
+    source: str = "{'one': 1, 2: 1 + 1, true: x}; {};"
+    lexer: Lexer = Lexer(source)
+    parser: Parser = Parser(lexer)
+
+    program: Program = parser.parse_program()
+
+    self._test_program_statement(parser, program, expect_statement_count=2)
+
+    map_literal = cast(MapLiteral, cast(ExpressionStatement,
+                                        program.statements[0]).expression)
+    self.assertIsInstance(map_literal, MapLiteral)
+    self.assertEqual(len(map_literal.keys), 3)
+    self.assertEqual(str(map_literal), "{'one': 1, 2: (1 + 1), true: x}")
+
+    empty = cast(MapLiteral, cast(ExpressionStatement,
+                                  program.statements[1]).expression)
+    self.assertEqual(empty.keys, [])
+
+  def test_loop_statements(self) -> None:
+    source: str = 'while (i < 10) { i++; }; for (x in range(3)) { total--; }'
+    lexer: Lexer = Lexer(source)
+    parser: Parser = Parser(lexer)
+
+    program: Program = parser.parse_program()
+
+    self.assertEqual(parser.errors, [])
+    self.assertEqual(len(program.statements), 2)
+
+    while_statement = cast(WhileStatement, program.statements[0])
+    self.assertIsInstance(while_statement, WhileStatement)
+    self.assertEqual(str(while_statement), 'while (i < 10) {i++;}')
+
+    for_statement = cast(ForStatement, program.statements[1])
+    self.assertIsInstance(for_statement, ForStatement)
+    self.assertEqual(str(for_statement), 'for (x in range(3)) {total--;}')
+
+  def test_import_statement(self) -> None:
+    source: str = "import rules; import 'shared/limits'"
+    lexer: Lexer = Lexer(source)
+    parser: Parser = Parser(lexer)
+
+    program: Program = parser.parse_program()
+
+    self.assertEqual(parser.errors, [])
+    self.assertEqual([cast(ImportStatement, statement).module
+                      for statement in program.statements],
+                     ['rules', 'shared/limits'])
+    self.assertEqual(str(program.statements[0]), "import 'rules';")
+
   def test_prefix_expression(self) -> None:
     source: str = 'not 5; -15; not true;'
     lexer: Lexer = Lexer(source)
@@ -288,6 +379,23 @@ class ParserTest(TestCase):
           expected_right
       )
 
+  def test_logical_expression(self) -> None:
+    source: str = 'a and b or c;'
+    lexer: Lexer = Lexer(source)
+    parser: Parser = Parser(lexer)
+
+    program: Program = parser.parse_program()
+
+    self._test_program_statement(parser, program)
+
+    logical = cast(Logical, cast(ExpressionStatement,
+                                 program.statements[0]).expression)
+    self.assertIsInstance(logical, Logical)
+    self.assertEqual(logical.operator, 'or')
+    self._test_infix_expression(logical.left, 'a', 'and', 'b')
+    self.assertIsInstance(logical.left, Logical)
+    self._test_identifier(logical.right, 'c')
+
   def test_boolean_expression(self) -> None:
     source: str = 'true; false;'
     lexer: Lexer = Lexer(source)
@@ -0,0 +1,38 @@
+from unittest import TestCase
+
+from lpp.lexer import Lexer
+from lpp.parser import Parser
+from lpp.ast.program import Program
+from lpp.evaluator import evaluate
+from lpp.profiling import collect_short_circuit_stats, profile_report
+
+
+class ProfilingTest(TestCase):
+
+  def _parse_program(self, source: str) -> Program:
+    parser: Parser = Parser(Lexer(source))
+    program: Program = parser.parse_program()
+    self.assertEqual(len(parser.errors), 0)
+    return program
+
+  def test_short_circuit_stats(self) -> None:
+    program = self._parse_program('''
+        let check = def(x) { x > 2 and x < 8 or x == 10 };
+        check(1); check(5); check(10);
+    ''')
+    evaluate(program)
+
+    stats = collect_short_circuit_stats(program)
+    self.assertEqual(stats.nodes, 2)
+    self.assertEqual(stats.evaluations, 6)
+    self.assertEqual(stats.short_circuits, 2)
+    self.assertAlmostEqual(stats.rate, 2 / 6)
+
+  def test_profile_report(self) -> None:
+    program = self._parse_program('false and 1 < 2; 2 + 3;')
+    evaluate(program)
+
+    report = profile_report(program)
+    self.assertIn('inline caches: 3 nodes, 0 hits, 1 misses', report)
+    self.assertIn('short-circuit: 1 nodes, 1 evaluations, '
+                  '1 short-circuited (100.0%)', report)
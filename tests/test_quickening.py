@@ -0,0 +1,135 @@
+from unittest import TestCase
+from typing import List, cast
+
+import lpp.evaluator as evaluator
+from lpp.lexer import Lexer
+from lpp.parser import Parser
+from lpp.ast.infix import Infix
+from lpp.ast.program import Program
+from lpp.ast.if_expression import If
+from lpp.ast.node_base import Expression
+from lpp.ast.expressions_statement import ExpressionStatement
+from lpp.ast.quickened import (
+    BooleanIf,
+    IntAddInt,
+    QuickFloat,
+    QuickInfix,
+    QuickInteger,
+    count_quickened,
+    dequicken,
+)
+
+
+class QuickeningTest(TestCase):
+
+  def setUp(self) -> None:
+    evaluator.set_adaptive(True)
+
+  def tearDown(self) -> None:
+    evaluator.set_adaptive(False)
+
+  def _parse_program(self, source: str) -> Program:
+    parser: Parser = Parser(Lexer(source))
+    program: Program = parser.parse_program()
+    self.assertEqual(len(parser.errors), 0)
+    return program
+
+  def _first_expression(self, program: Program) -> Expression:
+    expression = cast(ExpressionStatement, program.statements[0]).expression
+    assert expression is not None
+    return expression
+
+  def _warm_up(self, program: Program) -> str:
+    result = ''
+    for _ in range(evaluator.QUICKEN_THRESHOLD + 1):
+      evaluated = evaluator.evaluate(program)
+      assert evaluated is not None
+      result = evaluated.inspect()
+    return result
+
+  def test_same_results_as_generic_mode(self) -> None:
+    sources: List[str] = [
+        '5 + 5 * 2',
+        '(5 + (5 * 8)) ^ 2',
+        '2 * (35 / 4)',
+        '-3 < 3 and 4 < 10',
+        'not 5 == not not 2',
+        'if (1 < 2) { 10; } else { 20; }',
+        'if (0.0) { 10; } else { 20; }',
+        '5 + true; 9;',
+        'true + false;',
+    ]
+
+    for source in sources:
+      program = self._parse_program(source)
+      quickened = self._warm_up(program)
+
+      evaluator.set_adaptive(False)
+      generic = evaluator.evaluate(self._parse_program(source))
+      evaluator.set_adaptive(True)
+
+      assert generic is not None
+      self.assertEqual(quickened, generic.inspect())
+
+  def test_int_add_int_rewrite(self) -> None:
+    program = self._parse_program('2 + 3')
+    self.assertEqual(self._warm_up(program), '5')
+
+    infix = self._first_expression(program)
+    self.assertIsInstance(infix, IntAddInt)
+    self.assertIsInstance(cast(Infix, infix).left, QuickInteger)
+    self.assertEqual(count_quickened(program),
+                     {'IntAddInt': 1, 'QuickInteger': 2})
+
+  def test_deoptimize_on_guard_failure(self) -> None:
+    program = self._parse_program('2 + 3')
+    self._warm_up(program)
+
+    infix = cast(Infix, self._first_expression(program))
+    infix.left = self._first_expression(self._parse_program('1.5'))
+
+    evaluated = evaluator.evaluate(program)
+    assert evaluated is not None
+    self.assertEqual(evaluated.inspect(), '4.5')
+    self.assertEqual(type(infix), Infix)
+    self.assertEqual(infix.deopts, 1)
+
+    self._warm_up(program)
+    self.assertIsInstance(infix, QuickInfix)
+    self.assertIsInstance(infix.left, QuickFloat)
+
+  def test_deopt_limit(self) -> None:
+    program = self._parse_program('2 + 3')
+    infix = cast(Infix, self._first_expression(program))
+
+    for _ in range(evaluator.MAX_DEOPTS):
+      self._warm_up(program)
+      self.assertNotEqual(type(infix), Infix)
+      infix.__class__ = IntAddInt
+      infix.left = self._first_expression(self._parse_program('true'))
+      evaluator.evaluate(program)
+      infix.left = self._first_expression(self._parse_program('2'))
+
+    self._warm_up(program)
+    self.assertEqual(type(infix), Infix)
+
+  def test_boolean_if(self) -> None:
+    program = self._parse_program('if (1 < 2) { 10; } else { 20; }')
+    self.assertEqual(self._warm_up(program), '10')
+
+    if_expression = cast(If, self._first_expression(program))
+    self.assertIsInstance(if_expression, BooleanIf)
+
+    if_expression.condition = self._first_expression(self._parse_program('0'))
+    evaluated = evaluator.evaluate(program)
+    assert evaluated is not None
+    self.assertEqual(evaluated.inspect(), '20')
+    self.assertEqual(type(if_expression), If)
+
+  def test_dequicken(self) -> None:
+    program = self._parse_program('if (1 < 2) { 2 * 3.5; }')
+    self._warm_up(program)
+    self.assertNotEqual(count_quickened(program), {})
+
+    dequicken(program)
+    self.assertEqual(count_quickened(program), {})
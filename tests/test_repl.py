@@ -0,0 +1,116 @@
+from unittest import TestCase
+from unittest.mock import patch
+from typing import List, Optional
+
+import lpp.repl as repl
+import lpp.tiering as tiering
+import lpp.settings as settings
+from lpp.repl import ReplSession, start_repl
+from lpp.interpreter import ParseError
+
+
+class ReplSessionTest(TestCase):
+
+  def setUp(self) -> None:
+    self._previous = (settings.defaults.tier_threshold, settings.defaults.tier_in_background)
+    tiering.configure(calls=4, in_background=False)
+
+  def tearDown(self) -> None:
+    tiering.configure(*self._previous)
+
+  def _run(self, session: ReplSession, lines: List[str]) -> List[Optional[str]]:
+    results = [session.run(line) for line in lines]
+    return [result.inspect() if result is not None else None for result in results]
+
+  def test_definitions_persist_between_lines(self) -> None:
+    session = ReplSession()
+    self.assertEqual(self._run(session, [
+        'let double = def(x) { x * 2 };',
+        'let xs = [1, 2, 3];',
+        'double(len(xs))',
+        'for (x in range(3)) { x }',
+        'x',
+    ]), [None, None, '6', None, '2'])
+
+    with self.assertRaises(ParseError):
+      session.run('let = 1;')
+    self.assertEqual(self._run(session, ['double(x)']), ['4'])
+    self.assertEqual(session.lines, 6)
+
+  def test_shadowing_a_builtin_updates_earlier_definitions(self) -> None:
+    session = ReplSession()
+    self._run(session, ['let clamp = def(x) { max(x, 0) };',
+                        'let total = def(n) { let i = 0; while (i < n) { i++; }; max(i, 0) };'])
+    self.assertEqual(self._run(session, [
+        'clamp(-1) + clamp(1) + clamp(2) + clamp(3) + clamp(4)',
+        'total(10)',
+    ]), ['10', '10'])
+    clamp = session.env.get('clamp').definition  # type: ignore
+    self.assertIsNotNone(clamp.compiled)
+
+    self.assertEqual(self._run(session, [
+        'let max = def(a, b) { 42 };',
+        'clamp(-1)',
+        'total(10)',
+        'len([1])',
+    ]), [None, '42', '42', '1'])
+
+  def test_redefinitions_invalidate_memoized_results(self) -> None:
+    session = ReplSession()
+    self.assertEqual(self._run(session, [
+        'let step = def(x) { x + 1 };',
+        "let cached = def(x) { 'memo'; step(x) };",
+        'cached(1)',
+        'let step = def(x) { x + 2 };',
+        'cached(1)',
+    ]), [None, None, '2', None, '3'])
+
+  def test_meta_commands(self) -> None:
+    session = ReplSession()
+    session.run('let fib = def(n) { if (n < 2) { n } else { fib(n - 1) + fib(n - 2) } };')
+
+    with patch.object(repl, 'TIME_BUDGET', 0.01):
+      timed = session.command(':time fib(8)')
+    self.assertTrue(timed.startswith('result: 21\n'))
+    for phase in ['lex', 'parse', 'resolve', 'evaluate']:
+      self.assertRegex(timed, rf'\n{phase} +[0-9.]+ [um]?s')
+
+    profiled = session.command(':profile fib(10)')
+    self.assertIn('result: 55', profiled)
+    self.assertRegex(profiled, r'\nCall +177 ')
+    self.assertIn('[1] let fib = def(n)', profiled)
+    self.assertIsNotNone(session.env.get('fib').definition.compiled)  # type: ignore
+
+    measured = session.command(':mem let xs = arange(0, 4096); len(xs)')
+    self.assertIn('result: 4096', measured)
+    self.assertRegex(measured, r'peak [0-9.]+ KiB')
+    self.assertIn('Array +1', measured)
+    self.assertEqual(self._run(session, ['len(xs)']), ['4096'])
+
+    self.assertEqual(session.command(':time'), 'Usage: :time <expression>')
+    self.assertIn('Unknown command: :nope', session.command(':nope 1'))
+    with self.assertRaises(ParseError):
+      session.command(':profile fib(')
+
+  def test_time_applies_the_line_once(self) -> None:
+    session = ReplSession()
+    self._run(session, ['let c = 0;', 'let inc = def() { c++; c };',
+                        "let m = {'n': 0};",
+                        "let bump = def() { set(m, 'n', get(m, 'n') + 1); get(m, 'n') };"])
+
+    with patch.object(repl, 'TIME_BUDGET', 0.01):
+      self.assertTrue(session.command(':time inc()').startswith('result: 1\n'))
+      self.assertTrue(session.command(':time bump()').startswith('result: 1\n'))
+      self.assertTrue(session.command(':time let d = inc() * 10;').startswith('result: None\n'))
+    self.assertEqual(self._run(session, ['c', "get(m, 'n')", 'd']), ['2', '1', '20'])
+
+  def test_start_repl_keeps_state(self) -> None:
+    lines = iter(['let a = 5;', 'a * 2', 'let = 1;', 'exit()'])
+    printed: List[str] = []
+
+    with patch('builtins.input', lambda prompt: next(lines)), \
+        patch('builtins.print', lambda *args: printed.append(' '.join(map(str, args)))):
+      start_repl()
+
+    self.assertEqual(printed[0], '10')
+    self.assertIn('no function found to parse =', printed)
@@ -0,0 +1,153 @@
+import io
+import os
+import json
+import math
+import socket
+from threading import Thread
+from unittest.mock import patch
+from unittest import TestCase, skipUnless
+from tempfile import TemporaryDirectory
+from typing import Any, Dict, List
+
+from lpp.limits import Limits
+from lpp.server import Server
+
+
+class ServerTest(TestCase):
+
+  def setUp(self) -> None:
+    self._server = Server(workers=4, limits=Limits(max_steps=100_000))
+
+  def tearDown(self) -> None:
+    self._server.close()
+
+  def _handle(self, request: Any) -> Dict[str, Any]:
+    return self._server.handle(json.dumps(request))
+
+  def test_evaluation_requests(self) -> None:
+    response = self._handle({'id': 1, 'source': 'let f = def(x) { x * k }; f(21)',
+                             'bindings': {'k': 2}})
+    self.assertEqual((response['id'], response['ok'], response['value']), (1, True, 42))
+    self.assertEqual(response['type'], 'INTEGER')
+    self.assertEqual(set(response['timing']),
+                     {'compile_ms', 'run_ms', 'queued_ms', 'total_ms'})
+
+    again = self._handle({'id': 2, 'program': response['program'],
+                          'bindings': {'k': 3}})
+    self.assertEqual(again['value'], 63)
+    self.assertEqual(self._handle({'source': 'arange(0, 3) * 2'})['value'],
+                     [0.0, 2.0, 4.0])
+
+    stats = self._handle({'op': 'stats'})['stats']
+    self.assertEqual((stats['programs'], stats['hits'], stats['misses']), (2, 1, 2))
+
+    overflowed = self._handle({'source': 'x * 10.0', 'bindings': {'x': 1e308}})
+    self.assertEqual((overflowed['ok'], overflowed['result']), (True, 'inf'))
+    self.assertNotIn('value', overflowed)
+    self.assertEqual(self._handle({'source': 'arange(0, 3) / 0.0'})['value'],
+                     [None, None, None])
+
+  def test_failures(self) -> None:
+    cases = [
+        ({'id': 1, 'source': 'let = 1'}, 'PARSE'),
+        ({'id': 2, 'source': '1 + true'}, 'RUNTIME'),
+        ({'id': 3, 'program': 'missing'}, 'REQUEST'),
+        ({'id': 4}, 'REQUEST'),
+        ({'id': 5, 'source': 'x', 'bindings': {'x': {'nested': 1}}}, 'REQUEST'),
+        ({'id': 6, 'source': '1', 'limits': {'max_steps': 'many'}}, 'REQUEST'),
+        ({'id': 7, 'op': 'reload'}, 'REQUEST'),
+        ({'id': 8, 'source': 'while (true) {}', 'limits': {'max_steps': 1_000}},
+         'STEP_LIMIT'),
+        ({'id': 9, 'source': 'while (true) {}', 'limits': {'max_steps': 10 ** 9}},
+         'STEP_LIMIT'),
+    ]
+    for request, kind in cases:
+      response = self._handle(request)
+      self.assertEqual((response['id'], response['ok'], response['kind']),
+                       (request['id'], False, kind), request)
+
+    self.assertIn('1000 steps', self._handle(cases[7][0])['error'])
+    self.assertIn('100000 steps', self._handle(cases[8][0])['error'])
+    self.assertEqual(self._server.handle('not json')['kind'], 'REQUEST')
+
+    with patch.object(self._server.engine, 'compile', side_effect=RuntimeError('boom')):
+      response = self._handle({'id': 10, 'source': '1'})
+    self.assertEqual((response['id'], response['ok'], response['kind'], response['error']),
+                     (10, False, 'INTERNAL', 'Internal error: RuntimeError: boom'))
+    self.assertIn('total_ms', response['timing'])
+
+  def test_pipelined_stream(self) -> None:
+    requests = io.StringIO(''.join(
+        json.dumps({'id': i, 'source': 'n * n', 'bindings': {'n': i}}) + '\n\n'
+        for i in range(300)))
+    responses = io.StringIO()
+
+    self._server.serve_stream(requests, responses)
+
+    results = [json.loads(line) for line in responses.getvalue().splitlines()]
+    self.assertEqual(sorted((result['id'], result['value']) for result in results),
+                     [(i, i * i) for i in range(300)])
+
+    responses = io.StringIO()
+    self._server.serve_stream(io.StringIO(json.dumps(
+        {'id': 1, 'source': 'x * 10.0', 'bindings': {'x': 1e308}}) + '\n'), responses)
+    self.assertNotIn('Infinity', responses.getvalue())
+    self.assertEqual(json.loads(responses.getvalue())['result'], 'inf')
+
+    responses = io.StringIO()
+    with patch.object(self._server, 'handle', return_value={'id': 2, 'value': math.nan}):
+      self._server.serve_stream(io.StringIO('{}\n'), responses)
+    self.assertEqual(json.loads(responses.getvalue())['id'], 2)
+    self.assertEqual(json.loads(responses.getvalue())['kind'], 'INTERNAL')
+
+  def test_print_output_is_captured_per_request(self) -> None:
+    requests = io.StringIO(''.join(
+        json.dumps({'id': i, 'source': 'print(n, n * 2); print(n); n',
+                    'bindings': {'n': i}}) + '\n'
+        for i in range(50)))
+    responses = io.StringIO()
+
+    with patch('builtins.print') as host_print:
+      self._server.serve_stream(requests, responses)
+    host_print.assert_not_called()
+
+    results = [json.loads(line) for line in responses.getvalue().splitlines()]
+    self.assertEqual(sorted((result['id'], result['output']) for result in results),
+                     [(i, f'{i} {i * 2}\n{i}\n') for i in range(50)])
+    self.assertNotIn('output', self._handle({'source': '1'}))
+
+  def test_request_limits(self) -> None:
+    limited = self._handle({'source': "print('abcdef'); print('ghijkl')",
+                            'limits': {'max_length': 10}})
+    self.assertEqual((limited['kind'], limited['output']), ('LENGTH', 'abcdef\n'))
+    self.assertEqual(self._handle({'source': '2 ^ 100', 'limits': {'max_integer_bits': 64}})
+                     ['kind'], 'INTEGER_SIZE')
+
+    with Server(workers=1, limits=None) as unlimited:
+      response = unlimited.handle(json.dumps({'source': '2 ^ 100000 > 2 ^ 99999',
+                                              'limits': {'max_steps': 1_000}}))
+    self.assertEqual(response['value'], True)
+
+  @skipUnless(hasattr(socket, 'AF_UNIX'), 'needs Unix domain sockets')
+  def test_unix_socket(self) -> None:
+    with TemporaryDirectory() as directory:
+      path = os.path.join(directory, 'lpp.sock')
+      listener = self._server.listen_unix(path)
+      thread = Thread(target=listener.serve_forever, daemon=True)
+      thread.start()
+      try:
+        results: List[Dict[str, Any]] = []
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+          client.connect(path)
+          client.sendall(b''.join(
+              json.dumps({'id': i, 'source': f'{i} + 1'}).encode() + b'\n'
+              for i in range(20)))
+          client.shutdown(socket.SHUT_WR)
+          with client.makefile('r', encoding='utf-8') as replies:
+            results = [json.loads(line) for line in replies]
+      finally:
+        listener.shutdown()
+        listener.server_close()
+
+    self.assertEqual(sorted(result['value'] for result in results),
+                     list(range(1, 21)))
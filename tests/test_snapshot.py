@@ -0,0 +1,128 @@
+import os
+import pickle
+from unittest import TestCase, skipUnless
+from tempfile import TemporaryDirectory
+from multiprocessing import get_all_start_methods
+
+import lpp.tiering as tiering
+import lpp.settings as settings
+from lpp.ffi import expose, unexpose
+from lpp.builtins import lookup_builtin
+from lpp.interpreter import Interpreter
+from lpp.snapshot import (
+    ForkServer,
+    SnapshotError,
+    load_snapshot,
+    save_snapshot,
+    warm_interpreter,
+)
+
+
+PRELUDE = '''
+    let fib = def(n) { if (n < 2) { n } else { fib(n - 1) + fib(n - 2) } };
+    let squares = def(n) { arange(0, n) * arange(0, n) };
+    let size = len;
+    let table = {'answer': fib(10)};
+    fib(12);
+'''
+
+
+class SnapshotTest(TestCase):
+
+  def setUp(self) -> None:
+    self._directory = TemporaryDirectory()
+    self._previous = (settings.defaults.tier_threshold, settings.defaults.tier_in_background)
+    tiering.configure(calls=8, in_background=False)
+
+  def tearDown(self) -> None:
+    tiering.configure(*self._previous)
+    self._directory.cleanup()
+
+  def _path(self, name: str) -> str:
+    return os.path.join(self._directory.name, name)
+
+  def _prelude(self, source: str = PRELUDE) -> str:
+    path = self._path('prelude.lpp')
+    with open(path, 'w', encoding='utf-8') as prelude:
+      prelude.write(source)
+    return path
+
+  def test_round_trip_restores_globals(self) -> None:
+    interpreter = warm_interpreter([self._prelude()])
+    path = self._path('warm.lpps')
+    save_snapshot(interpreter, path)
+
+    restored = load_snapshot(path)
+    for source, expected in [('fib(15)', '610'),
+                             ("get(table, 'answer')", '55'),
+                             ('size(squares(4))', '4'),
+                             ('let later = 3; later * 2', '6'),
+                             ('later', '3')]:
+      evaluated = restored.run(source)
+      assert evaluated is not None
+      self.assertEqual(evaluated.inspect(), expected, source)
+
+    self.assertIs(restored.globals.get('size'), lookup_builtin('len'))
+    self.assertIs(restored.globals.budget, restored.budget)
+    self.assertIs(restored.globals.modules, restored.modules)
+
+  def test_hot_functions_recompile_after_restore(self) -> None:
+    interpreter = warm_interpreter([self._prelude()])
+    definition = interpreter.globals.get('fib').definition  # type: ignore
+    self.assertIsNotNone(definition.compiled)
+
+    restored = pickle.loads(pickle.dumps(interpreter))
+    restored_definition = restored.globals.get('fib').definition
+    self.assertIsNone(restored_definition.compiled)
+    self.assertGreaterEqual(restored_definition.calls, settings.defaults.tier_threshold)
+
+    restored.run('fib(5)')
+    self.assertIsNotNone(restored_definition.compiled)
+
+  def test_invalid_snapshots_are_rejected(self) -> None:
+    expose(lambda x: x * 3, name='triple')
+    try:
+      interpreter = Interpreter()
+      interpreter.run('let f = triple;')
+      path = self._path('host.lpps')
+      save_snapshot(interpreter, path)
+    finally:
+      unexpose('triple')
+
+    with self.assertRaisesRegex(SnapshotError, 'Unknown builtin: triple'):
+      load_snapshot(path)
+
+    garbage = self._path('garbage.lpps')
+    with open(garbage, 'wb') as snapshot:
+      pickle.dump((0, 'elsewhere'), snapshot)
+    with self.assertRaisesRegex(SnapshotError, 'was written by'):
+      load_snapshot(garbage)
+
+    with self.assertRaisesRegex(SnapshotError, 'Prelude .* failed'):
+      warm_interpreter([self._prelude('1 + true;')])
+
+  @skipUnless('fork' in get_all_start_methods(), 'needs fork')
+  def test_fork_server_serves_isolated_requests(self) -> None:
+    interpreter = warm_interpreter([self._prelude()])
+
+    with ForkServer(interpreter, workers=2) as server:
+      results = server.map(['fib(16)', 'let x = 1; x', 'x', 'let = 1',
+                            'size([1, 2, 3])'])
+
+    self.assertEqual([result.output for result in results],
+                     ['987', '1', None, None, '3'])
+    self.assertEqual(results[2].error, 'Error: Identifier not found: x')
+    self.assertIn('no function found to parse =', results[3].error)
+    self.assertIsNone(interpreter.globals.get('x'))
+
+  @skipUnless('fork' in get_all_start_methods(), 'needs fork')
+  def test_fork_server_requests_do_not_share_state(self) -> None:
+    interpreter = warm_interpreter([self._prelude(PRELUDE + 'let counter = 0;')])
+
+    with ForkServer(interpreter, workers=1) as server:
+      results = server.map(['counter++; counter'] * 3 +
+                           ["set(table, 'answer', 1); get(table, 'answer')"] * 2 +
+                           ["get(table, 'answer')"])
+
+    self.assertEqual([result.output for result in results],
+                     ['1', '1', '1', '1', '1', '55'])
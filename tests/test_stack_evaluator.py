@@ -0,0 +1,132 @@
+from unittest import TestCase
+from typing import Optional, cast
+
+from lpp.lexer import Lexer
+from lpp.parser import Parser
+from lpp.limits import Limits
+from lpp.ast.program import Program
+from lpp.evaluator import evaluate
+from lpp.interpreter import Interpreter
+from lpp.object.numbers import Integer
+from lpp.object.error import Error, ErrorKind
+from lpp.object.object_base import Object
+from lpp.stack_evaluator import StackMachine, evaluate_iterative
+
+
+class StackEvaluatorTest(TestCase):
+
+  def _parse_program(self, source: str) -> Program:
+    parser: Parser = Parser(Lexer(source))
+    program: Program = parser.parse_program()
+    self.assertEqual(len(parser.errors), 0)
+    return program
+
+  def _inspect(self, value: Optional[Object]) -> Optional[str]:
+    return value.inspect() if value is not None else None
+
+  def test_matches_recursive_evaluator(self) -> None:
+    tests = [
+        '5',
+        '1; 2; 3',
+        'let a = 1;',
+        'return 1; 2',
+        'if (1 > 2) { 1 }',
+        'if (true) { return 5; 1 } 3',
+        '5 + true; 9',
+        '-true',
+        'not 0',
+        'g(1)',
+        'false and x',
+        'true and 1',
+        'let f = def(x) { x }; f(1, 2)',
+        'let f = def(a, b) { a * b }; f(2, q)',
+        'let f = def() { }; f()',
+        'def(x) { def(y) { x + y } }(2)(3)',
+        '''
+            let fib = def(n) {
+              if (n < 2) {
+                return n;
+              }
+              return fib(n - 1) + fib(n - 2);
+            };
+            fib(12);
+        ''',
+    ]
+
+    for source in tests:
+      expected = evaluate(self._parse_program(source))
+      evaluated = evaluate_iterative(self._parse_program(source))
+      self.assertEqual(self._inspect(evaluated), self._inspect(expected),
+                       source)
+
+  def test_deep_expression(self) -> None:
+    program = self._parse_program(' + '.join(['1'] * 50000))
+
+    evaluated = evaluate_iterative(program)
+
+    self.assertIsInstance(evaluated, Integer)
+    self.assertEqual(cast(Integer, evaluated).value, 50000)
+
+  def test_deep_recursion(self) -> None:
+    program = self._parse_program('''
+        let count = def(n) {
+          if (n == 0) {
+            0
+          } else {
+            1 + count(n - 1)
+          }
+        };
+        count(20000);
+    ''')
+
+    evaluated = evaluate_iterative(program)
+
+    self.assertIsInstance(evaluated, Integer)
+    self.assertEqual(cast(Integer, evaluated).value, 20000)
+
+  def test_budget_limits(self) -> None:
+    count = '''
+        let count = def(n) {
+          if (n == 0) { 0 } else { 1 + count(n - 1) }
+        };
+        count({n});
+    '''
+    tests = [
+        (Limits(max_steps=500), count.replace('{n}', '20000'), ErrorKind.STEP_LIMIT),
+        (Limits(max_call_depth=50), count.replace('{n}', '50'), ErrorKind.CALL_DEPTH),
+        (Limits(max_length=8), 'len(zeros(9))', ErrorKind.LENGTH),
+        (Limits(max_integer_bits=8), '2 ^ 9', ErrorKind.INTEGER_SIZE),
+    ]
+
+    for limits, source, kind in tests:
+      env = Interpreter(limits=limits).globals
+      evaluated = evaluate_iterative(self._parse_program(source), env)
+      self.assertIsInstance(evaluated, Error, source)
+      self.assertEqual(cast(Error, evaluated).kind, kind)
+
+    env = Interpreter(limits=Limits(max_call_depth=50)).globals
+    evaluated = evaluate_iterative(self._parse_program(count.replace('{n}', '49')), env)
+    self.assertEqual(cast(Integer, evaluated).value, 49)
+    self.assertEqual(env.budget.depth, 0)
+
+  def test_resumable_run(self) -> None:
+    machine = StackMachine(self._parse_program('''
+        let sum = def(n) {
+          if (n == 0) {
+            0
+          } else {
+            n + sum(n - 1)
+          }
+        };
+        sum(100);
+    '''))
+
+    slices = 0
+    while not machine.run(max_steps=50):
+      slices += 1
+      self.assertFalse(machine.done)
+
+    self.assertGreater(slices, 1)
+    self.assertTrue(machine.done)
+    self.assertEqual(machine.depth, 0)
+    self.assertEqual(cast(Integer, machine.result).value, 5050)
@@ -0,0 +1,35 @@
+import sys
+import json
+import subprocess
+from unittest import TestCase
+from typing import Set
+
+import lpp
+
+
+HEAVY_MODULES = {'lpp.evaluator', 'lpp.engine', 'lpp.parser', 'lpp.repl',
+                 'concurrent.futures', 'hashlib', 'pickle', 'inspect'}
+
+
+class StartupTest(TestCase):
+
+  def _imported(self, code: str) -> Set[str]:
+    probe = f'{code}; import sys, json; print(json.dumps(sorted(sys.modules)))'
+    completed = subprocess.run([sys.executable, '-c', probe],
+                               capture_output=True, text=True, check=True)
+    return set(json.loads(completed.stdout.splitlines()[-1]))
+
+  def test_entry_points_import_lazily(self) -> None:
+    for code in ['import main', 'import lpp', 'import lpp.lexer']:
+      self.assertEqual(self._imported(code) & HEAVY_MODULES, set(), code)
+
+    self.assertNotIn('concurrent.futures',
+                     self._imported('import lpp.interpreter'))
+
+  def test_lazy_exports(self) -> None:
+    from lpp.engine import Engine
+
+    self.assertIs(lpp.Engine, Engine)
+    self.assertIn('EngineStats', dir(lpp))
+    with self.assertRaises(AttributeError):
+      lpp.Missing  # type: ignore
@@ -0,0 +1,112 @@
+import gc
+import pickle
+from unittest import TestCase
+from typing import List, Optional, Tuple
+
+from lpp.engine import Engine
+from lpp.evaluator import evaluate
+from lpp.interpreter import Interpreter
+from lpp.object.object_base import Object
+from lpp.stack_evaluator import evaluate_iterative
+
+import lpp.object.string as object_string
+
+
+class StringsTest(TestCase):
+
+  def _evaluate(self, source: str) -> Optional[Object]:
+    return evaluate(Interpreter.parse(source))
+
+  def _check(self, tests: List[Tuple[str, str]]) -> None:
+    for source, expected in tests:
+      evaluated = self._evaluate(source)
+      assert evaluated is not None
+      self.assertEqual(evaluated.inspect(), expected, source)
+
+  def test_operators(self) -> None:
+    self._check([
+        ("'hola' + ' ' + 'mundo'", 'hola mundo'),
+        ("'' + 'a' + ''", 'a'),
+        ("'abc' == 'abc'", 'true'),
+        ("'abc' != 'abd'", 'true'),
+        ("'abc' == 'ab' + 'c'", 'true'),
+        ("'a' < 'b'", 'true'),
+        ("'b' >= 'ba'", 'false'),
+        ("len('hola' + ' mundo')", '10'),
+        ("if ('') { 1 } else { 2 }", '2'),
+        ("'a' + 1", 'Error: Type mismatch: STRING + INTEGER'),
+        ("'a' - 'b'", 'Error: Unknown operator: STRING - STRING'),
+        ("len(1)", 'Error: Argument to len must be ARRAY, STRING or RANGE, got INTEGER'),
+    ])
+
+  def test_concatenation_is_persistent(self) -> None:
+    self._check([
+        ("let a = 'x' + 'y'; let b = a + 'z'; let c = a + 'w'; b + '|' + c + '|' + a",
+         'xyz|xyw|xy'),
+        ('''
+          let repeat = def(s, n) {
+            if (n == 0) { s } else { repeat(s + 'ab', n - 1) }
+          };
+          let base = repeat('', 3);
+          repeat(base, 1) + '|' + repeat(base, 2) + '|' + base
+        ''', 'abababab|ababababab|ababab'),
+    ])
+
+  def test_literals_are_interned(self) -> None:
+    program = Interpreter.parse("let a = 'hola'; let b = 'hola'; a;")
+    first = evaluate(program)
+    self.assertIs(first, evaluate(Interpreter.parse("'hola'")))
+    self.assertIs(evaluate_iterative(Interpreter.parse("'hola'")), first)
+
+  def test_unused_literals_are_released(self) -> None:
+    program = Interpreter.parse("'released-literal'")
+    first = evaluate(program)
+    self.assertIs(evaluate(program), first)
+    self.assertIs(evaluate_iterative(program), first)
+    self.assertIn('released-literal', object_string._interned)
+
+    del program, first
+    gc.collect()
+    self.assertNotIn('released-literal', object_string._interned)
+
+    engine = Engine(capacity=4)
+    for index in range(200):
+      self.assertEqual(engine.run(f"'engine-literal-{index}' + ''").inspect(),
+                       f'engine-literal-{index}')
+    gc.collect()
+    self.assertLessEqual(sum(key.startswith('engine-literal-')
+                             for key in list(object_string._interned)), 4)
+
+  def test_ropes_flatten_and_pickle(self) -> None:
+    string = object_string.intern('a')
+    for piece in 'bcd':
+      string = object_string.concat(string, object_string.String(piece))
+
+    self.assertEqual(len(string), 4)
+    self.assertEqual(string.value, 'abcd')
+    restored = pickle.loads(pickle.dumps(string))
+    self.assertEqual(restored.value, 'abcd')
+    self.assertEqual(len(restored), 4)
+
+  def test_ropes_grow_at_both_ends(self) -> None:
+    self._check([
+        ("let a = 'b' + 'c'; let b = 'a' + a; let c = '<' + b + '>'; "
+         "c + '|' + b + '|' + ('_' + a) + '|' + a", '<abc>|abc|_bc|bc'),
+        ('''
+          let wrap = def(s, n) {
+            if (n == 0) { s } else { wrap('(' + s + ')', n - 1) }
+          };
+          let base = wrap('x', 2);
+          wrap(base, 1) + '|' + ('[' + base) + '|' + base
+        ''', '(((x)))|[((x))|((x))'),
+    ])
+
+  def test_prepending_reuses_the_rope(self) -> None:
+    string = object_string.intern('z')
+    for piece in 'yxw':
+      string = object_string.concat(object_string.String(piece * 8), string)
+
+    self.assertIsNotNone(string._rope)
+    self.assertEqual((len(string._rope.front), len(string._rope.back)), (2, 2))
+    self.assertEqual(string.value, 'wwwwwwwwxxxxxxxxyyyyyyyyz')
+    self.assertEqual(len(string), 25)
@@ -0,0 +1,103 @@
+from unittest import TestCase
+from typing import List, cast
+
+import lpp.tiering as tiering
+import lpp.settings as settings
+from lpp.lexer import Lexer
+from lpp.parser import Parser
+from lpp.ast.walk import walk
+from lpp.ast.program import Program
+from lpp.ast.function import Function
+from lpp.evaluator import evaluate
+from lpp.tiering import TierUpEvent
+
+
+FIB = '''
+    let fib = def(n) {
+      if (n < 2) {
+        return n;
+      }
+      return fib(n - 1) + fib(n - 2);
+    };
+    fib(15);
+'''
+
+
+class TieringTest(TestCase):
+
+  def setUp(self) -> None:
+    self._threshold = settings.defaults.tier_threshold
+    self._background = settings.defaults.tier_in_background
+    self._events: List[TierUpEvent] = []
+    tiering.add_tier_up_hook(self._events.append)
+
+  def tearDown(self) -> None:
+    tiering.remove_tier_up_hook(self._events.append)
+    tiering.configure(calls=self._threshold, in_background=self._background)
+
+  def _parse_program(self, source: str) -> Program:
+    parser: Parser = Parser(Lexer(source))
+    program: Program = parser.parse_program()
+    self.assertEqual(len(parser.errors), 0)
+    return program
+
+  def _functions(self, program: Program) -> List[Function]:
+    return [cast(Function, node) for node in walk(program)
+            if isinstance(node, Function)]
+
+  def test_cold_functions_stay_interpreted(self) -> None:
+    tiering.configure(calls=100, in_background=False)
+    program = self._parse_program('let f = def(x) { x * 2 }; f(1); f(2);')
+
+    evaluated = evaluate(program)
+    assert evaluated is not None
+    self.assertEqual(evaluated.inspect(), '4')
+    self.assertIsNone(self._functions(program)[0].compiled)
+    self.assertEqual(self._events, [])
+
+  def test_tier_up_after_threshold(self) -> None:
+    tiering.configure(calls=3, in_background=False)
+    program = self._parse_program(
+        'let f = def(x) { x * 2 }; f(1); f(2); f(3); f(4);')
+
+    evaluated = evaluate(program)
+    assert evaluated is not None
+    self.assertEqual(evaluated.inspect(), '8')
+
+    function = self._functions(program)[0]
+    self.assertIsNotNone(function.compiled)
+    self.assertEqual(function.calls, 3)
+    self.assertEqual(len(self._events), 1)
+    self.assertIs(self._events[0].definition, function)
+    self.assertEqual(self._events[0].calls, 3)
+
+  def test_compiled_results_match_interpreter(self) -> None:
+    sources: List[str] = [
+        FIB,
+        'let f = def(x) { if (x > 1) { 1 } else { x + true } }; f(0); f(0); f(5);',
+        'let f = def(x) { let y = -x; return y * 1.5; }; f(2); f(2); f(3);',
+        'let f = def(x) { not x == 1 and x < 3 }; f(1); f(2); f(2);',
+        'let f = def(x) { def(y) { x + y } }; f(1)(2); f(1)(2); f(3)(4);',
+    ]
+
+    for source in sources:
+      tiering.configure(calls=1000, in_background=False)
+      interpreted = evaluate(self._parse_program(source))
+
+      tiering.configure(calls=2, in_background=False)
+      compiled = evaluate(self._parse_program(source))
+
+      assert interpreted is not None and compiled is not None
+      self.assertEqual(compiled.inspect(), interpreted.inspect())
+
+  def test_background_tier_up(self) -> None:
+    tiering.configure(calls=10, in_background=True)
+    program = self._parse_program(FIB)
+
+    evaluated = evaluate(program)
+    tiering.wait_for_tier_ups()
+
+    assert evaluated is not None
+    self.assertEqual(evaluated.inspect(), '610')
+    self.assertIsNotNone(self._functions(program)[0].compiled)
+    self.assertEqual(len(self._events), 1)